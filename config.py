@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from typing import Optional
 
@@ -16,6 +17,8 @@ class Config:
     # Supabase Configuration
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
     SUPABASE_KEY: str = os.getenv("SUPABASE_KEY", "")
+    # Optional direct Postgres DSN (Supavisor pooler) for dashboard aggregates
+    SUPABASE_POSTGRES_URL: Optional[str] = os.getenv("SUPABASE_POSTGRES_URL")
     
     # Application Configuration
     CONFIDENCE_THRESHOLD: float = float(os.getenv("CONFIDENCE_THRESHOLD", "0.68"))
@@ -30,16 +33,23 @@ class Config:
     @classmethod
     def validate(cls) -> bool:
         """Validate that required configuration is present."""
-        required = [
-            cls.OPENAI_API_KEY,
-            cls.SUPABASE_URL,
-            cls.SUPABASE_KEY,
-        ]
-        return all(required)
+        return not cls._missing_config()
     
     @classmethod
     def get_missing_config(cls) -> list[str]:
         """Get list of missing required configuration keys."""
+        return list(cls._missing_config())
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _missing_config(cls) -> tuple[str, ...]:
+        """
+        Compute missing required keys once.
+        
+        Values are read from the environment at import time and never change
+        afterwards, so main.py re-validating on every Streamlit rerun can reuse
+        the first result.
+        """
         missing = []
         if not cls.OPENAI_API_KEY:
             missing.append("OPENAI_API_KEY")
@@ -47,7 +57,7 @@ class Config:
             missing.append("SUPABASE_URL")
         if not cls.SUPABASE_KEY:
             missing.append("SUPABASE_KEY")
-        return missing
+        return tuple(missing)
 
 # Note: Validation is checked in main.py to allow graceful error handling
 # The app will display a helpful error message if configuration is missing
@@ -0,0 +1,16 @@
+-- Add distinct intents function
+-- Migration: 004_add_distinct_intents_function
+
+-- Returns the distinct, non-null intent names so the dashboard does not
+-- need to download every interaction row to build its intent filter
+CREATE OR REPLACE FUNCTION distinct_intents()
+RETURNS TABLE(intent_name TEXT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT DISTINCT i.intent_name::TEXT
+    FROM interactions i
+    WHERE i.intent_name IS NOT NULL
+    ORDER BY 1;
+$$;
+
+COMMENT ON FUNCTION distinct_intents() IS 'Distinct intent names for dashboard filters';
@@ -0,0 +1,78 @@
+-- Add dashboard aggregate functions
+-- Migration: 005_add_dashboard_aggregate_functions
+
+-- Intent risk-value matrix: containment/escalation rates and volume per intent
+CREATE OR REPLACE FUNCTION intent_risk_value_matrix(
+    p_mode TEXT DEFAULT NULL,
+    p_start_date TIMESTAMPTZ DEFAULT NULL,
+    p_end_date TIMESTAMPTZ DEFAULT NULL,
+    p_intent TEXT DEFAULT NULL
+)
+RETURNS TABLE(intent_name TEXT, containment_rate FLOAT, escalation_rate FLOAT, volume BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT
+        i.intent_name::TEXT,
+        (count(*) FILTER (WHERE i.outcome = 'resolved'))::FLOAT / count(*) * 100,
+        (count(*) FILTER (WHERE i.outcome = 'escalated'))::FLOAT / count(*) * 100,
+        count(*)
+    FROM interactions i
+    WHERE i.intent_name IS NOT NULL
+      AND (p_mode IS NULL OR i.assistant_mode = p_mode)
+      AND (p_start_date IS NULL OR i.timestamp >= p_start_date)
+      AND (p_end_date IS NULL OR i.timestamp <= p_end_date)
+      AND (p_intent IS NULL OR i.intent_name = p_intent)
+    GROUP BY i.intent_name
+    ORDER BY 4 DESC;
+$$;
+
+-- Citation coverage: coverage rate, failed retrieval rate and top 10 cited sources
+CREATE OR REPLACE FUNCTION citation_coverage(
+    p_mode TEXT DEFAULT NULL,
+    p_start_date TIMESTAMPTZ DEFAULT NULL,
+    p_end_date TIMESTAMPTZ DEFAULT NULL,
+    p_intent TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql STABLE
+AS $$
+    WITH responses AS (
+        SELECT
+            CASE WHEN jsonb_typeof(i.citations) = 'array' THEN i.citations ELSE '[]'::JSONB END AS citations,
+            i.retrieved_chunks_count
+        FROM interactions i
+        WHERE COALESCE(i.response_text, '') <> ''
+          AND (p_mode IS NULL OR i.assistant_mode = p_mode)
+          AND (p_start_date IS NULL OR i.timestamp >= p_start_date)
+          AND (p_end_date IS NULL OR i.timestamp <= p_end_date)
+          AND (p_intent IS NULL OR i.intent_name = p_intent)
+    ),
+    rates AS (
+        SELECT
+            count(*) AS total_responses,
+            count(*) FILTER (WHERE jsonb_array_length(citations) > 0) AS with_citations,
+            count(*) FILTER (WHERE retrieved_chunks_count = 0) AS failed_retrievals
+        FROM responses
+    ),
+    top_sources AS (
+        SELECT c->>'source' AS source, count(*) AS count
+        FROM responses r, jsonb_array_elements(r.citations) c
+        WHERE COALESCE(c->>'source', '') <> ''
+        GROUP BY 1
+        ORDER BY 2 DESC
+        LIMIT 10
+    )
+    SELECT jsonb_build_object(
+        'citation_coverage_rate', COALESCE(with_citations * 100.0 / NULLIF(total_responses, 0), 0),
+        'failed_retrieval_rate', COALESCE(failed_retrievals * 100.0 / NULLIF(total_responses, 0), 0),
+        'top_sources', COALESCE(
+            (SELECT jsonb_agg(jsonb_build_object('source', source, 'count', count) ORDER BY count DESC) FROM top_sources),
+            '[]'::JSONB
+        ),
+        'total_responses', total_responses
+    )
+    FROM rates;
+$$;
+
+COMMENT ON FUNCTION intent_risk_value_matrix(TEXT, TIMESTAMPTZ, TIMESTAMPTZ, TEXT) IS 'Per-intent containment/escalation rates for the dashboard';
+COMMENT ON FUNCTION citation_coverage(TEXT, TIMESTAMPTZ, TIMESTAMPTZ, TEXT) IS 'Citation coverage and source health for the dashboard';
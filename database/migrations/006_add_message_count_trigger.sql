@@ -0,0 +1,24 @@
+-- Maintain conversation message counts in the database
+-- Migration: 006_add_message_count_trigger
+
+-- Bump message_count and updated_at on the parent conversation whenever a
+-- message is inserted, so saving a message is a single round trip
+CREATE OR REPLACE FUNCTION bump_conversation_message_count()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE conversations
+    SET message_count = message_count + 1,
+        updated_at = NOW()
+    WHERE id = NEW.conversation_id;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_conversation_messages_bump_count ON conversation_messages;
+CREATE TRIGGER trg_conversation_messages_bump_count
+AFTER INSERT ON conversation_messages
+FOR EACH ROW EXECUTE FUNCTION bump_conversation_message_count();
+
+COMMENT ON FUNCTION bump_conversation_message_count() IS 'Keeps conversations.message_count and updated_at in sync with inserted messages';
@@ -0,0 +1,13 @@
+-- Indexes for dashboard aggregation and pagination
+-- Migration: 009_add_dashboard_indexes
+
+-- Partial indexes for the two outcomes the aggregates count
+CREATE INDEX IF NOT EXISTS idx_interactions_resolved ON interactions(intent_name) WHERE outcome = 'resolved';
+CREATE INDEX IF NOT EXISTS idx_interactions_escalated ON interactions(intent_name) WHERE outcome = 'escalated';
+
+-- Covering index so mode/intent-filtered selects of intent_name, outcome stay index-only
+CREATE INDEX IF NOT EXISTS idx_interactions_mode_intent_outcome
+    ON interactions(assistant_mode, intent_name, outcome) INCLUDE (timestamp);
+
+-- Matches the (timestamp, id) keyset pagination order used by get_interactions
+CREATE INDEX IF NOT EXISTS idx_interactions_timestamp_id ON interactions(timestamp, id);
@@ -0,0 +1,19 @@
+-- Optional: refresh the dashboard materialized views on a schedule
+-- Migration: 010_schedule_dashboard_view_refresh
+--
+-- Requires the pg_cron extension (Supabase: Database > Extensions > pg_cron).
+-- Where pg_cron is not available this migration is a no-op and the views are
+-- only refreshed by the dashboard "Refresh Data" button.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_cron') THEN
+        RAISE NOTICE 'pg_cron is not available; skipping dashboard view refresh schedule';
+        RETURN;
+    END IF;
+
+    CREATE EXTENSION IF NOT EXISTS pg_cron;
+    -- Every 5 minutes (matches the dashboard read cache TTL)
+    PERFORM cron.schedule('refresh-dashboard-views', '*/5 * * * *', 'SELECT refresh_dashboard_views()');
+END;
+$$;
@@ -0,0 +1,12 @@
+-- Require an interaction timestamp
+-- Migration: 011_make_interaction_timestamp_not_null
+
+-- get_interactions pages on (timestamp, id); a NULL timestamp sorts after
+-- every cursor and would be skipped. Backfill from created_at, then enforce.
+UPDATE interactions
+SET timestamp = COALESCE(created_at, NOW())
+WHERE timestamp IS NULL;
+
+ALTER TABLE interactions
+ALTER COLUMN timestamp SET DEFAULT NOW(),
+ALTER COLUMN timestamp SET NOT NULL;
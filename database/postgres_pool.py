@@ -0,0 +1,121 @@
+"""
+Optional direct Postgres connection pool for read-heavy dashboard queries.
+
+PostgREST adds an HTTPS round trip and JSON encoding to every query. When
+SUPABASE_POSTGRES_URL points at the Supavisor pooler, dashboard aggregates
+are issued as parameterised SQL over a small asyncpg pool instead. Writes
+keep going through PostgREST so row level security still applies.
+
+The Supabase client is synchronous and is called from Streamlit script
+threads, so the pool lives on its own event loop in a background thread and
+queries are submitted to it with run_coroutine_threadsafe.
+
+If connecting fails the pool stays closed for CONNECT_FAILURE_BACKOFF seconds
+(is_ready() returns False), so callers go straight to PostgREST instead of
+retrying an unreachable DSN on every query.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, List, Optional
+
+from utils.logger import get_logger
+
+try:
+    import asyncpg
+except ImportError:  # Optional dependency
+    asyncpg = None
+
+logger = get_logger(__name__)
+
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 10
+POOL_MAX_INACTIVE_CONNECTION_LIFETIME = 1800  # seconds, recycle idle connections
+CONNECT_FAILURE_BACKOFF = 60  # seconds to skip the pool after a failed connect
+
+
+class PostgresPool:
+    """Lazily created asyncpg pool driven from synchronous code."""
+
+    def __init__(self, dsn: str, timeout: float = 30):
+        """
+        Initialize pool wrapper. No connection is opened until the first query.
+
+        Args:
+            dsn: Postgres connection string (Supavisor pooler endpoint)
+            timeout: Seconds to wait for a query result
+        """
+        self.dsn = dsn
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pool = None
+        self._lock = threading.Lock()
+        self._connect_failed_at: Optional[float] = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether asyncpg is installed."""
+        return asyncpg is not None
+
+    def is_ready(self) -> bool:
+        """Whether asyncpg is installed and the last connect attempt did not fail within the backoff period."""
+        if asyncpg is None:
+            return False
+        failed_at = self._connect_failed_at
+        return failed_at is None or time.monotonic() - failed_at >= CONNECT_FAILURE_BACKOFF
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop that owns the pool."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="postgres-pool", daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def _get_pool(self):
+        # Only ever awaited on the background loop, so no lock is needed here
+        if self._pool is None:
+            try:
+                self._pool = await asyncpg.create_pool(
+                    dsn=self.dsn,
+                    min_size=POOL_MIN_SIZE,
+                    max_size=POOL_MAX_SIZE,
+                    max_inactive_connection_lifetime=POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+                    # Supavisor transaction mode does not support prepared statements
+                    statement_cache_size=0,
+                    timeout=self.timeout,
+                )
+            except Exception:
+                self._connect_failed_at = time.monotonic()
+                logger.warning("Postgres pool connect failed, skipping direct queries for %ss", CONNECT_FAILURE_BACKOFF)
+                raise
+            self._connect_failed_at = None
+            logger.info("Postgres pool created")
+        return self._pool
+
+    async def _fetch(self, sql: str, args: tuple) -> List[Any]:
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            return await conn.fetch(sql, *args)
+
+    def fetch(self, sql: str, *args: Any) -> List[Any]:
+        """
+        Run a query and return its rows (asyncpg Records).
+
+        Raises:
+            RuntimeError: If asyncpg is not installed or a recent connect attempt failed
+            Exception: Any connection or query error
+        """
+        if asyncpg is None:
+            raise RuntimeError("asyncpg is not installed")
+        if not self.is_ready():
+            raise RuntimeError("Postgres pool is backing off after a failed connect")
+        future = asyncio.run_coroutine_threadsafe(self._fetch(sql, args), self._ensure_loop())
+        return future.result(timeout=self.timeout)
+
+    def fetchval(self, sql: str, *args: Any) -> Any:
+        """Run a query and return the first column of the first row (None if no rows)."""
+        rows = self.fetch(sql, *args)
+        return rows[0][0] if rows else None
@@ -4,6 +4,8 @@ Can be executed manually or via Supabase SQL editor.
 
 This script reads the schema.sql file and displays it for manual execution
 in the Supabase SQL Editor. For MVP, manual execution is recommended.
+When stdout is not a terminal only the raw SQL is written, so it can be
+piped straight into psql.
 """
 import sys
 from pathlib import Path
@@ -17,24 +19,31 @@ def main():
         print("❌ Error: database/schema.sql not found")
         return 1
     
-    with open(schema_file, "r") as f:
-        schema_sql = f.read()
+    schema_sql = schema_file.read_text(encoding="utf-8")
     
-    print("=" * 60)
-    print("Database Migration Script")
-    print("=" * 60)
-    print("\nCopy and paste the following SQL into Supabase SQL Editor:\n")
-    print(schema_sql)
-    print("\n" + "=" * 60)
-    print("After running the SQL, verify tables were created.")
-    print("=" * 60)
-    print("\nTo verify, run this query in Supabase SQL Editor:")
-    print("""
+    # When piped (e.g. into psql or a file) emit only the SQL
+    if not sys.stdout.isatty():
+        sys.stdout.write(schema_sql)
+        return 0
+    
+    banner = "=" * 60
+    sys.stdout.write(
+        f"{banner}\n"
+        "Database Migration Script\n"
+        f"{banner}\n"
+        "\nCopy and paste the following SQL into Supabase SQL Editor:\n\n"
+        f"{schema_sql}\n"
+        f"\n{banner}\n"
+        "After running the SQL, verify tables were created.\n"
+        f"{banner}\n"
+        "\nTo verify, run this query in Supabase SQL Editor:\n"
+        """
 SELECT indexname, tablename 
 FROM pg_indexes 
 WHERE schemaname = 'public'
 ORDER BY tablename, indexname;
-    """)
+    \n"""
+    )
     
     return 0
 
@@ -1,7 +1,7 @@
 -- Interactions table (primary logging)
 CREATE TABLE IF NOT EXISTS interactions (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-    timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     assistant_mode VARCHAR(10) NOT NULL CHECK (assistant_mode IN ('customer', 'banker')),
     session_id VARCHAR(255),  -- OpenAI conversation ID
     
@@ -96,6 +96,13 @@ CREATE INDEX IF NOT EXISTS idx_escalations_trigger ON escalations(trigger_type);
 CREATE INDEX IF NOT EXISTS idx_knowledge_documents_file_id ON knowledge_documents(openai_file_id);
 CREATE INDEX IF NOT EXISTS idx_knowledge_documents_type ON knowledge_documents(content_type);
 
+-- Dashboard aggregation and pagination indexes
+CREATE INDEX IF NOT EXISTS idx_interactions_resolved ON interactions(intent_name) WHERE outcome = 'resolved';
+CREATE INDEX IF NOT EXISTS idx_interactions_escalated ON interactions(intent_name) WHERE outcome = 'escalated';
+CREATE INDEX IF NOT EXISTS idx_interactions_mode_intent_outcome
+    ON interactions(assistant_mode, intent_name, outcome) INCLUDE (timestamp);
+CREATE INDEX IF NOT EXISTS idx_interactions_timestamp_id ON interactions(timestamp, id);
+
 -- Conversation indexes
 CREATE INDEX IF NOT EXISTS idx_conversations_conversation_id ON conversations(conversation_id);
 CREATE INDEX IF NOT EXISTS idx_conversations_assistant_mode ON conversations(assistant_mode);
@@ -108,3 +115,199 @@ CREATE INDEX IF NOT EXISTS idx_conversation_messages_conversation ON conversatio
 CREATE INDEX IF NOT EXISTS idx_conversation_messages_timestamp ON conversation_messages(timestamp);
 CREATE INDEX IF NOT EXISTS idx_conversation_messages_role ON conversation_messages(role);
 CREATE INDEX IF NOT EXISTS idx_conversation_messages_interaction ON conversation_messages(interaction_id);
+
+-- Dashboard functions
+CREATE OR REPLACE FUNCTION distinct_intents()
+RETURNS TABLE(intent_name TEXT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT DISTINCT i.intent_name::TEXT
+    FROM interactions i
+    WHERE i.intent_name IS NOT NULL
+    ORDER BY 1;
+$$;
+
+-- Parameterized "view" over interactions applying the dashboard filters.
+-- NULL parameters disable the corresponding filter.
+CREATE OR REPLACE FUNCTION dashboard_interactions(
+    p_mode TEXT DEFAULT NULL,
+    p_start_date TIMESTAMPTZ DEFAULT NULL,
+    p_end_date TIMESTAMPTZ DEFAULT NULL,
+    p_intent TEXT DEFAULT NULL
+)
+RETURNS SETOF interactions
+LANGUAGE sql STABLE
+AS $$
+    SELECT *
+    FROM interactions i
+    WHERE (p_mode IS NULL OR i.assistant_mode = p_mode)
+      AND (p_start_date IS NULL OR i.timestamp >= p_start_date)
+      AND (p_end_date IS NULL OR i.timestamp <= p_end_date)
+      AND (p_intent IS NULL OR i.intent_name = p_intent);
+$$;
+
+-- Hourly per-mode, per-intent rollups. Dashboard date filters are applied to
+-- the hour bucket. Views are refreshed by the dashboard "Refresh Data" button
+-- and, where pg_cron is available, every 5 minutes by the schedule in
+-- 010_schedule_dashboard_view_refresh.sql.
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_intent_outcomes AS
+SELECT
+    date_trunc('hour', i.timestamp) AS bucket,
+    i.assistant_mode::TEXT AS assistant_mode,
+    i.intent_name::TEXT AS intent_name,
+    count(*) AS volume,
+    count(*) FILTER (WHERE i.outcome = 'resolved') AS resolved,
+    count(*) FILTER (WHERE i.outcome = 'escalated') AS escalated
+FROM interactions i
+WHERE i.intent_name IS NOT NULL
+GROUP BY 1, 2, 3;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_citation_coverage AS
+SELECT
+    date_trunc('hour', i.timestamp) AS bucket,
+    i.assistant_mode::TEXT AS assistant_mode,
+    COALESCE(i.intent_name, '')::TEXT AS intent_name,
+    count(*) AS total_responses,
+    count(*) FILTER (WHERE jsonb_typeof(i.citations) = 'array' AND jsonb_array_length(i.citations) > 0) AS with_citations,
+    count(*) FILTER (WHERE i.retrieved_chunks_count = 0) AS failed_retrievals
+FROM interactions i
+WHERE COALESCE(i.response_text, '') <> ''
+GROUP BY 1, 2, 3;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_top_sources AS
+SELECT
+    date_trunc('hour', i.timestamp) AS bucket,
+    i.assistant_mode::TEXT AS assistant_mode,
+    COALESCE(i.intent_name, '')::TEXT AS intent_name,
+    c->>'source' AS source,
+    count(*) AS count
+FROM interactions i, jsonb_array_elements(i.citations) c
+WHERE COALESCE(i.response_text, '') <> ''
+  AND jsonb_typeof(i.citations) = 'array'
+  AND COALESCE(c->>'source', '') <> ''
+GROUP BY 1, 2, 3, 4;
+
+-- Unique indexes are required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_intent_outcomes_key ON mv_intent_outcomes(bucket, assistant_mode, intent_name);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_citation_coverage_key ON mv_citation_coverage(bucket, assistant_mode, intent_name);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_top_sources_key ON mv_top_sources(bucket, assistant_mode, intent_name, source);
+
+-- Refresh all dashboard views without blocking readers. REFRESH requires
+-- ownership of the views, so the function runs as its owner (the migration
+-- role) and may only be executed by the role the app connects as (anon).
+CREATE OR REPLACE FUNCTION refresh_dashboard_views()
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_intent_outcomes;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_citation_coverage;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_top_sources;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION refresh_dashboard_views() FROM PUBLIC, anon, authenticated, service_role;
+GRANT EXECUTE ON FUNCTION refresh_dashboard_views() TO anon;
+
+-- Optional refresh schedule, skipped where pg_cron is not available
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_cron') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_cron;
+        -- Every 5 minutes (matches the dashboard read cache TTL)
+        PERFORM cron.schedule('refresh-dashboard-views', '*/5 * * * *', 'SELECT refresh_dashboard_views()');
+    END IF;
+END;
+$$;
+
+-- Dashboard aggregates served from the materialized views
+CREATE OR REPLACE FUNCTION intent_risk_value_matrix(
+    p_mode TEXT DEFAULT NULL,
+    p_start_date TIMESTAMPTZ DEFAULT NULL,
+    p_end_date TIMESTAMPTZ DEFAULT NULL,
+    p_intent TEXT DEFAULT NULL
+)
+RETURNS TABLE(intent_name TEXT, containment_rate FLOAT, escalation_rate FLOAT, volume BIGINT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT
+        m.intent_name,
+        sum(m.resolved)::FLOAT / sum(m.volume) * 100,
+        sum(m.escalated)::FLOAT / sum(m.volume) * 100,
+        sum(m.volume)::BIGINT
+    FROM mv_intent_outcomes m
+    WHERE (p_mode IS NULL OR m.assistant_mode = p_mode)
+      AND (p_start_date IS NULL OR m.bucket >= date_trunc('hour', p_start_date))
+      AND (p_end_date IS NULL OR m.bucket <= p_end_date)
+      AND (p_intent IS NULL OR m.intent_name = p_intent)
+    GROUP BY m.intent_name
+    ORDER BY 4 DESC;
+$$;
+
+CREATE OR REPLACE FUNCTION citation_coverage(
+    p_mode TEXT DEFAULT NULL,
+    p_start_date TIMESTAMPTZ DEFAULT NULL,
+    p_end_date TIMESTAMPTZ DEFAULT NULL,
+    p_intent TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql STABLE
+AS $$
+    WITH rates AS (
+        SELECT
+            COALESCE(sum(m.total_responses), 0) AS total_responses,
+            COALESCE(sum(m.with_citations), 0) AS with_citations,
+            COALESCE(sum(m.failed_retrievals), 0) AS failed_retrievals
+        FROM mv_citation_coverage m
+        WHERE (p_mode IS NULL OR m.assistant_mode = p_mode)
+          AND (p_start_date IS NULL OR m.bucket >= date_trunc('hour', p_start_date))
+          AND (p_end_date IS NULL OR m.bucket <= p_end_date)
+          AND (p_intent IS NULL OR m.intent_name = p_intent)
+    ),
+    top_sources AS (
+        SELECT s.source, sum(s.count) AS count
+        FROM mv_top_sources s
+        WHERE (p_mode IS NULL OR s.assistant_mode = p_mode)
+          AND (p_start_date IS NULL OR s.bucket >= date_trunc('hour', p_start_date))
+          AND (p_end_date IS NULL OR s.bucket <= p_end_date)
+          AND (p_intent IS NULL OR s.intent_name = p_intent)
+        GROUP BY 1
+        ORDER BY 2 DESC
+        LIMIT 10
+    )
+    SELECT jsonb_build_object(
+        'citation_coverage_rate', COALESCE(with_citations * 100.0 / NULLIF(total_responses, 0), 0),
+        'failed_retrieval_rate', COALESCE(failed_retrievals * 100.0 / NULLIF(total_responses, 0), 0),
+        'top_sources', COALESCE(
+            (SELECT jsonb_agg(jsonb_build_object('source', source, 'count', count) ORDER BY count DESC) FROM top_sources),
+            '[]'::JSONB
+        ),
+        'total_responses', total_responses
+    )
+    FROM rates;
+$$;
+
+COMMENT ON FUNCTION refresh_dashboard_views() IS 'Refreshes the dashboard materialized views; called by the dashboard Refresh Data button and optionally scheduled via pg_cron';
+
+-- Conversation triggers
+-- Bump message_count and updated_at on the parent conversation whenever a
+-- message is inserted, so saving a message is a single round trip
+CREATE OR REPLACE FUNCTION bump_conversation_message_count()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE conversations
+    SET message_count = message_count + 1,
+        updated_at = NOW()
+    WHERE id = NEW.conversation_id;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_conversation_messages_bump_count ON conversation_messages;
+CREATE TRIGGER trg_conversation_messages_bump_count
+AFTER INSERT ON conversation_messages
+FOR EACH ROW EXECUTE FUNCTION bump_conversation_message_count();
@@ -1,51 +1,284 @@
+import asyncio
+import itertools
+import json
+import threading
+from collections import Counter
+from concurrent.futures import Future
+import httpx
+import pandas as pd
 from supabase import create_client, Client
-from typing import Optional, Dict, List, Any
+from supabase.lib.client_options import SyncClientOptions
+from typing import Optional, Dict, List, Any, Callable, Iterable, Iterator, Union
 from config import Config
+from database.postgres_pool import PostgresPool
+from utils.cache import TTLCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Dashboard filter key -> parameter of the aggregate SQL functions, in
+# positional order
+AGGREGATE_PARAMS = (
+    ("mode", "p_mode"),
+    ("start_date", "p_start_date"),
+    ("end_date", "p_end_date"),
+    ("intent", "p_intent"),
+)
+
+# Aggregate function calls issued over the direct Postgres pool. Dates are
+# passed as ISO strings and cast server-side.
+DIRECT_AGGREGATE_SQL = {
+    "intent_risk_value_matrix": (
+        "SELECT intent_name, containment_rate, escalation_rate, volume "
+        "FROM intent_risk_value_matrix($1::text, $2::text::timestamptz, $3::text::timestamptz, $4::text)"
+    ),
+    "citation_coverage": (
+        "SELECT citation_coverage($1::text, $2::text::timestamptz, $3::text::timestamptz, $4::text)"
+    ),
+}
+
+# Cache of knowledge document metadata keyed by OpenAI file ID
+DOCUMENT_METADATA_CACHE_SIZE = 2048
+DOCUMENT_METADATA_CACHE_TTL = 300  # seconds
+_document_metadata_cache = TTLCache(maxsize=DOCUMENT_METADATA_CACHE_SIZE, ttl=DOCUMENT_METADATA_CACHE_TTL)
+
+# Short-lived caches for conversation lookups polled on every Streamlit rerun
+CONVERSATION_CACHE_SIZE = 1024
+CONVERSATION_CACHE_TTL = 5  # seconds
+_conversation_cache = TTLCache(maxsize=CONVERSATION_CACHE_SIZE, ttl=CONVERSATION_CACHE_TTL)
+_recent_conversations_cache = TTLCache(maxsize=CONVERSATION_CACHE_SIZE, ttl=CONVERSATION_CACHE_TTL)
+# Conversation UUID -> conversation_id of _conversation_cache entries, so
+# writes that only know the UUID can drop the cached conversation
+_conversation_ids_by_uuid = TTLCache(maxsize=CONVERSATION_CACHE_SIZE, ttl=CONVERSATION_CACHE_TTL)
+
+# Cache of dashboard read results (interactions, metrics, aggregates). Keys
+# include a generation number that every write bumps, so results computed
+# before an insert are never served afterwards.
+READ_CACHE_SIZE = 500
+READ_CACHE_TTL = 300  # seconds, matches the dashboard refresh cadence
+_read_cache = TTLCache(maxsize=READ_CACHE_SIZE, ttl=READ_CACHE_TTL)
+_read_cache_generation = 0
+_read_cache_lock = threading.Lock()
+
+# Connection pool for the shared HTTP session. A single Streamlit process
+# issues at most a handful of concurrent queries, so a small pool with
+# long-lived keep-alive connections is enough.
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY = 60  # seconds
+
+# Rows per range request when paginating selects. Matches Supabase's default
+# PostgREST max-rows, so a short page reliably means the last page.
+PAGE_SIZE = 1000
+
+# Interaction columns the dashboard reads. Large text/JSONB columns
+# (user_query, response_text, citations) are left out unless asked for.
+DASHBOARD_INTERACTION_COLUMNS = (
+    "id, timestamp, session_id, assistant_mode, intent_name, intent_category, "
+    "outcome, confidence_score, processing_time_ms, response_generation_time_ms"
+)
+
+# Columns interaction pages are ordered by; the last row's values are the
+# cursor for the next page
+INTERACTION_CURSOR_COLUMNS = ("timestamp", "id")
+
+# Maximum interactions written in one group-committed insert. Keeps the
+# request body well under PostgREST's default 1MB limit even with long
+# responses and citations.
+INSERT_BATCH_SIZE = 100
+
+# Maximum values per PostgREST IN filter; larger lists are sent in batches
+IN_FILTER_BATCH_SIZE = 500
+
+# Dashboard filter key -> (column, PostgREST operator)
+INTERACTION_FILTERS = {
+    "mode": ("assistant_mode", "eq"),
+    "start_date": ("timestamp", "gte"),
+    "end_date": ("timestamp", "lte"),
+    "intent": ("intent_name", "eq"),
+    # Legacy get_metrics keys
+    "date_from": ("timestamp", "gte"),
+    "date_to": ("timestamp", "lte"),
+}
+ESCALATION_FILTERS = {
+    "mode": ("interactions.assistant_mode", "eq"),  # Requires the embedded interaction
+    "start_date": ("created_at", "gte"),
+    "end_date": ("created_at", "lte"),
+}
+
+def _normalize_filters(filters: Optional[Dict[str, Any]]) -> tuple:
+    """
+    Canonicalise a filter dict once per call.
+    
+    Empty values are dropped and dates/datetimes converted to ISO strings, so
+    the result is a sorted tuple of (key, value) pairs that works as a cache
+    key and is what _apply_filters consumes.
+    """
+    if not filters:
+        return ()
+    items = []
+    for key, value in filters.items():
+        if not value:
+            continue
+        isoformat = getattr(value, "isoformat", None)
+        items.append((key, isoformat() if isoformat else value))
+    return tuple(sorted(items))
+
+def _read_cache_key(name: str, *parts: Any) -> tuple:
+    """Cache key for a read result under the current write generation."""
+    return (_read_cache_generation, name) + parts
+
+def invalidate_read_cache() -> None:
+    """Drop cached read results after a write."""
+    global _read_cache_generation
+    with _read_cache_lock:
+        _read_cache_generation += 1
+        _read_cache.clear()
+
+def _apply_filters(query, filters: tuple, specs: Dict[str, tuple]):
+    """
+    Apply dashboard filters to a PostgREST query builder.
+    
+    Args:
+        query: Query builder to filter
+        filters: Normalized filters from _normalize_filters
+        specs: Mapping of filter name to (column, operator method name)
+    
+    Returns:
+        Filtered query builder
+    """
+    for key, value in filters:
+        spec = specs.get(key)
+        if spec is not None:
+            column, op = spec
+            query = getattr(query, op)(column, value)
+    return query
+
 class SupabaseClient:
     """Wrapper for Supabase client operations."""
     
     def __init__(self):
         """Initialize Supabase client."""
+        # One persistent HTTP/2 session shared by all sub-clients, so sequential
+        # dashboard queries reuse a warm connection instead of paying a TLS
+        # handshake each time
+        self.http_client = httpx.Client(
+            http2=True,
+            timeout=Config.API_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
         self.client: Client = create_client(
             Config.SUPABASE_URL,
-            Config.SUPABASE_KEY
+            Config.SUPABASE_KEY,
+            options=SyncClientOptions(httpx_client=self.http_client)
         )
+        # Optional direct Postgres pool for dashboard aggregates (connects lazily)
+        self.pg_pool: Optional[PostgresPool] = None
+        if Config.SUPABASE_POSTGRES_URL:
+            if PostgresPool.is_available():
+                self.pg_pool = PostgresPool(Config.SUPABASE_POSTGRES_URL, timeout=Config.API_TIMEOUT)
+            else:
+                logger.warning("SUPABASE_POSTGRES_URL is set but asyncpg is not installed; using PostgREST")
+        # Interactions waiting to be written by insert_interaction's group commit
+        self._pending_interactions: List[tuple] = []
+        self._pending_interactions_lock = threading.Lock()
+        self._interaction_flush_lock = threading.Lock()
         logger.info("Supabase client initialized")
     
     def test_connection(self) -> bool:
-        """Test connection to Supabase."""
+        """
+        Test connection to Supabase.
+        
+        Intended for explicit health checks (e.g. test_supabase_connection.py).
+        Do not call on app startup: construction does no network I/O and the
+        first real query surfaces connectivity errors.
+        """
         try:
-            # Simple query to test connection
-            result = self.client.table("interactions").select("id").limit(1).execute()
+            # Head request: checks connectivity without transferring rows
+            self.client.table("interactions").select("id", head=True).limit(1).execute()
             logger.info("Supabase connection test successful")
             return True
         except Exception as e:
-            logger.error(f"Supabase connection test failed: {e}")
+            logger.error("Supabase connection test failed: %s", e)
             return False
     
     def insert_interaction(self, interaction_data: Dict[str, Any]) -> Optional[str]:
         """
         Insert an interaction record.
         
+        Concurrent callers are group-committed: while one batch insert is in
+        flight, newly logged interactions queue up and are written together in
+        the next request (up to INSERT_BATCH_SIZE rows). A lone caller is
+        written immediately.
+        
         Args:
             interaction_data: Dictionary with interaction fields
         
         Returns:
             Interaction ID if successful, None otherwise
         """
+        future: Future = Future()
+        with self._pending_interactions_lock:
+            self._pending_interactions.append((interaction_data, future))
+        
+        # Whoever holds the flush lock writes everything queued so far,
+        # including rows queued by other threads while it was waiting
+        while not future.done():
+            with self._interaction_flush_lock:
+                if not future.done():
+                    self._flush_pending_interactions()
+        return future.result()
+    
+    def _flush_pending_interactions(self) -> None:
+        """Insert up to INSERT_BATCH_SIZE queued interactions in one request and resolve their futures."""
+        with self._pending_interactions_lock:
+            batch = self._pending_interactions[:INSERT_BATCH_SIZE]
+            del self._pending_interactions[:INSERT_BATCH_SIZE]
+        if not batch:
+            return
+        
+        ids: Optional[List[Optional[str]]] = None
+        try:
+            result = self.client.table("interactions").insert([data for data, _ in batch]).execute()
+            # PostgREST returns inserted rows in request order
+            if result.data and len(result.data) == len(batch):
+                ids = [row["id"] for row in result.data]
+                logger.info("Interactions logged: %s", ids)
+                invalidate_read_cache()
+            else:
+                logger.error(
+                    "Interaction batch insert returned %s rows for a batch of %s",
+                    len(result.data or []), len(batch),
+                )
+        except Exception as e:
+            logger.error("Failed to insert interaction batch of %s: %s", len(batch), e)
+        
+        if ids is None:
+            if len(batch) > 1:
+                # Retry row by row so one bad row doesn't fail the whole group
+                ids = [self._insert_interaction_row(data) for data, _ in batch]
+            else:
+                ids = [None]
+        
+        for (_, future), interaction_id in zip(batch, ids):
+            future.set_result(interaction_id)
+    
+    def _insert_interaction_row(self, interaction_data: Dict[str, Any]) -> Optional[str]:
+        """Insert a single interaction record. Returns its ID, None on failure."""
         try:
             result = self.client.table("interactions").insert(interaction_data).execute()
             if result.data and len(result.data) > 0:
                 interaction_id = result.data[0]["id"]
-                logger.info(f"Interaction logged: {interaction_id}")
+                logger.info("Interaction logged: %s", interaction_id)
+                invalidate_read_cache()
                 return interaction_id
             return None
         except Exception as e:
-            logger.error(f"Failed to insert interaction: {e}")
+            logger.error("Failed to insert interaction: %s", e)
             return None
     
     def insert_escalation(self, escalation_data: Dict[str, Any]) -> Optional[str]:
@@ -62,11 +295,12 @@ class SupabaseClient:
             result = self.client.table("escalations").insert(escalation_data).execute()
             if result.data and len(result.data) > 0:
                 escalation_id = result.data[0]["id"]
-                logger.info(f"Escalation logged: {escalation_id}")
+                logger.info("Escalation logged: %s", escalation_id)
+                invalidate_read_cache()
                 return escalation_id
             return None
         except Exception as e:
-            logger.error(f"Failed to insert escalation: {e}")
+            logger.error("Failed to insert escalation: %s", e)
             return None
     
     def insert_knowledge_document(self, doc_data: Dict[str, Any]) -> Optional[str]:
@@ -83,87 +317,212 @@ class SupabaseClient:
             result = self.client.table("knowledge_documents").insert(doc_data).execute()
             if result.data and len(result.data) > 0:
                 doc_id = result.data[0]["id"]
-                logger.info(f"Knowledge document logged: {doc_id}")
+                logger.info("Knowledge document logged: %s", doc_id)
+                invalidate_read_cache()
+                _document_metadata_cache.pop(doc_data.get("openai_file_id"))
                 return doc_id
             return None
         except Exception as e:
-            logger.error(f"Failed to insert knowledge document: {e}")
+            logger.error("Failed to insert knowledge document: %s", e)
             return None
     
-    def get_metrics(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _bulk_insert(self, table: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insert many rows into a table with a single multi-row request.
+        
+        Args:
+            table: Table name
+            rows: List of row dictionaries (all with the same keys)
+        
+        Returns:
+            List of inserted IDs in insertion order, empty list on failure
+        """
+        if not rows:
+            return []
+        
+        try:
+            result = self.client.table(table).insert(rows).execute()
+            ids = [row["id"] for row in result.data] if result.data else []
+            if table != "conversation_messages":  # Messages are not read by the dashboard
+                invalidate_read_cache()
+            logger.info("Bulk inserted %s rows into %s", len(ids), table)
+            return ids
+        except Exception as e:
+            logger.error("Failed to bulk insert into %s: %s", table, e)
+            return []
+    
+    def bulk_insert_interactions(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert multiple interaction records in one request. Returns inserted IDs."""
+        return self._bulk_insert("interactions", rows)
+    
+    def bulk_insert_knowledge_documents(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert multiple knowledge document records in one request. Returns inserted IDs."""
+        ids = self._bulk_insert("knowledge_documents", rows)
+        if ids:
+            for row in rows:
+                _document_metadata_cache.pop(row.get("openai_file_id"))
+        return ids
+    
+    def bulk_save_messages(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Save multiple conversation messages in one request.
+        
+        Each row uses the conversation_messages columns (conversation_id is the
+        conversation UUID). Message counts are bumped per row by the
+        trg_conversation_messages_bump_count trigger.
+        
+        Returns:
+            Inserted message UUIDs
+        """
+        return self._bulk_insert("conversation_messages", rows)
+    
+    def get_interaction_count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count interactions matching filters without transferring any rows.
+        
+        Uses a HEAD request with an exact count, so only the Content-Range
+        header comes back.
+        
+        Args:
+            filters: Optional filters dict (same keys as get_interactions)
+        
+        Returns:
+            Number of matching interactions, 0 on failure
+        """
+        normalized = _normalize_filters(filters)
+        cache_key = _read_cache_key("interaction_count", normalized)
+        cached = _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            query = self.client.table("interactions").select("id", count="exact", head=True)
+            result = _apply_filters(query, normalized, INTERACTION_FILTERS).execute()
+            count = result.count or 0
+            _read_cache.set(cache_key, count)
+            return count
+        except Exception as e:
+            logger.error("Failed to count interactions: %s", e)
+            return 0
+    
+    def get_metrics(self, filters: Optional[Dict[str, Any]] = None, include_rows: bool = False) -> Dict[str, Any]:
         """
         Get aggregated metrics for dashboard.
         
         Args:
             filters: Optional filters (mode, date_range, etc.)
+            include_rows: Also return the matching interaction rows (for
+                drill-down). When False, only get_interaction_count() is
+                called and no rows are transferred.
         
         Returns:
             Dictionary with metric values
         """
-        try:
-            # Build query with filters
-            query = self.client.table("interactions").select("*")
-            
-            if filters:
-                if "mode" in filters:
-                    query = query.eq("assistant_mode", filters["mode"])
-                if "date_from" in filters:
-                    query = query.gte("timestamp", filters["date_from"])
-                if "date_to" in filters:
-                    query = query.lte("timestamp", filters["date_to"])
-            
-            result = query.execute()
-            interactions = result.data if result.data else []
-            
-            # Calculate metrics (will be implemented in Task 16)
-            # For now, return basic structure
-            return {
-                "total_interactions": len(interactions),
-                "interactions": interactions
-            }
-        except Exception as e:
-            logger.error(f"Failed to get metrics: {e}")
-            return {"total_interactions": 0, "interactions": []}
+        return {
+            "total_interactions": self.get_interaction_count(filters),
+            "interactions": self.get_interactions(filters, columns="*") if include_rows else []
+        }
     
-    def get_interactions(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def _iter_pages(self, build_query: Callable[[], Any], page_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute an interactions select page by page using keyset pagination.
+        
+        Each page continues after the (timestamp, id) of the previous page's
+        last row, so every request is an index range scan regardless of how
+        deep into the result set it is. Relies on interactions.timestamp
+        being NOT NULL (migration 011): a NULL would sort after every cursor.
+        
+        Args:
+            build_query: Callable returning a fresh query builder ordered by
+                timestamp then id, selecting at least those columns (builders
+                are mutated by filters, so one is built per page)
+            page_size: Rows per request (defaults to PAGE_SIZE)
+        
+        Yields:
+            Non-empty lists of rows
+        """
+        page_size = page_size or PAGE_SIZE
+        cursor = None
+        while True:
+            query = build_query()
+            if cursor is not None:
+                timestamp, row_id = cursor
+                query = query.or_(
+                    f'timestamp.gt."{timestamp}",and(timestamp.eq."{timestamp}",id.gt.{row_id})'
+                )
+            result = query.limit(page_size).execute()
+            rows = result.data or []
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            cursor = tuple(rows[-1].get(column) for column in INTERACTION_CURSOR_COLUMNS)
+    
+    def _interactions_query(self, filters: tuple, columns: str = DASHBOARD_INTERACTION_COLUMNS):
+        """Build the filtered, ordered select used by get_interactions (filters already normalized)."""
+        if columns != "*":
+            selected = {column.strip() for column in columns.split(",")}
+            missing = [column for column in INTERACTION_CURSOR_COLUMNS if column not in selected]
+            if missing:
+                columns = ", ".join([columns, *missing])
+        query = self.client.table("interactions").select(columns).order("timestamp").order("id")
+        return _apply_filters(query, filters, INTERACTION_FILTERS)
+    
+    def stream_interactions(self, filters: Optional[Dict[str, Any]] = None,
+                            columns: str = DASHBOARD_INTERACTION_COLUMNS) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lazily fetch interactions one page at a time.
+        
+        Args:
+            filters: Optional filters dict (same keys as get_interactions)
+            columns: PostgREST column list to select
+        
+        Yields:
+            Pages (lists) of up to PAGE_SIZE interaction dictionaries. Errors
+            raised while iterating propagate to the caller.
+        """
+        normalized = _normalize_filters(filters)
+        return self._iter_pages(lambda: self._interactions_query(normalized, columns))
+    
+    def get_interactions(self, filters: Optional[Dict[str, Any]] = None, stream: bool = False,
+                         columns: str = DASHBOARD_INTERACTION_COLUMNS) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
         """
         Get interactions from database with optional filters.
         
+        Rows are fetched in pages of PAGE_SIZE, so results are not truncated at
+        PostgREST's max-rows limit.
+        
         Args:
             filters: Optional filters dict with keys:
                 - mode: 'customer' or 'banker'
                 - start_date: datetime or ISO string
                 - end_date: datetime or ISO string
                 - intent: intent name
+            stream: Return a lazy iterator that fetches one page at a time
+                instead of a list. Errors raised while iterating propagate to
+                the caller.
+            columns: PostgREST column list to select (default the columns the
+                dashboard uses; pass "*" for every column)
         
         Returns:
-            List of interaction dictionaries
+            List (or iterator when stream=True) of interaction dictionaries
         """
+        normalized = _normalize_filters(filters)
+        pages = self._iter_pages(lambda: self._interactions_query(normalized, columns))
+        if stream:
+            return itertools.chain.from_iterable(pages)
+        
+        cache_key = _read_cache_key("interactions", normalized, columns)
+        cached = _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            query = self.client.table("interactions").select("*")
-            
-            if filters:
-                if filters.get("mode"):
-                    query = query.eq("assistant_mode", filters["mode"])
-                if filters.get("start_date"):
-                    start_date = filters["start_date"]
-                    if isinstance(start_date, str):
-                        query = query.gte("timestamp", start_date)
-                    else:
-                        query = query.gte("timestamp", start_date.isoformat())
-                if filters.get("end_date"):
-                    end_date = filters["end_date"]
-                    if isinstance(end_date, str):
-                        query = query.lte("timestamp", end_date)
-                    else:
-                        query = query.lte("timestamp", end_date.isoformat())
-                if filters.get("intent"):
-                    query = query.eq("intent_name", filters["intent"])
-            
-            result = query.execute()
-            return result.data if result.data else []
+            interactions = [row for page in pages for row in page]
+            _read_cache.set(cache_key, interactions)
+            return interactions
         except Exception as e:
-            logger.error(f"Failed to get interactions: {e}")
+            logger.error("Failed to get interactions: %s", e)
             return []
     
     def get_escalations(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
@@ -172,7 +531,7 @@ class SupabaseClient:
         
         Args:
             filters: Optional filters dict with keys:
-                - mode: 'customer' or 'banker' (applied after join)
+                - mode: 'customer' or 'banker' (filtered on the joined interaction)
                 - start_date: datetime or ISO string
                 - end_date: datetime or ISO string
         
@@ -180,77 +539,78 @@ class SupabaseClient:
             List of escalation dictionaries (joined with interactions for mode/intent)
         """
         try:
-            # First get escalations
-            query = self.client.table("escalations").select("*")
+            # Embed the parent interaction so PostgREST performs the join server-side.
+            # An inner join is only needed when filtering on the interaction's mode.
+            mode = filters.get("mode") if filters else None
+            embed = "interactions!inner" if mode else "interactions"
+            query = self.client.table("escalations").select(
+                f"id, interaction_id, trigger_type, escalation_reason, created_at, "
+                f"{embed}(assistant_mode, intent_name)"
+            )
             
-            if filters:
-                if filters.get("start_date"):
-                    start_date = filters["start_date"]
-                    if isinstance(start_date, str):
-                        query = query.gte("created_at", start_date)
-                    else:
-                        query = query.gte("created_at", start_date.isoformat())
-                if filters.get("end_date"):
-                    end_date = filters["end_date"]
-                    if isinstance(end_date, str):
-                        query = query.lte("created_at", end_date)
-                    else:
-                        query = query.lte("created_at", end_date.isoformat())
+            query = _apply_filters(query, _normalize_filters(filters), ESCALATION_FILTERS)
             
             result = query.execute()
             escalations = result.data if result.data else []
             
-            # Get interaction IDs
-            interaction_ids = [e.get("interaction_id") for e in escalations if e.get("interaction_id")]
-            
-            # Fetch interactions separately (Supabase doesn't support .in_() directly, fetch all and filter)
-            interactions_map = {}
-            if interaction_ids:
-                # Fetch all interactions and filter in Python
-                interactions_result = self.client.table("interactions").select("id, assistant_mode, intent_name").execute()
-                if interactions_result.data:
-                    for interaction in interactions_result.data:
-                        if interaction["id"] in interaction_ids:
-                            interactions_map[interaction["id"]] = interaction
-            
-            # Combine escalations with interaction data
-            flattened = []
-            for esc in escalations:
-                interaction_id = esc.get("interaction_id")
-                interaction = interactions_map.get(interaction_id) if interaction_id else None
-                
-                flattened.append({
+            # Flatten the embedded interaction into the escalation row
+            return [
+                {
                     "id": esc.get("id"),
-                    "interaction_id": interaction_id,
+                    "interaction_id": esc.get("interaction_id"),
                     "trigger_type": esc.get("trigger_type"),
                     "escalation_reason": esc.get("escalation_reason"),
                     "created_at": esc.get("created_at"),
-                    "assistant_mode": interaction.get("assistant_mode") if interaction else None,
-                    "intent_name": interaction.get("intent_name") if interaction else None,
-                })
-            
-            # Apply mode filter if needed
-            if filters and filters.get("mode"):
-                flattened = [e for e in flattened if e.get("assistant_mode") == filters["mode"]]
-            
-            return flattened
+                    "assistant_mode": (esc.get("interactions") or {}).get("assistant_mode"),
+                    "intent_name": (esc.get("interactions") or {}).get("intent_name"),
+                }
+                for esc in escalations
+            ]
         except Exception as e:
-            logger.error(f"Failed to get escalations: {e}")
+            logger.error("Failed to get escalations: %s", e)
             return []
     
+    async def fetch_dashboard_data(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetch the independent dashboard datasets concurrently.
+        
+        Each read runs in a worker thread; the underlying HTTP pool is thread-safe,
+        so the round trips overlap instead of running back to back.
+        
+        Args:
+            filters: Optional filters dict (same keys as get_interactions)
+        
+        Returns:
+            Dict with keys: interactions, escalations, intent_risk_value_matrix, citation_coverage
+        """
+        interactions, escalations, matrix, coverage = await asyncio.gather(
+            asyncio.to_thread(self.get_interactions, filters),
+            asyncio.to_thread(self.get_escalations, filters),
+            asyncio.to_thread(self.get_intent_risk_value_matrix, filters),
+            asyncio.to_thread(self.get_citation_coverage_data, filters),
+        )
+        return {
+            "interactions": interactions,
+            "escalations": escalations,
+            "intent_risk_value_matrix": matrix,
+            "citation_coverage": coverage,
+        }
+    
     def get_distinct_intents(self) -> List[str]:
         """Get list of distinct intent names from interactions."""
+        cache_key = _read_cache_key("distinct_intents")
+        cached = _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            result = self.client.table("interactions").select("intent_name").execute()
-            intents = set()
-            if result.data:
-                for row in result.data:
-                    intent = row.get("intent_name")
-                    if intent:
-                        intents.add(intent)
-            return sorted(list(intents))
+            # DISTINCT and ORDER BY run in Postgres (see distinct_intents() in schema.sql)
+            result = self.client.rpc("distinct_intents").execute()
+            intents = [row["intent_name"] for row in result.data] if result.data else []
+            _read_cache.set(cache_key, intents)
+            return intents
         except Exception as e:
-            logger.error(f"Failed to get distinct intents: {e}")
+            logger.error("Failed to get distinct intents: %s", e)
             return []
     
     def get_document_metadata_by_file_ids(self, file_ids: List[str]) -> Dict[str, Dict[str, Any]]:
@@ -266,31 +626,25 @@ class SupabaseClient:
         if not file_ids:
             return {}
 
+        # Knowledge documents rarely change and the same files are cited over
+        # and over, so serve repeat lookups from the process-wide cache.
+        # Unknown file IDs are cached as empty dicts so they are not re-queried.
+        cached = _document_metadata_cache.get_many(file_ids)
+        missing_ids = [file_id for file_id in dict.fromkeys(file_ids) if file_id not in cached]
+        cached = {file_id: metadata for file_id, metadata in cached.items() if metadata}
+        if not missing_ids:
+            return cached
+
         try:
-            # Query knowledge_documents table for matching file IDs
-            # Try using .in_() first (supported in newer Supabase clients)
-            try:
+            # Query knowledge_documents in batches so the IN filter stays within
+            # PostgREST's URL length limit
+            metadata_map = {}
+            for i in range(0, len(missing_ids), IN_FILTER_BATCH_SIZE):
                 result = self.client.table("knowledge_documents").select(
                     "openai_file_id, title, source_url, content_type"
-                ).in_("openai_file_id", file_ids).execute()
-            except (AttributeError, TypeError):
-                # Fallback: fetch all and filter in Python (if .in_() not supported)
-                logger.warning("in_() not supported, using fallback method")
-                all_result = self.client.table("knowledge_documents").select(
-                    "openai_file_id, title, source_url, content_type"
-                ).execute()
-                # Filter in Python
-                filtered_data = []
-                if all_result.data:
-                    file_ids_set = set(file_ids)
-                    for row in all_result.data:
-                        if row.get("openai_file_id") in file_ids_set:
-                            filtered_data.append(row)
-                result = type('obj', (object,), {'data': filtered_data})()
+                ).in_("openai_file_id", missing_ids[i:i + IN_FILTER_BATCH_SIZE]).execute()
 
-            metadata_map = {}
-            if result.data:
-                for row in result.data:
+                for row in result.data or []:
                     file_id = row.get("openai_file_id")
                     if file_id:
                         metadata_map[file_id] = {
@@ -298,17 +652,76 @@ class SupabaseClient:
                             "source_url": row.get("source_url", ""),
                             "content_type": row.get("content_type", "public")
                         }
+                        _document_metadata_cache.set(file_id, metadata_map[file_id])
+
+            for file_id in missing_ids:
+                if file_id not in metadata_map:
+                    _document_metadata_cache.set(file_id, {})
 
             logger.info(
                 "document_metadata_retrieved",
                 requested_count=len(file_ids),
+                cached_count=len(cached),
                 found_count=len(metadata_map)
             )
-            return metadata_map
+            return {**cached, **metadata_map}
         except Exception as e:
-            logger.error(f"Failed to get document metadata: {e}")
+            logger.error("Failed to get document metadata: %s", e)
             return {}
 
+    def _aggregate_params(self, filters: tuple) -> Dict[str, Any]:
+        """Map normalized dashboard filters to the parameters of the aggregate SQL functions."""
+        values = dict(filters)
+        return {param: values[key] for key, param in AGGREGATE_PARAMS if key in values}
+
+    def refresh_dashboard_views(self) -> bool:
+        """
+        Refresh the dashboard materialized views now and drop cached reads.
+
+        Called from the dashboard's Refresh Data button; otherwise the views
+        are refreshed by the optional pg_cron schedule (migration 010).
+
+        Returns:
+            True if the views were refreshed, False otherwise
+        """
+        try:
+            self.client.rpc("refresh_dashboard_views", {}).execute()
+            logger.info("Dashboard views refreshed")
+            return True
+        except Exception as e:
+            logger.error("Failed to refresh dashboard views: %s", e)
+            return False
+        finally:
+            invalidate_read_cache()
+
+    def _call_aggregate(self, function: str, filters: tuple) -> Any:
+        """
+        Call a dashboard aggregate SQL function.
+
+        Uses the direct Postgres pool when SUPABASE_POSTGRES_URL is configured,
+        falling back to a PostgREST RPC if that is unavailable, fails, or is
+        backing off after a failed connect.
+
+        Args:
+            function: intent_risk_value_matrix or citation_coverage
+            filters: Normalized filters from _normalize_filters
+
+        Returns:
+            The function result as PostgREST would return it (rows or JSON object)
+        """
+        params = self._aggregate_params(filters)
+        if self.pg_pool is not None and self.pg_pool.is_ready():
+            try:
+                args = [params.get(param) for _, param in AGGREGATE_PARAMS]
+                sql = DIRECT_AGGREGATE_SQL[function]
+                if function == "citation_coverage":
+                    value = self.pg_pool.fetchval(sql, *args)
+                    return json.loads(value) if isinstance(value, str) else value
+                return [dict(row) for row in self.pg_pool.fetch(sql, *args)]
+            except Exception as e:
+                logger.warning("Direct %s query failed, using PostgREST: %s", function, e)
+        return self.client.rpc(function, params).execute().data
+
     def get_intent_risk_value_matrix(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get intent risk-value matrix data for dashboard.
@@ -318,63 +731,79 @@ class SupabaseClient:
         - Escalation rate (risk): % of interactions that were escalated
         - Volume: total number of interactions
 
+        Aggregation runs in Postgres via the intent_risk_value_matrix() function, which
+        reads hourly rollups from mv_intent_outcomes. The view is refreshed by the
+        optional pg_cron schedule and by refresh_dashboard_views().
+        If the function has not been deployed yet, rows are aggregated client-side.
+
         Args:
             filters: Optional filters dict
 
         Returns:
             List of dicts with keys: intent_name, containment_rate, escalation_rate, volume
         """
+        normalized = _normalize_filters(filters)
+        cache_key = _read_cache_key("intent_risk_value_matrix", normalized)
+        cached = _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Get interactions data
-            interactions = self.get_interactions(filters)
-
-            if not interactions:
-                return []
-
-            # Group by intent
-            intent_stats = {}
-            for interaction in interactions:
-                intent = interaction.get("intent_name")
-                if not intent:
-                    continue
-
-                outcome = interaction.get("outcome")
-                if intent not in intent_stats:
-                    intent_stats[intent] = {"total": 0, "resolved": 0, "escalated": 0}
-
-                intent_stats[intent]["total"] += 1
-                if outcome == "resolved":
-                    intent_stats[intent]["resolved"] += 1
-                elif outcome == "escalated":
-                    intent_stats[intent]["escalated"] += 1
-
-            # Calculate rates
-            matrix_data = []
-            for intent, stats in intent_stats.items():
-                total = stats["total"]
-                if total == 0:
-                    continue
-
-                containment_rate = (stats["resolved"] / total) * 100
-                escalation_rate = (stats["escalated"] / total) * 100
-
-                matrix_data.append({
-                    "intent_name": intent,
-                    "containment_rate": containment_rate,
-                    "escalation_rate": escalation_rate,
-                    "volume": total
-                })
-
-            # Sort by volume descending
-            matrix_data.sort(key=lambda x: x["volume"], reverse=True)
-
-            logger.info(f"Intent risk-value matrix calculated for {len(matrix_data)} intents")
+            try:
+                matrix_data = self._call_aggregate("intent_risk_value_matrix", normalized) or []
+            except Exception as e:
+                logger.warning("intent_risk_value_matrix RPC failed, aggregating client-side: %s", e)
+                matrix_data = self._aggregate_intent_risk_value_matrix(
+                    self.stream_interactions(filters, columns="intent_name, outcome")
+                )
+
+            logger.info("Intent risk-value matrix calculated for %s intents", len(matrix_data))
+            _read_cache.set(cache_key, matrix_data)
             return matrix_data
 
         except Exception as e:
-            logger.error(f"Failed to calculate intent risk-value matrix: {e}")
+            logger.error("Failed to calculate intent risk-value matrix: %s", e)
+            return []
+
+    def _aggregate_intent_risk_value_matrix(self, pages: Iterable[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Compute the intent risk-value matrix from pages of raw interaction rows.
+
+        Each page is grouped with a vectorized pandas groupby and added to the
+        running per-intent totals, so memory stays proportional to one page
+        plus the number of intents.
+        """
+        totals = None
+        for page in pages:
+            df = pd.DataFrame(page, columns=["intent_name", "outcome"]).dropna(subset=["intent_name"])
+            df = df[df["intent_name"] != ""]
+            if df.empty:
+                continue
+            df["resolved"] = df["outcome"].eq("resolved")
+            df["escalated"] = df["outcome"].eq("escalated")
+            counts = df.groupby("intent_name").agg(
+                volume=("outcome", "size"),
+                resolved=("resolved", "sum"),
+                escalated=("escalated", "sum"),
+            )
+            totals = counts if totals is None else totals.add(counts, fill_value=0)
+
+        if totals is None:
             return []
 
+        # Calculate rates
+        totals = totals.astype(int)
+        matrix = pd.DataFrame({
+            "intent_name": totals.index,
+            "containment_rate": (totals["resolved"] / totals["volume"] * 100).to_numpy(dtype=float),
+            "escalation_rate": (totals["escalated"] / totals["volume"] * 100).to_numpy(dtype=float),
+            "volume": totals["volume"].to_numpy(),
+        })
+
+        # Sort by volume descending
+        matrix = matrix.sort_values("volume", ascending=False, kind="stable")
+        return matrix.to_dict("records")
+
     def get_citation_coverage_data(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get citation coverage and source health data for dashboard.
@@ -384,75 +813,92 @@ class SupabaseClient:
         - Top source pages: most frequently cited sources
         - Failed retrieval rate: % of responses with 0 retrieved chunks
 
+        Aggregation runs in Postgres via the citation_coverage() function, which
+        reads hourly rollups from mv_citation_coverage. The view is refreshed by the
+        optional pg_cron schedule and by refresh_dashboard_views().
+        If the function has not been deployed yet, rows are aggregated client-side.
+
         Args:
             filters: Optional filters dict
 
         Returns:
             Dict with keys: citation_coverage_rate, failed_retrieval_rate, top_sources
         """
+        normalized = _normalize_filters(filters)
+        cache_key = _read_cache_key("citation_coverage", normalized)
+        cached = _read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Get interactions data
-            interactions = self.get_interactions(filters)
+            try:
+                coverage = self._call_aggregate("citation_coverage", normalized)
+            except Exception as e:
+                logger.warning("citation_coverage RPC failed, aggregating client-side: %s", e)
+                coverage = self._aggregate_citation_coverage(
+                    self.get_interactions(filters, stream=True, columns="response_text, citations, retrieved_chunks_count")
+                )
 
-            if not interactions:
+            if not coverage:
                 return {
                     "citation_coverage_rate": 0.0,
                     "failed_retrieval_rate": 0.0,
                     "top_sources": []
                 }
 
-            total_responses = 0
-            responses_with_citations = 0
-            failed_retrievals = 0
-            source_counts = {}
-
-            for interaction in interactions:
-                # Only count interactions that generated responses
-                if interaction.get("response_text"):
-                    total_responses += 1
-
-                    # Check citations
-                    citations = interaction.get("citations", [])
-                    if citations and len(citations) > 0:
-                        responses_with_citations += 1
-
-                        # Count sources
-                        for citation in citations:
-                            source = citation.get("source", "")
-                            if source:
-                                source_counts[source] = source_counts.get(source, 0) + 1
-
-                    # Check retrieval success
-                    retrieved_chunks = interaction.get("retrieved_chunks_count", 0)
-                    if retrieved_chunks == 0:
-                        failed_retrievals += 1
-
-            # Calculate rates
-            citation_coverage_rate = (responses_with_citations / total_responses * 100) if total_responses > 0 else 0.0
-            failed_retrieval_rate = (failed_retrievals / total_responses * 100) if total_responses > 0 else 0.0
-
-            # Get top sources
-            top_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-            top_sources = [{"source": source, "count": count} for source, count in top_sources]
-
-            result = {
-                "citation_coverage_rate": citation_coverage_rate,
-                "failed_retrieval_rate": failed_retrieval_rate,
-                "top_sources": top_sources,
-                "total_responses": total_responses
-            }
-
-            logger.info(f"Citation coverage data calculated: {citation_coverage_rate:.1f}% coverage, {failed_retrieval_rate:.1f}% failed retrieval, {len(top_sources)} top sources")
-            return result
+            logger.info(
+                "Citation coverage data calculated: %.1f%% coverage, %.1f%% failed retrieval, %s top sources",
+                coverage['citation_coverage_rate'], coverage['failed_retrieval_rate'], len(coverage['top_sources'])
+            )
+            _read_cache.set(cache_key, coverage)
+            return coverage
 
         except Exception as e:
-            logger.error(f"Failed to calculate citation coverage data: {e}")
+            logger.error("Failed to calculate citation coverage data: %s", e)
             return {
                 "citation_coverage_rate": 0.0,
                 "failed_retrieval_rate": 0.0,
                 "top_sources": []
             }
 
+    def _aggregate_citation_coverage(self, interactions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compute citation coverage data from raw interaction rows.
+
+        Accepts a streaming iterator; memory stays proportional to the number of sources.
+        """
+        total_responses = responses_with_citations = failed_retrievals = 0
+        source_counts: Counter = Counter()
+        count_sources = source_counts.update
+
+        for interaction in interactions:
+            # Only count interactions that generated responses
+            if not interaction.get("response_text"):
+                continue
+            total_responses += 1
+
+            citations = interaction.get("citations")
+            if citations:
+                responses_with_citations += 1
+                count_sources(c["source"] for c in citations if c.get("source"))
+
+            if interaction.get("retrieved_chunks_count", 0) == 0:
+                failed_retrievals += 1
+
+        # Calculate rates
+        citation_coverage_rate = (responses_with_citations / total_responses * 100) if total_responses > 0 else 0.0
+        failed_retrieval_rate = (failed_retrievals / total_responses * 100) if total_responses > 0 else 0.0
+
+        # Top sources (heap-select, no full sort)
+        top_sources = [{"source": source, "count": count} for source, count in source_counts.most_common(10)]
+
+        return {
+            "citation_coverage_rate": citation_coverage_rate,
+            "failed_retrieval_rate": failed_retrieval_rate,
+            "top_sources": top_sources,
+            "total_responses": total_responses
+        }
+
     def create_conversation(self, conversation_id: str, assistant_mode: str, user_id: Optional[str] = None) -> Optional[str]:
         """
         Create a new conversation.
@@ -473,32 +919,45 @@ class SupabaseClient:
                 "is_active": True
             }
             result = self.client.table("conversations").insert(data).execute()
+            _conversation_cache.pop(conversation_id)
+            _recent_conversations_cache.clear()
             if result.data and len(result.data) > 0:
                 conversation_uuid = result.data[0]["id"]
-                logger.info(f"Conversation created: {conversation_id} (UUID: {conversation_uuid})")
+                logger.info("Conversation created: %s (UUID: %s)", conversation_id, conversation_uuid)
                 return conversation_uuid
             return None
         except Exception as e:
-            logger.error(f"Failed to create conversation: {e}")
+            logger.error("Failed to create conversation: %s", e)
             return None
 
     def get_conversation_by_id(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """
         Get conversation metadata by conversation_id.
 
+        Results are cached for CONVERSATION_CACHE_TTL seconds (dropped when
+        the conversation is written); callers get their own copy.
+
         Args:
             conversation_id: Conversation identifier
 
         Returns:
             Conversation dict if found, None otherwise
         """
+        cached = _conversation_cache.get(conversation_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             result = self.client.table("conversations").select("*").eq("conversation_id", conversation_id).execute()
             if result.data and len(result.data) > 0:
-                return result.data[0]
+                conversation = result.data[0]
+                _conversation_cache.set(conversation_id, conversation)
+                if conversation.get("id"):
+                    _conversation_ids_by_uuid.set(conversation["id"], conversation_id)
+                return dict(conversation)
             return None
         except Exception as e:
-            logger.error(f"Failed to get conversation: {e}")
+            logger.error("Failed to get conversation: %s", e)
             return None
 
     def save_message(self, conversation_uuid: str, role: str, content: str,
@@ -511,6 +970,9 @@ class SupabaseClient:
         """
         Save a message to a conversation.
 
+        The conversation's message_count and updated_at are bumped by the
+        trg_conversation_messages_bump_count trigger, so this is one round trip.
+
         Args:
             conversation_uuid: Conversation UUID
             role: 'user', 'assistant', or 'system'
@@ -538,20 +1000,18 @@ class SupabaseClient:
                 "interaction_id": interaction_id
             }
             result = self.client.table("conversation_messages").insert(data).execute()
+            # The trigger bumped message_count/updated_at, so cached copies are stale
+            cached_conversation_id = _conversation_ids_by_uuid.pop(conversation_uuid)
+            if cached_conversation_id is not None:
+                _conversation_cache.pop(cached_conversation_id)
+            _recent_conversations_cache.clear()
             if result.data and len(result.data) > 0:
                 message_uuid = result.data[0]["id"]
-                logger.debug(f"Message saved to conversation {conversation_uuid}: {role}")
+                logger.debug("Message saved to conversation %s: %s", conversation_uuid, role)
                 return message_uuid
-
-            # Update conversation's message count and updated_at
-            self.client.table("conversations").update({
-                "message_count": self.client.table("conversations").select("message_count").eq("id", conversation_uuid).execute().data[0]["message_count"] + 1,
-                "updated_at": "now()"
-            }).eq("id", conversation_uuid).execute()
-
             return None
         except Exception as e:
-            logger.error(f"Failed to save message: {e}")
+            logger.error("Failed to save message: %s", e)
             return None
 
     def load_conversation_history(self, conversation_uuid: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -572,7 +1032,7 @@ class SupabaseClient:
             result = query.execute()
             return result.data if result.data else []
         except Exception as e:
-            logger.error(f"Failed to load conversation history: {e}")
+            logger.error("Failed to load conversation history: %s", e)
             return []
 
     def get_recent_conversations(self, user_id: Optional[str] = None, assistant_mode: Optional[str] = None,
@@ -587,7 +1047,13 @@ class SupabaseClient:
 
         Returns:
             List of conversation dictionaries ordered by updated_at desc
+            (cached for CONVERSATION_CACHE_TTL seconds)
         """
+        cache_key = (user_id, assistant_mode, limit)
+        cached = _recent_conversations_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             query = self.client.table("conversations").select("*").eq("is_active", True).order("updated_at", desc=True).limit(limit)
 
@@ -597,9 +1063,11 @@ class SupabaseClient:
                 query = query.eq("assistant_mode", assistant_mode)
 
             result = query.execute()
-            return result.data if result.data else []
+            conversations = result.data if result.data else []
+            _recent_conversations_cache.set(cache_key, conversations)
+            return conversations
         except Exception as e:
-            logger.error(f"Failed to get recent conversations: {e}")
+            logger.error("Failed to get recent conversations: %s", e)
             return []
 
     def update_conversation_title(self, conversation_uuid: str, title: str) -> bool:
@@ -618,17 +1086,23 @@ class SupabaseClient:
                 "title": title,
                 "updated_at": "now()"
             }).eq("id", conversation_uuid).execute()
+            # Cached entries are keyed by conversation_id, not UUID, so drop them all
+            _conversation_cache.clear()
+            _recent_conversations_cache.clear()
             return True
         except Exception as e:
-            logger.error(f"Failed to update conversation title: {e}")
+            logger.error("Failed to update conversation title: %s", e)
             return False
 
 # Singleton instance
 _db_client: Optional[SupabaseClient] = None
+_db_client_lock = threading.Lock()
 
 def get_db_client() -> SupabaseClient:
-    """Get singleton Supabase client instance."""
+    """Get singleton Supabase client instance (thread-safe)."""
     global _db_client
     if _db_client is None:
-        _db_client = SupabaseClient()
+        with _db_client_lock:
+            if _db_client is None:
+                _db_client = SupabaseClient()
     return _db_client
@@ -4,7 +4,13 @@ Cleans and structures content to improve vector search quality.
 """
 import sys
 import asyncio
-from typing import Dict, Optional
+import hashlib
+import re
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from typing import Dict, List, Optional
 from pathlib import Path
 
 # Add project root to Python path (for running as script)
@@ -17,6 +23,25 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bump whenever the user prompt template changes so cached cleanings produced
+# by the old prompt are not reused (CLEANING_PROMPT and BATCH_INSTRUCTIONS are
+# hashed into the cache key directly)
+PROMPT_VERSION = 1
+
+# Batching of short documents into one request (see clean_batch_with_llm).
+# Token counts are estimated as characters / 4.
+BATCH_MAX_DOCS = 4
+BATCH_MAX_INPUT_TOKENS = 6000
+BATCH_MAX_OUTPUT_TOKENS = 4000
+# Expected batch output per document: the cleaned text comes back JSON-escaped
+# (about 1.2x the input tokens) plus the document's key and punctuation
+BATCH_OUTPUT_EXPANSION = 1.2
+BATCH_OUTPUT_OVERHEAD_TOKENS = 20
+
+# On-disk cache of LLM cleaning results, keyed by prompt/model/content hash
+CLEAN_CACHE_PATH = project_root / "scraped_docs" / ".clean_cache.sqlite"
+CLEAN_CACHE_COMPRESSION_LEVEL = 6  # zlib level for stored cleanings
+
 
 CLEANING_PROMPT = """You are reorganizing scraped ANZ Bank support documentation. This is REORGANIZATION ONLY, not summarization or condensing.
 
@@ -75,6 +100,120 @@ OUTPUT REQUIREMENT:
 The output must contain EVERY piece of factual information from the input. If you're unsure whether to include something, INCLUDE IT. Better to have too much detail than too little."""
 
 
+BATCH_INSTRUCTIONS = """
+
+BATCH INPUT:
+You will receive several documents, each wrapped in <<<DOC id=N>>> and <<<END N>>> markers.
+Clean each document independently following the instructions above.
+Respond with a JSON object mapping each document id (as a string) to its cleaned content, e.g. {"1": "...", "2": "..."}."""
+
+
+# Lines the cleaning prompt deletes outright. They are also ignored when
+# keying the cache, so pages differing only in this boilerplate share a result.
+BOILERPLATE_LINES = frozenset({
+    "Find ANZ", "Support Centre", "Jump to", "Top", "Branch locator",
+    "Quick links", "Calculators and tools", "Click to play video", "Video transcript",
+})
+VIDEO_DURATION_PATTERN = re.compile(r"^\d{1,2}:\d{2}$")
+
+# Deterministic versions of the prompt's deletion rules (see fast_clean)
+_LINE_RE = re.compile(
+    r"^[ \t]*(?:" + "|".join(re.escape(line) for line in sorted(BOILERPLATE_LINES)) + r"|\d{1,2}:\d{2})[ \t]*(?:\n|$)",
+    re.MULTILINE
+)
+_PHRASE_RE = re.compile(r"Click to play video|Video transcript|[\u25ba\u25b2]")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# Rule 4 (grouping under markdown headers) is the only one that needs the LLM
+_MARKDOWN_HEADER_RE = re.compile(r"^#{1,6}\s", re.MULTILINE)
+
+
+def fast_clean(content: str) -> str:
+    """
+    Apply the cleaning prompt's deletion rules locally.
+    
+    Drops lines that are only navigation/video boilerplate or a video
+    duration, removes "Click to play video", "Video transcript" and arrow
+    symbols from remaining lines, and collapses runs of blank lines.
+    Everything else is left verbatim.
+    """
+    content = _LINE_RE.sub("", content)
+    content = _PHRASE_RE.sub("", content)
+    return _BLANK_LINES_RE.sub("\n\n", content).strip()
+
+
+def _normalize_for_cache(content: str) -> str:
+    """Strip boilerplate lines and whitespace differences that the LLM would remove anyway."""
+    lines = []
+    for line in content.splitlines():
+        line = " ".join(line.split())
+        if line and line not in BOILERPLATE_LINES and not VIDEO_DURATION_PATTERN.match(line):
+            lines.append(line)
+    return "\n".join(lines)
+
+
+class _CleanCache:
+    """
+    SQLite-backed store of cleaned content keyed by a hash of the LLM inputs.
+    
+    Cleaned text is stored zlib-compressed; ANZ pages share a lot of
+    boilerplate so entries shrink several-fold. Rows written before
+    compression was added are plain TEXT and are returned as-is.
+    """
+    
+    def __init__(self, path: Path = CLEAN_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS clean_cache ("
+                "key TEXT PRIMARY KEY, model TEXT, cleaned TEXT, tokens INT, ts REAL)"
+            )
+    
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation so concurrent cleaners
+        # (threads or processes) never share a connection
+        return sqlite3.connect(self.path, timeout=30)
+    
+    @staticmethod
+    def make_key(model: str, content: str) -> str:
+        """Hash the prompt version, system prompts, model and user content."""
+        payload = f"{PROMPT_VERSION}|{CLEANING_PROMPT}|{BATCH_INSTRUCTIONS}|{model}|{content}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return cached cleaned content, or None on a miss."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT cleaned FROM clean_cache WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        cleaned = row[0]
+        return zlib.decompress(cleaned).decode("utf-8") if isinstance(cleaned, bytes) else cleaned
+    
+    def set(self, key: str, model: str, cleaned: str, tokens: int) -> None:
+        """Store cleaned content for key."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO clean_cache (key, model, cleaned, tokens, ts) VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    model,
+                    zlib.compress(cleaned.encode("utf-8"), CLEAN_CACHE_COMPRESSION_LEVEL),
+                    tokens,
+                    time.time(),
+                )
+            )
+
+
+_clean_cache: Optional[_CleanCache] = None
+
+def _get_clean_cache() -> _CleanCache:
+    """Get the shared cleaning cache, creating the database on first use."""
+    global _clean_cache
+    if _clean_cache is None:
+        _clean_cache = _CleanCache()
+    return _clean_cache
+
+
 def clean_content_with_llm(
     content: str,
     title: str,
@@ -92,6 +231,10 @@ def clean_content_with_llm(
     
     Returns:
         Cleaned content or None on failure
+    
+    Results are cached on disk (see CLEAN_CACHE_PATH) keyed by a hash of the
+    prompt, model and normalized page content, so re-cleaning unchanged or
+    boilerplate-only-different pages skips the API call.
     """
     try:
         client = get_openai_client()
@@ -105,19 +248,35 @@ URL: {url}
 
 Content to clean:
 {content}"""
+        
+        # Key on the model that actually serves the request and on the
+        # normalized content, so near-duplicate pages (same text, different
+        # URL, navigation or spacing) reuse one cleaning
+        cache = _get_clean_cache()
+        cache_key = cache.make_key(client.model, _normalize_for_cache(content))
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("clean_cache_hit", url=url)
+            return cached
 
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
         ]
         
-        response = client.chat_completion(
+        # Streamed so output accumulates while the model is still generating
+        response = client.chat_completion_stream(
             messages=messages,
             temperature=0.3,  # Lower temperature for more consistent, factual output
             max_tokens=4000,  # Enough for most pages
             max_retries=3
         )
         
+        if response and response.get("finish_reason") == "length":
+            # Truncated by max_tokens: neither cache nor use a partial document
+            logger.error("llm_cleaning_failed", url=url, reason="Output truncated at max_tokens")
+            return None
+        
         if response and response.get("content"):
             cleaned = response["content"].strip()
             
@@ -127,9 +286,11 @@ Content to clean:
                 "content_cleaned",
                 url=url,
                 tokens_used=usage.get("total_tokens", 0),
+                first_token_ms=response.get("first_token_ms"),
                 model=model
             )
             
+            cache.set(cache_key, client.model, cleaned, usage.get("total_tokens", 0))
             return cleaned
         else:
             logger.error("llm_cleaning_failed", url=url, reason="No content in response")
@@ -140,6 +301,105 @@ Content to clean:
         return None
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return len(text) // 4
+
+
+def clean_batch_with_llm(docs: List[Dict[str, str]], model: str = "gpt-4o") -> List[Optional[str]]:
+    """
+    Clean several short documents with a single LLM request.
+    
+    Documents already in the cleaning cache are not sent. The rest are
+    delimited with <<<DOC id=N>>> / <<<END N>>> markers and the model
+    returns a JSON object mapping each id to its cleaned content. Documents
+    missing from the response are cleaned individually.
+    
+    Args:
+        docs: Dicts with keys content, title, url
+        model: OpenAI model to use
+    
+    Returns:
+        Cleaned content (or None on failure) for each document, in order
+    """
+    if len(docs) == 1:
+        doc = docs[0]
+        return [clean_content_with_llm(doc["content"], doc["title"], doc["url"], model)]
+    
+    results: List[Optional[str]] = [None] * len(docs)
+    try:
+        client = get_openai_client()
+        cache = _get_clean_cache()
+        keys = [cache.make_key(client.model, _normalize_for_cache(doc["content"])) for doc in docs]
+        pending = []
+        for i, key in enumerate(keys):
+            results[i] = cache.get(key)
+            if results[i] is None:
+                pending.append(i)
+        
+        if len(pending) > 1:
+            parts = []
+            for n, i in enumerate(pending, start=1):
+                doc = docs[i]
+                parts.append(
+                    f"<<<DOC id={n}>>>\nTitle: {doc['title']}\nURL: {doc['url']}\n\n{doc['content']}\n<<<END {n}>>>"
+                )
+            messages = [
+                {"role": "system", "content": CLEANING_PROMPT + BATCH_INSTRUCTIONS},
+                {"role": "user", "content": "Clean and structure these ANZ support pages:\n\n" + "\n\n".join(parts)}
+            ]
+            response = client.chat_completion(
+                messages=messages,
+                temperature=0.3,
+                max_tokens=BATCH_MAX_OUTPUT_TOKENS,
+                response_format={"type": "json_object"},
+                max_retries=3
+            )
+            parsed = client.parse_json_response(response["content"]) if response and response.get("content") else None
+            if isinstance(parsed, dict):
+                usage = response.get("usage", {})
+                for n, i in enumerate(pending, start=1):
+                    cleaned = parsed.get(str(n))
+                    if isinstance(cleaned, str) and cleaned.strip():
+                        results[i] = cleaned.strip()
+                        cache.set(keys[i], client.model, results[i], usage.get("total_tokens", 0) // len(pending))
+                logger.info(
+                    "content_batch_cleaned",
+                    documents=len(pending),
+                    tokens_used=usage.get("total_tokens", 0),
+                    model=model
+                )
+            else:
+                logger.warning("llm_batch_cleaning_failed", documents=len(pending))
+    except Exception as e:
+        logger.error("llm_batch_cleaning_error", error=str(e))
+    
+    # Anything the batch did not return (or a lone uncached document) is
+    # cleaned on its own
+    for i, doc in enumerate(docs):
+        if results[i] is None:
+            results[i] = clean_content_with_llm(doc["content"], doc["title"], doc["url"], model)
+    return results
+
+
+# Heuristics for content that needs cleaning, compiled once so each check is
+# a single scan of the content
+NAVIGATION_INDICATORS = ("Find ANZ", "Support Centre", "Jump to", "Quick links", "Branch locator", "Top\n")
+_NAVIGATION_RE = re.compile("|".join(re.escape(indicator) for indicator in NAVIGATION_INDICATORS))
+# Special character artifacts (like arrow symbols, special unicode)
+_ARTIFACT_RE = re.compile("[" + "".join(map(chr, (0xf0, 0x2022, 0x25b6, 0x2191, 0x2192))) + "]")
+
+
+def _is_very_short(content: str, limit: int = 500) -> bool:
+    """len(content.strip()) < limit, without copying long pages just to measure them."""
+    if len(content) < limit:
+        return True
+    # strip() only changes the length when there is whitespace at either end
+    if not (content[0].isspace() or content[-1].isspace()):
+        return False
+    return len(content.strip()) < limit
+
+
 def needs_cleaning(content: str) -> bool:
     """
     Quick check if content likely needs cleaning.
@@ -150,28 +410,129 @@ def needs_cleaning(content: str) -> bool:
     Returns:
         True if content likely needs cleaning
     """
-    # Heuristics for content that needs cleaning
-    navigation_indicators = [
-        "Find ANZ",
-        "Support Centre",
-        "Jump to",
-        "Quick links",
-        "Branch locator",
-        "Top\n"
-    ]
-    
     # Check if navigation elements are present
-    has_navigation = any(indicator in content for indicator in navigation_indicators)
+    if _NAVIGATION_RE.search(content):
+        return True
+    
+    # Very short content with artifacts (might need enhancement)
+    return _is_very_short(content) and _ARTIFACT_RE.search(content) is not None
+
+
+def _read_document(path: Path) -> Dict[str, str]:
+    """
+    Read a scraped document and split its metadata header from the content.
     
-    # Check for very short content (might need enhancement)
-    is_very_short = len(content.strip()) < 500
+    Returns:
+        Dict with keys: path, title, url, retrieval_date, content
+    """
+    title = ""
+    url = ""
+    retrieval_date = ""
+    header_lines = []
+    body_lines = []
+    
+    # Single streaming pass: metadata header up to the first blank line after
+    # line 4, then content up to the footer separator
+    in_header = True
+    with open(path, "r", encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            if in_header:
+                header_lines.append(line)
+                if line.startswith("Title: "):
+                    title = line.replace("Title: ", "").strip()
+                elif line.startswith("Source URL: "):
+                    url = line.replace("Source URL: ", "").strip()
+                elif line.startswith("Retrieval Date: "):
+                    retrieval_date = line.replace("Retrieval Date: ", "").strip()
+                elif line.strip() == "" and i > 4:
+                    in_header = False
+                continue
+            
+            # Remove footer (after "---")
+            footer_start = line.find("---")
+            if footer_start != -1:
+                body_lines.append(line[:footer_start])
+                break
+            body_lines.append(line)
+    
+    if in_header:
+        # No blank line ends the header, so the whole file is content
+        content = "".join(header_lines).split("---")[0]
+    else:
+        content = "".join(body_lines)
+    
+    return {
+        "path": str(path),
+        "title": title,
+        "url": url,
+        "retrieval_date": retrieval_date,
+        "content": content.strip(),
+    }
+
+
+def _write_cleaned_document(doc: Dict[str, str], cleaned_content: str, model: str, method: str = "LLM") -> None:
+    """Back up the original document (once) and write the cleaned version in its place."""
+    path = Path(doc["path"])
+    backup_path = path.with_suffix('.original.txt')
+    if not backup_path.exists():
+        path.rename(backup_path)
     
-    # Check for special character artifacts (like arrow symbols, special unicode)
-    # Using chr() to avoid unicode escape issues
-    artifacts = [chr(0xf0), chr(0x2022), chr(0x25b6), chr(0x2191), chr(0x2192)]
-    has_artifacts = any(char in content for char in artifacts)
+    # Format cleaned document
+    formatted = f"""Title: {doc["title"]}
+Source URL: {doc["url"]}
+Retrieval Date: {doc["retrieval_date"]}
+Content Type: public
+Cleaned: Yes
+
+{cleaned_content}
+
+---
+Original URL: {doc["url"]}
+Scraped: {doc["retrieval_date"]}
+Cleaned with {method}: {model}
+"""
     
-    return has_navigation or (is_very_short and has_artifacts)
+    path.write_text(formatted, encoding="utf-8")
+
+
+def _write_rule_cleaned(doc: Dict[str, str]) -> None:
+    """Write the rule-cleaned content in place of the original if fast_clean changed it."""
+    if doc["content"] != doc["original_content"]:
+        _write_cleaned_document(doc, doc["content"], "fast_clean", method="rules")
+        logger.info("cleaned_without_llm", filepath=doc["path"])
+    else:
+        logger.info("cleaning_not_needed", filepath=doc["path"])
+
+
+def _apply_rules(doc: Dict[str, str], force: bool) -> bool:
+    """
+    Run fast_clean on a document before deciding whether it needs the LLM.
+    
+    Documents the heuristics do not flag are left untouched (unless force is
+    on). Otherwise doc["content"] is replaced with the rule-cleaned text and
+    the pre-rules text kept in doc["original_content"]. fast_clean covers the
+    prompt's deletion rules, so the LLM is only needed to add structure: if
+    the heuristics no longer flag the text, or it already has markdown
+    headers (and force is off), the rule-cleaned version is written out.
+    
+    Returns:
+        True if the document still needs LLM cleaning
+    """
+    original = doc["content"]
+    doc["original_content"] = original
+    if not force and not needs_cleaning(original):
+        logger.info("cleaning_not_needed", filepath=doc["path"])
+        return False
+    doc["content"] = fast_clean(original)
+    if force:
+        return True
+    if needs_cleaning(doc["content"]):
+        if not _MARKDOWN_HEADER_RE.search(doc["content"]):
+            return True
+        logger.info("llm_skipped_structured", filepath=doc["path"])
+    
+    _write_rule_cleaned(doc)
+    return False
 
 
 async def clean_document_file(
@@ -196,71 +557,27 @@ async def clean_document_file(
             logger.error("file_not_found", filepath=filepath)
             return None
         
-        # Read original content
-        with open(path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        # Parse metadata header
-        metadata_end = 0
-        title = ""
-        url = ""
-        retrieval_date = ""
-        
-        for i, line in enumerate(lines):
-            if line.startswith("Title: "):
-                title = line.replace("Title: ", "").strip()
-            elif line.startswith("Source URL: "):
-                url = line.replace("Source URL: ", "").strip()
-            elif line.startswith("Retrieval Date: "):
-                retrieval_date = line.replace("Retrieval Date: ", "").strip()
-            elif line.strip() == "" and i > 4:
-                metadata_end = i + 1
-                break
-        
-        # Extract content (skip metadata header)
-        content_lines = lines[metadata_end:]
-        # Remove footer (after "---")
-        content = "".join(content_lines)
-        if "---" in content:
-            content = content.split("---")[0]
+        # File I/O and the synchronous OpenAI client run in worker threads so
+        # other documents' requests overlap with this one
+        doc = await asyncio.to_thread(_read_document, path)
         
-        content = content.strip()
-        
-        # Check if cleaning is needed
-        if not force and not needs_cleaning(content):
-            logger.info("cleaning_not_needed", filepath=filepath)
+        # Deterministic rules first; only call the LLM if they are not enough
+        if not await asyncio.to_thread(_apply_rules, doc, force):
             return str(path)
         
         # Clean with LLM
-        logger.info("cleaning_started", filepath=filepath, url=url)
-        cleaned_content = clean_content_with_llm(content, title, url, model)
+        logger.info("cleaning_started", filepath=filepath, url=doc["url"])
+        cleaned_content = await asyncio.to_thread(
+            clean_content_with_llm, doc["content"], doc["title"], doc["url"], model
+        )
         
         if not cleaned_content:
-            logger.warning("cleaning_failed_keeping_original", filepath=filepath)
+            # Keep what the rules already removed
+            logger.warning("llm_cleaning_failed", filepath=filepath)
+            await asyncio.to_thread(_write_rule_cleaned, doc)
             return str(path)
         
-        # Write cleaned version (backup original first)
-        backup_path = path.with_suffix('.original.txt')
-        if not backup_path.exists():
-            path.rename(backup_path)
-        
-        # Format cleaned document
-        formatted = f"""Title: {title}
-Source URL: {url}
-Retrieval Date: {retrieval_date}
-Content Type: public
-Cleaned: Yes
-
-{cleaned_content}
-
----
-Original URL: {url}
-Scraped: {retrieval_date}
-Cleaned with LLM: {model}
-"""
-        
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(formatted)
+        await asyncio.to_thread(_write_cleaned_document, doc, cleaned_content, model)
         
         logger.info("cleaning_complete", filepath=filepath)
         return str(path)
@@ -270,20 +587,53 @@ Cleaned with LLM: {model}
         return None
 
 
+def _plan_batches(docs: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+    """
+    Greedily pack documents into batches for clean_batch_with_llm.
+    
+    A batch holds at most BATCH_MAX_DOCS documents, its estimated content
+    tokens stay within BATCH_MAX_INPUT_TOKENS, and its expected JSON output
+    (see BATCH_OUTPUT_EXPANSION) stays within BATCH_MAX_OUTPUT_TOKENS so the
+    response is not truncated. Oversized documents get a batch of their own.
+    """
+    batches: List[List[Dict[str, str]]] = []
+    current: List[Dict[str, str]] = []
+    current_tokens = 0
+    current_output_tokens = 0
+    for doc in docs:
+        tokens = _estimate_tokens(doc["content"])
+        output_tokens = int(tokens * BATCH_OUTPUT_EXPANSION) + BATCH_OUTPUT_OVERHEAD_TOKENS
+        if current and (
+            len(current) >= BATCH_MAX_DOCS
+            or current_tokens + tokens > BATCH_MAX_INPUT_TOKENS
+            or current_output_tokens + output_tokens > BATCH_MAX_OUTPUT_TOKENS
+        ):
+            batches.append(current)
+            current, current_tokens, current_output_tokens = [], 0, 0
+        current.append(doc)
+        current_tokens += tokens
+        current_output_tokens += output_tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
 async def clean_all_documents(
     directory: str = "scraped_docs",
     model: str = "gpt-4o",
     force: bool = False,
-    max_concurrent: int = 3
+    max_concurrent: int = 16
 ) -> Dict[str, bool]:
     """
     Clean all documents in a directory.
     
+    Short documents are packed several to a request (see _plan_batches).
+    
     Args:
         directory: Directory containing documents
         model: OpenAI model to use
         force: If True, clean all files regardless of heuristics
-        max_concurrent: Maximum concurrent cleaning operations
+        max_concurrent: Maximum concurrent cleaning operations (LLM requests in flight)
     
     Returns:
         Dictionary mapping filepaths to success status
@@ -299,16 +649,41 @@ async def clean_all_documents(
     
     logger.info("cleaning_batch_started", total_files=len(txt_files), directory=directory)
     
-    semaphore = asyncio.Semaphore(max_concurrent)
     results = {}
+    docs = []
+    for filepath in txt_files:
+        try:
+            doc = await asyncio.to_thread(_read_document, filepath)
+            needs_llm = await asyncio.to_thread(_apply_rules, doc, force)
+        except Exception as e:
+            logger.error("clean_document_error", filepath=str(filepath), error=str(e))
+            results[str(filepath)] = False
+            continue
+        if needs_llm:
+            docs.append(doc)
+        else:
+            results[str(filepath)] = True
     
-    async def clean_with_limit(filepath):
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def clean_with_limit(batch):
         async with semaphore:
-            result = await clean_document_file(str(filepath), model=model, force=force)
-            results[str(filepath)] = result is not None
-            return result
+            cleaned = await asyncio.to_thread(clean_batch_with_llm, batch, model)
+        for doc, cleaned_content in zip(batch, cleaned):
+            try:
+                if not cleaned_content:
+                    # Keep what the rules already removed
+                    logger.warning("llm_cleaning_failed", filepath=doc["path"])
+                    await asyncio.to_thread(_write_rule_cleaned, doc)
+                else:
+                    await asyncio.to_thread(_write_cleaned_document, doc, cleaned_content, model)
+                    logger.info("cleaning_complete", filepath=doc["path"])
+                results[doc["path"]] = True
+            except Exception as e:
+                logger.error("clean_document_error", filepath=doc["path"], error=str(e))
+                results[doc["path"]] = False
     
-    tasks = [clean_with_limit(f) for f in txt_files]
+    tasks = [clean_with_limit(batch) for batch in _plan_batches(docs)]
     await asyncio.gather(*tasks, return_exceptions=True)
     
     successful = sum(1 for v in results.values() if v)
@@ -348,6 +723,12 @@ if __name__ == "__main__":
             action="store_true",
             help="Clean all files, even if heuristics suggest they don't need cleaning"
         )
+        parser.add_argument(
+            "--max-concurrent",
+            type=int,
+            default=16,
+            help="Maximum concurrent LLM requests (default: 16)"
+        )
         parser.add_argument(
             "--file",
             help="Clean a single file instead of all files in directory"
@@ -366,7 +747,8 @@ if __name__ == "__main__":
             results = await clean_all_documents(
                 directory=args.directory,
                 model=args.model,
-                force=args.force
+                force=args.force,
+                max_concurrent=args.max_concurrent
             )
             successful = sum(1 for v in results.values() if v)
             total = len(results)
@@ -1,19 +1,29 @@
 """
 Hierarchical HTML content extractor that preserves structure and converts to markdown.
 Removes navigation elements at HTML level for cleaner output.
+
+Pages are parsed and walked directly with lxml, which keeps tree traversal in C.
+BeautifulSoup is only used as a fallback when lxml cannot parse the document.
 """
+import io
+import os
 import sys
 import re
-from typing import Dict, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 from bs4 import BeautifulSoup, Tag, NavigableString
+import soupsieve
+import lxml.html
+from lxml import etree
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from utils.logger import get_logger
+from utils.logger import get_logger, is_debug_enabled
 
 logger = get_logger(__name__)
 
@@ -60,6 +70,61 @@ NAVIGATION_CLASSES = [
     'footer-links',
 ]
 
+# Text that marks a short element as navigation (e.g. "Jump to", "Skip to content")
+NAVIGATION_TEXT_PATTERNS = [
+    r'^jump to',
+    r'^skip to',
+    r'^find anz',
+    r'^support centre',
+    r'^top$',
+    r'^back to top',
+]
+
+NON_CONTENT_TAGS = ['script', 'style', 'noscript', 'iframe', 'embed', 'object']
+
+# All navigation selectors as one Soup Sieve pattern, so the BeautifulSoup
+# fallback walks the tree once instead of once per selector
+try:
+    _NAV_SELECTOR = soupsieve.compile(', '.join(NAVIGATION_SELECTORS))
+except soupsieve.SelectorSyntaxError:
+    _NAV_SELECTOR = None
+
+# lxml equivalents of the selectors above, evaluated in a single XPath query.
+# Every class selector is a substring of a NAVIGATION_CLASSES entry, so one
+# case-insensitive class regex covers both lists.
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+_NAV_CLASS_PATTERN = '|'.join(NAVIGATION_CLASSES)
+_NON_CONTENT_XPATH = etree.XPath(' | '.join(f'//{tag}' for tag in NON_CONTENT_TAGS))
+_NAV_XPATH = etree.XPath(
+    "//nav | //header | //footer | //aside"
+    " | //*[@role='navigation' or @role='banner' or @role='contentinfo' or @role='complementary']"
+    f" | //*[re:test(@class, '{_NAV_CLASS_PATTERN}', 'i')]"
+    " | //*[re:test(@aria-label, 'navigation|menu', 'i')]",
+    namespaces=_XPATH_NS,
+)
+_NAV_CLASS_XPATH = etree.XPath(
+    f"//*[re:test(@class, '{_NAV_CLASS_PATTERN}', 'i')]", namespaces=_XPATH_NS
+)
+_NAV_CLASS_RE = re.compile(_NAV_CLASS_PATTERN, re.I)
+_NAV_TEXT_RE = re.compile('|'.join(NAVIGATION_TEXT_PATTERNS), re.I)
+_TEXT_XPATH = etree.XPath('//text()')
+# Markdown clean-up: drop spaces/tabs around newlines, then collapse the
+# remaining runs to one space (same result as collapsing first and then
+# trimming around newlines, in two passes instead of three)
+_NEWLINE_PADDING_RE = re.compile(r'[ \t]*\n[ \t]*')
+_SPACE_RUN_RE = re.compile(r'[ \t]{2,}|\t')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+_parser_local = threading.local()
+_REMOVED_TAG = 'removed'
+
+_CONTENT_DIV_BY_CLASS_XPATH = etree.XPath(
+    "//div[re:test(@class, 'content|main|article', 'i')]", namespaces=_XPATH_NS
+)
+_CONTENT_DIV_BY_ID_XPATH = etree.XPath(
+    "//div[re:test(@id, 'content|main|article', 'i')]", namespaces=_XPATH_NS
+)
+
 
 def remove_navigation_elements(soup: BeautifulSoup) -> None:
     """
@@ -70,63 +135,63 @@ def remove_navigation_elements(soup: BeautifulSoup) -> None:
         soup: BeautifulSoup object to clean
     """
     # Remove script, style, and other non-content elements first
-    for tag in soup(['script', 'style', 'noscript', 'iframe', 'embed', 'object']):
+    for tag in soup(NON_CONTENT_TAGS):
         tag.decompose()
     
     # Remove standard navigation elements (but not main/article/content divs)
-    for selector in NAVIGATION_SELECTORS:
-        for element in soup.select(selector):
-            # Don't remove if it's a main content area
-            if element.name in ['main', 'article']:
+    if _NAV_SELECTOR is not None:
+        nav_elements = _NAV_SELECTOR.select(soup)
+    else:
+        nav_elements = [element for selector in NAVIGATION_SELECTORS for element in soup.select(selector)]
+    for element in nav_elements:
+        # Already destroyed along with a removed ancestor
+        if element.decomposed:
+            continue
+        # Don't remove if it's a main content area
+        if element.name in ['main', 'article']:
+            continue
+        # Don't remove divs that are main content areas
+        if element.name == 'div':
+            classes = ' '.join(element.get('class', [])).lower()
+            ids = element.get('id', '').lower()
+            if 'content' in classes or 'content' in ids or 'main' in classes or 'main' in ids:
                 continue
-            # Don't remove divs that are main content areas
-            if element.name == 'div':
-                classes = ' '.join(element.get('class', [])).lower()
-                ids = element.get('id', '').lower()
-                if 'content' in classes or 'content' in ids or 'main' in classes or 'main' in ids:
-                    continue
-            element.decompose()
+        element.decompose()
     
     # Remove elements with navigation-related classes (but preserve content areas)
-    for class_name in NAVIGATION_CLASSES:
-        for element in soup.find_all(class_=re.compile(class_name, re.I)):
-            # Skip main content areas
-            if element.name in ['main', 'article']:
+    for element in soup.find_all(class_=_NAV_CLASS_RE):
+        if element.decomposed:
+            continue
+        # Skip main content areas
+        if element.name in ['main', 'article']:
+            continue
+        if element.name == 'div':
+            classes = ' '.join(element.get('class', [])).lower()
+            if 'content' in classes or 'main' in classes:
                 continue
-            if element.name == 'div':
-                classes = ' '.join(element.get('class', [])).lower()
-                if 'content' in classes or 'main' in classes:
-                    continue
-            element.decompose()
+        element.decompose()
     
     # Remove elements that are likely navigation based on content
     # (e.g., links that say "Jump to", "Skip to content", etc.)
     # But only if they're not inside main content areas
-    navigation_text_patterns = [
-        r'^jump to',
-        r'^skip to',
-        r'^find anz',
-        r'^support centre',
-        r'^top$',
-        r'^back to top',
-    ]
-    
-    for pattern in navigation_text_patterns:
-        for element in soup.find_all(text=re.compile(pattern, re.I)):
-            parent = element.parent
-            if not parent:
+    for element in soup.find_all(string=_NAV_TEXT_RE):
+        # Strings inside an element removed earlier in this pass are destroyed
+        if element.decomposed:
+            continue
+        parent = element.parent
+        if not parent:
+            continue
+        
+        # Don't remove if inside main/article
+        if parent.find_parent(['main', 'article']):
+            # Only remove if it's clearly navigation (link/button)
+            if parent.name not in ['a', 'button']:
                 continue
-            
-            # Don't remove if inside main/article
-            if parent.find_parent(['main', 'article']):
-                # Only remove if it's clearly navigation (link/button)
-                if parent.name not in ['a', 'button']:
-                    continue
-            
-            if parent.name in ['a', 'button', 'div', 'span']:
-                # Only remove if it's a link or button, or very short text
-                if parent.name in ['a', 'button'] or len(element.strip()) < 20:
-                    parent.decompose()
+        
+        if parent.name in ['a', 'button', 'div', 'span']:
+            # Only remove if it's a link or button, or very short text
+            if parent.name in ['a', 'button'] or len(element.strip()) < 20:
+                parent.decompose()
 
 
 def convert_heading_to_markdown(element: Tag) -> str:
@@ -201,69 +266,80 @@ def convert_link_to_markdown(element: Tag) -> str:
     return text
 
 
-def extract_hierarchical_content(element: Tag, level: int = 0) -> str:
+def _write_part(buf: io.StringIO, part: str, separate: bool) -> None:
+    """Write one content part, space-separated from the previous part at its level."""
+    if separate:
+        buf.write(' ')
+    buf.write(part)
+
+
+def extract_hierarchical_content(element: Tag, buf: io.StringIO, level: int = 0) -> bool:
     """
-    Recursively extract content from HTML element, preserving hierarchy.
+    Recursively write content from HTML element to buf, preserving hierarchy.
+    
+    Parts are space-separated; the caller normalizes whitespace once over the
+    whole buffer.
     
     Args:
         element: BeautifulSoup element to extract from
+        buf: Buffer the markdown-formatted content is written to
         level: Current nesting level
     
     Returns:
-        Markdown-formatted content string
+        True if any non-whitespace content was written
     """
-    content_parts = []
+    wrote_part = False
+    wrote_text = False
     
     for child in element.children:
+        # None means recurse into the child
+        part = ''
+        
         if isinstance(child, NavigableString):
             # Plain text node
-            text = str(child).strip()
-            if text:
-                content_parts.append(text)
+            part = str(child).strip()
         elif isinstance(child, Tag):
             tag_name = child.name.lower()
             
             # Handle headings
             if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                content_parts.append(convert_heading_to_markdown(child))
+                part = convert_heading_to_markdown(child)
             
             # Handle lists
             elif tag_name in ['ul', 'ol']:
-                content_parts.append(convert_list_to_markdown(child))
+                part = convert_list_to_markdown(child)
             
             # Handle list items (already handled by parent list, but catch any strays)
             elif tag_name == 'li':
                 text = child.get_text(separator=' ', strip=True)
                 if text:
-                    content_parts.append(f"- {text}\n")
+                    part = f"- {text}\n"
             
             # Handle links
             elif tag_name == 'a':
-                link_text = convert_link_to_markdown(child)
-                if link_text:
-                    content_parts.append(link_text)
+                part = convert_link_to_markdown(child)
             
             # Handle paragraphs
             elif tag_name == 'p':
                 text = child.get_text(separator=' ', strip=True)
                 if text:
-                    content_parts.append(f"{text}\n")
+                    part = f"{text}\n"
             
             # Handle strong/bold
             elif tag_name in ['strong', 'b']:
                 text = child.get_text(strip=True)
                 if text:
-                    content_parts.append(f"**{text}**")
+                    part = f"**{text}**"
             
             # Handle emphasis/italic
             elif tag_name in ['em', 'i']:
                 text = child.get_text(strip=True)
                 if text:
-                    content_parts.append(f"*{text}*")
+                    part = f"*{text}*"
             
             # Handle line breaks
             elif tag_name == 'br':
-                content_parts.append('\n')
+                part = '\n'
             
             # Handle divs, sections - recursively process
             elif tag_name in ['div', 'section', 'article', 'main']:
@@ -271,27 +347,327 @@ def extract_hierarchical_content(element: Tag, level: int = 0) -> str:
                 classes = ' '.join(child.get('class', []))
                 if any(nav_class in classes.lower() for nav_class in NAVIGATION_CLASSES):
                     continue
-                
-                nested_content = extract_hierarchical_content(child, level + 1)
-                if nested_content.strip():
-                    content_parts.append(nested_content)
+                part = None
             
             # For other elements, just extract text recursively
             else:
-                nested_content = extract_hierarchical_content(child, level + 1)
-                if nested_content.strip():
-                    content_parts.append(nested_content)
+                part = None
+        
+        if part is None:
+            # Roll back the separator and any whitespace if the child had no content
+            mark = buf.tell()
+            _write_part(buf, '', wrote_part)
+            if extract_hierarchical_content(child, buf, level + 1):
+                wrote_part = wrote_text = True
+            else:
+                buf.seek(mark)
+                buf.truncate()
+        elif part:
+            _write_part(buf, part, wrote_part)
+            wrote_part = True
+            wrote_text = wrote_text or not part.isspace()
+    
+    return wrote_text
+
+
+def _is_content_area(element: etree._Element, check_id: bool = True) -> bool:
+    """
+    Whether an lxml element is a main content area that must not be removed.
+    
+    Divs are recognised by class, and also by id unless check_id is False
+    (the navigation class pass only looks at the class, like the BS4 pass).
+    """
+    if element.tag in ('main', 'article'):
+        return True
+    if element.tag == 'div':
+        markers = element.get('class', '')
+        if check_id:
+            markers = f"{markers} {element.get('id', '')}"
+        markers = markers.lower()
+        return 'content' in markers or 'main' in markers
+    return False
+
+
+def _drop(element: etree._Element) -> None:
+    """
+    Empty element in place, keeping its tail text.
+    
+    drop_tree() would merge the tail into the preceding text node, gluing
+    words together that BeautifulSoup keeps as separate strings. The emptied
+    element is renamed so the walker treats it as a content-free container.
+    """
+    element.clear(keep_tail=True)
+    element.tag = _REMOVED_TAG
+
+
+def remove_navigation_elements_lxml(root: etree._Element) -> None:
+    """
+    Remove navigation-related elements from an lxml document.
+    Mirrors remove_navigation_elements but runs each pass as one XPath query.
+    
+    Args:
+        root: Document root returned by lxml.html.document_fromstring
+    """
+    for element in _NON_CONTENT_XPATH(root):
+        _drop(element)
+    
+    for element in _NAV_XPATH(root):
+        if not _is_content_area(element):
+            _drop(element)
     
-    # Join parts - use space for inline elements, preserve newlines
-    if not content_parts:
-        return ''
+    for element in _NAV_CLASS_XPATH(root):
+        if not _is_content_area(element, check_id=False):
+            _drop(element)
     
-    result = ' '.join(content_parts)
-    # Clean up: normalize whitespace but preserve intentional newlines
-    result = re.sub(r'[ \t]+', ' ', result)  # Multiple spaces/tabs to single space
-    result = re.sub(r' \n', '\n', result)  # Space before newline
-    result = re.sub(r'\n ', '\n', result)  # Space after newline
-    return result
+    for text in _TEXT_XPATH(root):
+        if not _NAV_TEXT_RE.search(text):
+            continue
+        parent = text.getparent()
+        if text.is_tail:
+            parent = parent.getparent()
+        if parent is None or not isinstance(parent.tag, str):
+            continue
+        
+        # Don't remove if inside main/article, unless it's a link/button
+        if next(parent.iterancestors('main', 'article'), None) is not None:
+            if parent.tag not in ['a', 'button']:
+                continue
+        
+        if parent.tag in ['a', 'button'] or (parent.tag in ['div', 'span'] and len(text.strip()) < 20):
+            _drop(parent)
+
+
+def _lxml_text(element: etree._Element, separator: str = '') -> str:
+    """lxml equivalent of BeautifulSoup's get_text(separator, strip=True)."""
+    return separator.join(s.strip() for s in element.itertext() if s.strip())
+
+
+def _emit_heading(element: etree._Element, level: int) -> str:
+    return f"{'#' * int(element.tag[1])} {_lxml_text(element)}\n"
+
+
+def _emit_list(element: etree._Element, level: int) -> str:
+    markdown_lines = []
+    for item in element:
+        if item.tag == 'li':
+            text = ' '.join(_lxml_text(item, ' ').split())
+            markdown_lines.append(f"- {text}")
+    return '\n'.join(markdown_lines) + '\n'
+
+
+def _emit_list_item(element: etree._Element, level: int) -> str:
+    text = _lxml_text(element, ' ')
+    return f"- {text}\n" if text else ''
+
+
+def _emit_link(element: etree._Element, level: int) -> str:
+    text = _lxml_text(element)
+    href = element.get('href', '')
+    if href.startswith('http'):
+        return f"[{text}]({href})"
+    return text
+
+
+def _emit_paragraph(element: etree._Element, level: int) -> str:
+    text = _lxml_text(element, ' ')
+    return f"{text}\n" if text else ''
+
+
+def _emit_bold(element: etree._Element, level: int) -> str:
+    text = _lxml_text(element)
+    return f"**{text}**" if text else ''
+
+
+def _emit_italic(element: etree._Element, level: int) -> str:
+    text = _lxml_text(element)
+    return f"*{text}*" if text else ''
+
+
+def _emit_break(element: etree._Element, level: int) -> str:
+    return '\n'
+
+
+_LXML_EMITTERS: Dict[str, Callable[[etree._Element, int], str]] = {
+    **{f'h{n}': _emit_heading for n in range(1, 7)},
+    'ul': _emit_list,
+    'ol': _emit_list,
+    'li': _emit_list_item,
+    'a': _emit_link,
+    'p': _emit_paragraph,
+    'strong': _emit_bold,
+    'b': _emit_bold,
+    'em': _emit_italic,
+    'i': _emit_italic,
+    'br': _emit_break,
+}
+
+# Recursed into unless their class marks them as navigation
+_CONTAINER_TAGS = frozenset(['div', 'section', 'article', 'main'])
+
+
+def extract_hierarchical_content_lxml(element: etree._Element, buf: io.StringIO, level: int = 0) -> bool:
+    """
+    Recursively write content from an lxml element to buf, preserving hierarchy.
+    Produces the same markdown as extract_hierarchical_content.
+    
+    Args:
+        element: lxml element to extract from
+        buf: Buffer the markdown-formatted content is written to
+        level: Current nesting level
+    
+    Returns:
+        True if any non-whitespace content was written
+    """
+    wrote_part = False
+    wrote_text = False
+    
+    text = (element.text or '').strip()
+    if text:
+        buf.write(text)
+        wrote_part = wrote_text = True
+    
+    for child in element:
+        tag = child.tag
+        # Comments and processing instructions have non-string tags
+        if isinstance(tag, str):
+            emit = _LXML_EMITTERS.get(tag)
+            if emit is not None:
+                part = emit(child, level)
+                if part:
+                    _write_part(buf, part, wrote_part)
+                    wrote_part = True
+                    wrote_text = wrote_text or not part.isspace()
+            elif tag not in _CONTAINER_TAGS or not any(
+                nav_class in child.get('class', '').lower() for nav_class in NAVIGATION_CLASSES
+            ):
+                # Roll back the separator and any whitespace if the child had no content
+                mark = buf.tell()
+                _write_part(buf, '', wrote_part)
+                if extract_hierarchical_content_lxml(child, buf, level + 1):
+                    wrote_part = wrote_text = True
+                else:
+                    buf.seek(mark)
+                    buf.truncate()
+        
+        tail = (child.tail or '').strip()
+        if tail:
+            _write_part(buf, tail, wrote_part)
+            wrote_part = wrote_text = True
+    
+    return wrote_text
+
+
+def _find_main_content_lxml(root: etree._Element) -> Optional[etree._Element]:
+    """Find the main content area, in the same order of preference as the BS4 path."""
+    main_content = root.find('.//main')
+    if main_content is None:
+        main_content = root.find('.//article')
+    if main_content is None:
+        main_content = next(iter(_CONTENT_DIV_BY_CLASS_XPATH(root)), None)
+    if main_content is None:
+        main_content = next(iter(_CONTENT_DIV_BY_ID_XPATH(root)), None)
+    return main_content
+
+
+def get_html_parser() -> lxml.html.HTMLParser:
+    """
+    Return this thread's lxml HTML parser, creating it on first use.
+    
+    lxml parsers are not thread-safe, so one is kept per thread. Comments and
+    processing instructions are dropped at parse time, and huge_tree lifts
+    libxml2's size limits that otherwise reject very large pages.
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(recover=True, huge_tree=True, remove_comments=True, remove_pis=True)
+        _parser_local.parser = parser
+    return parser
+
+
+def _extract_with_lxml(html: str, url: str) -> Tuple[str, str]:
+    """
+    Extract title and markdown content by walking the lxml tree directly.
+    
+    Raises:
+        etree.LxmlError, ValueError: If lxml cannot parse the document
+    """
+    root = lxml.html.document_fromstring(html, parser=get_html_parser())
+    
+    title_tag = root.find('.//title')
+    title = _lxml_text(title_tag) if title_tag is not None else "Untitled"
+    
+    # Find main content BEFORE removing navigation, then check it survived
+    main_content = _find_main_content_lxml(root)
+    remove_navigation_elements_lxml(root)
+    
+    debug = is_debug_enabled(logger)
+    buf = io.StringIO()
+    # Navigation removal may have emptied main_content or one of its ancestors,
+    # which detaches it from the document root. The ancestor walk is O(depth),
+    # not a scan of the document.
+    if (
+        main_content is not None
+        and main_content.tag != _REMOVED_TAG
+        and any(a is root for a in main_content.iterancestors())
+    ):
+        if debug:
+            logger.debug("found_main_content", url=url, tag=main_content.tag)
+        extract_hierarchical_content_lxml(main_content, buf)
+    else:
+        if debug:
+            logger.debug("main_content_not_found_using_body", url=url)
+        body = root.find('body')
+        if body is not None:
+            extract_hierarchical_content_lxml(body, buf)
+        else:
+            if debug:
+                logger.debug("body_not_found_using_soup", url=url)
+            extract_hierarchical_content_lxml(root, buf)
+    return title, buf.getvalue()
+
+
+def _extract_with_bs4(html: str, url: str) -> Tuple[str, str]:
+    """Extract title and markdown content with BeautifulSoup (fallback path)."""
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Extract title
+    title_tag = soup.find('title')
+    title = title_tag.get_text(strip=True) if title_tag else "Untitled"
+    
+    # Try to find main content area BEFORE removing navigation
+    # (so we can target removal more precisely)
+    main_content = (
+        soup.find('main') or
+        soup.find('article') or
+        soup.find('div', class_=re.compile('content|main|article', re.I)) or
+        soup.find('div', id=re.compile('content|main|article', re.I))
+    )
+    
+    # Remove navigation elements at HTML level
+    remove_navigation_elements(soup)
+    
+    debug = is_debug_enabled(logger)
+    buf = io.StringIO()
+    # Navigation removal may have decomposed main_content (directly or via an ancestor)
+    if main_content is not None and not main_content.decomposed and main_content.parent is not None:
+        # Extract hierarchical content as markdown
+        if debug:
+            logger.debug("found_main_content", url=url, tag=main_content.name)
+        extract_hierarchical_content(main_content, buf)
+    else:
+        # Fallback: extract from body, but still preserve hierarchy
+        if debug:
+            logger.debug("main_content_not_found_using_body", url=url)
+        body = soup.find('body')
+        if body:
+            extract_hierarchical_content(body, buf)
+        else:
+            # Last resort: convert entire document
+            if debug:
+                logger.debug("body_not_found_using_soup", url=url)
+            extract_hierarchical_content(soup, buf)
+    
+    return title, buf.getvalue()
 
 
 def extract_content_hierarchical(html: str, url: str) -> Dict[str, Optional[str]]:
@@ -306,60 +682,18 @@ def extract_content_hierarchical(html: str, url: str) -> Dict[str, Optional[str]
         Dictionary with title, content (markdown), url
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Extract title
-        title_tag = soup.find('title')
-        title = title_tag.get_text(strip=True) if title_tag else "Untitled"
-        
-        # Try to find main content area BEFORE removing navigation
-        # (so we can target removal more precisely)
-        main_content = (
-            soup.find('main') or
-            soup.find('article') or
-            soup.find('div', class_=re.compile('content|main|article', re.I)) or
-            soup.find('div', id=re.compile('content|main|article', re.I))
-        )
-        
-        # Remove navigation elements at HTML level
-        remove_navigation_elements(soup)
-        
-        # If main_content was found, check if it still exists after nav removal
-        if main_content and main_content in soup.descendants:
-            # Extract hierarchical content as markdown
-            logger.debug("found_main_content", url=url, tag=main_content.name)
-            content = extract_hierarchical_content(main_content)
-        elif main_content:
-            # main_content reference might be stale, find it again
-            main_content = (
-                soup.find('main') or
-                soup.find('article') or
-                soup.find('div', class_=re.compile('content|main|article', re.I)) or
-                soup.find('div', id=re.compile('content|main|article', re.I))
-            )
-            if main_content:
-                content = extract_hierarchical_content(main_content)
-            else:
-                # Fallback: extract from body
-                body = soup.find('body')
-                if body:
-                    content = extract_hierarchical_content(body)
-                else:
-                    content = extract_hierarchical_content(soup)
-        else:
-            # Fallback: extract from body, but still preserve hierarchy
-            logger.debug("main_content_not_found_using_body", url=url)
-            body = soup.find('body')
-            if body:
-                content = extract_hierarchical_content(body)
-            else:
-                # Last resort: convert entire document
-                logger.debug("body_not_found_using_soup", url=url)
-                content = extract_hierarchical_content(soup)
+        try:
+            title, content = _extract_with_lxml(html, url)
+        except (etree.LxmlError, ValueError) as e:
+            logger.warning("lxml_extraction_failed_using_bs4", url=url, error=str(e))
+            title, content = _extract_with_bs4(html, url)
         
         # Clean up content
+        # Normalize whitespace but preserve intentional newlines
+        content = _NEWLINE_PADDING_RE.sub('\n', content)
+        content = _SPACE_RUN_RE.sub(' ', content)
         # Remove excessive blank lines
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _BLANK_LINES_RE.sub('\n\n', content)
         # Remove leading/trailing whitespace
         content = content.strip()
         
@@ -383,3 +717,71 @@ def extract_content_hierarchical(html: str, url: str) -> Dict[str, Optional[str]
             "content": None,
             "url": url
         }
+
+
+def _init_extraction_worker() -> None:
+    """Process pool initializer: build the worker's lxml parser before the first page."""
+    get_html_parser()
+
+
+def create_extraction_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for CPU-bound HTML extraction.
+    
+    Extraction is pure Python tree walking and regex work, so threads would
+    serialize on the GIL; separate processes use every core.
+    
+    Args:
+        max_workers: Number of worker processes (defaults to os.cpu_count())
+    
+    Returns:
+        ProcessPoolExecutor to submit extract_content_hierarchical calls to
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_extraction_worker,
+    )
+
+
+def extract_corpus(
+    html_items: Iterable[Tuple[str, str]],
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Extract many pages in parallel across worker processes.
+    
+    Args:
+        html_items: (html, url) pairs
+        max_workers: Number of worker processes (defaults to os.cpu_count())
+    
+    Returns:
+        Extraction results in the same order as html_items
+    """
+    items = list(html_items)
+    if not items:
+        return []
+    
+    results: List[Optional[Dict[str, Optional[str]]]] = [None] * len(items)
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    
+    with create_extraction_pool(workers) as executor:
+        futures = {
+            executor.submit(extract_content_hierarchical, html, url): i
+            for i, (html, url) in enumerate(items)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # extract_content_hierarchical handles its own errors, so this is a worker failure
+                url = items[i][1]
+                logger.error("hierarchical_extraction_error", url=url, error=str(e))
+                results[i] = {
+                    "title": "Error Extracting Content",
+                    "content": None,
+                    "url": url
+                }
+    
+    logger.info("corpus_extracted", pages=len(items), workers=workers)
+    return results
@@ -2,12 +2,18 @@
 import sys
 import re
 import asyncio
+import sqlite3
+import zlib
 import aiohttp
-import time
+from collections import deque
+from contextlib import closing
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Add project root to Python path (for running as script)
 project_root = Path(__file__).parent.parent
@@ -15,11 +21,49 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from config import Config
-from utils.logger import get_logger
-from knowledge.hierarchical_extractor import extract_content_hierarchical
+from utils.logger import get_logger, is_debug_enabled
+from knowledge.hierarchical_extractor import extract_content_hierarchical, create_extraction_pool, get_html_parser
 
 logger = get_logger(__name__)
 
+# Elements removed before plain-text extraction
+NON_CONTENT_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']
+
+_CONTENT_DIV_XPATH = etree.XPath(
+    "//div[re:test(@class, 'content|main|article', 'i')]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'},
+)
+_LINE_PADDING_RE = re.compile(r'\s*\n\s*')
+
+# Connection reuse for scraping: keep connections to the origin alive between
+# requests and cache DNS so only the first request per connection pays for
+# DNS and the TLS handshake
+DNS_CACHE_TTL = 300  # seconds
+KEEPALIVE_TIMEOUT = 60  # seconds
+
+# Characters not allowed in saved document filenames
+_FILENAME_RE = re.compile(r'[^a-z0-9_-]')
+
+# A line of the URL list that is a URL once surrounding whitespace is stripped
+_URL_LINE_RE = re.compile(r'^\s*(https?://(?:.*\S)?)', re.MULTILINE)
+
+# Date values in format_document_for_upload output, which change with the
+# scrape day rather than the page
+_HEADER_DATE_RE = re.compile(r'\A(Title: [^\n]*\nSource URL: [^\n]*\nRetrieval Date: )[^\n]*')
+_FOOTER_DATE_RE = re.compile(r'(\nScraped: )[^\n]*\n\Z')
+
+# Validators and extracted content of previously scraped pages, kept in the
+# output directory so re-scrapes can send conditional GETs
+FETCH_CACHE_FILENAME = ".fetch_cache.sqlite"
+
+# Bump whenever content extraction or its output format changes so cached
+# content produced by the old extractor is not reused
+EXTRACTOR_VERSION = 1
+
+# URLs per fetch cache lookup; keeps each IN list under SQLite's bound
+# parameter limit
+FETCH_CACHE_QUERY_BATCH_SIZE = 500
+
 
 def sanitize_filename(title: str, max_length: int = 100) -> str:
     """
@@ -32,21 +76,12 @@ def sanitize_filename(title: str, max_length: int = 100) -> str:
     Returns:
         Sanitized filename (without extension)
     """
-    # Convert to lowercase
-    sanitized = title.lower()
-    
-    # Replace spaces with underscores
-    sanitized = sanitized.replace(" ", "_")
-    
-    # Remove special characters (keep alphanumeric, underscore, hyphen)
-    sanitized = re.sub(r'[^a-z0-9_-]', '', sanitized)
-    
-    # Limit length
-    if len(sanitized) > max_length:
-        sanitized = sanitized[:max_length]
+    # Lowercase, spaces to underscores, then remove special characters
+    # (keep alphanumeric, underscore, hyphen) with the precompiled pattern
+    sanitized = _FILENAME_RE.sub('', title.lower().replace(" ", "_"))
     
-    # Remove leading/trailing underscores or hyphens
-    sanitized = sanitized.strip('_-')
+    # Limit length, then remove leading/trailing underscores or hyphens
+    sanitized = sanitized[:max_length].strip('_-')
     
     return sanitized if sanitized else "untitled_document"
 
@@ -83,6 +118,16 @@ Scraped: {date}
     return formatted
 
 
+def _url_host(url: str) -> str:
+    """Host part of a URL, lowercased."""
+    return urlparse(url).netloc.lower()
+
+
+def _host_sort_key(url: str) -> Tuple[str, str]:
+    """Sort key ordering URLs by host, then by URL."""
+    return _url_host(url), url
+
+
 def load_urls_from_xml(xml_path: str = "ANZ_web_scrape.xml") -> List[str]:
     """
     Load URLs from ANZ_web_scrape.xml file.
@@ -96,17 +141,13 @@ def load_urls_from_xml(xml_path: str = "ANZ_web_scrape.xml") -> List[str]:
     Returns:
         List of URLs to scrape
     """
-    urls = []
     try:
-        with open(xml_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Check if line is a URL
-                if line.startswith("http://") or line.startswith("https://"):
-                    urls.append(line)
+        # One regex scan over the file finds every URL line (deduplicated by the set)
+        text = Path(xml_path).read_text(encoding="utf-8")
+        unique_urls = set(_URL_LINE_RE.findall(text))
         
-        # Remove duplicates and sort
-        urls = sorted(list(set(urls)))
+        # Group by host so consecutive requests reuse connections
+        urls = sorted(unique_urls, key=_host_sort_key)
         
         logger.info("urls_loaded_from_file", count=len(urls), file=xml_path)
         return urls
@@ -119,10 +160,29 @@ def load_urls_from_xml(xml_path: str = "ANZ_web_scrape.xml") -> List[str]:
         raise
 
 
+def decode_body(raw: bytes, charset: Optional[str]) -> str:
+    """
+    Decode a response body, assuming UTF-8 when no (or an unknown) charset is declared.
+    
+    Args:
+        raw: Response body bytes
+        charset: Charset from the Content-Type header, if any
+    
+    Returns:
+        Decoded text; undecodable bytes are replaced rather than raising
+    """
+    try:
+        return raw.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
+
+
 async def fetch_url(
     session: aiohttp.ClientSession,
     url: str,
-    timeout: int = 30
+    timeout: int = 30,
+    headers: Optional[Dict[str, str]] = None,
+    decode: bool = True
 ) -> Optional[Dict[str, Any]]:
     """
     Fetch a single URL with timeout handling.
@@ -131,29 +191,48 @@ async def fetch_url(
         session: aiohttp session
         url: URL to fetch
         timeout: Timeout in seconds
+        headers: Extra request headers (e.g. conditional GET validators)
+        decode: Decode the body to str; with False content is the raw bytes,
+            to be decoded later with decode_body and the returned charset
     
     Returns:
-        Dictionary with url, content, status, or None on failure
+        Dictionary with url, content, status, charset, etag, last_modified, or
+        None on failure. A 304 Not Modified response returns content None.
     """
-    start_time = time.time()
+    # Monotonic event loop clock; only timed when the result is logged
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-            if response.status == 200:
-                content = await response.text()
-                processing_time = (time.time() - start_time) * 1000
-                logger.info(
-                    "url_fetched",
-                    url=url,
-                    status=response.status,
-                    processing_time_ms=processing_time
-                )
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status == 304:
+                logger.debug("url_not_modified", url=url)
                 return {
                     "url": url,
-                    "content": content,
+                    "content": None,
                     "status": response.status
                 }
+            elif response.status == 200:
+                # Decode with the declared charset; response.text() would run
+                # charset detection over the whole body when none is declared
+                body = await response.read()
+                content = decode_body(body, response.charset) if decode else body
+                if is_debug_enabled(logger):
+                    logger.debug(
+                        "url_fetched",
+                        url=url,
+                        status=response.status,
+                        processing_time_ms=(loop.time() - start_time) * 1000
+                    )
+                return {
+                    "url": url,
+                    "content": content,
+                    "status": response.status,
+                    "charset": response.charset,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified")
+                }
             else:
-                processing_time = (time.time() - start_time) * 1000
+                processing_time = (loop.time() - start_time) * 1000
                 logger.warning(
                     "url_fetch_failed",
                     url=url,
@@ -163,7 +242,7 @@ async def fetch_url(
                 return None
     
     except asyncio.TimeoutError:
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (loop.time() - start_time) * 1000
         logger.error(
             "url_fetch_timeout",
             url=url,
@@ -173,7 +252,7 @@ async def fetch_url(
         return None
     
     except Exception as e:
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (loop.time() - start_time) * 1000
         logger.error(
             "url_fetch_error",
             url=url,
@@ -183,9 +262,80 @@ async def fetch_url(
         return None
 
 
+def _element_text(element: etree._Element) -> str:
+    """lxml equivalent of BeautifulSoup's get_text(separator='\\n', strip=True)."""
+    return '\n'.join(s.strip() for s in element.itertext() if s.strip())
+
+
+def _extract_text_lxml(html: str) -> Tuple[str, str]:
+    """
+    Extract title and plain-text content with lxml.
+    
+    html is already decoded (see decode_body), so the parser never has to
+    sniff the encoding.
+    
+    Raises:
+        etree.LxmlError, ValueError: If lxml cannot parse the document
+    """
+    root = lxml.html.document_fromstring(html, parser=get_html_parser())
+    
+    # Extract title
+    title_tag = root.find('.//title')
+    title = ''.join(s.strip() for s in title_tag.itertext()) if title_tag is not None else "Untitled"
+    
+    # Remove unwanted elements. clear() keeps the tail text as a separate
+    # string, where drop_tree() would glue it onto the preceding text.
+    for element in list(root.iter(*NON_CONTENT_TAGS)):
+        element.clear(keep_tail=True)
+    
+    # Try to find main content area
+    main_content = root.find('.//main')
+    if main_content is None:
+        main_content = root.find('.//article')
+    if main_content is None:
+        main_content = next(iter(_CONTENT_DIV_XPATH(root)), None)
+    if main_content is None:
+        # Fallback: extract from body
+        main_content = root.find('body')
+    
+    return title, _element_text(main_content if main_content is not None else root)
+
+
+def _extract_text_bs4(html: str) -> Tuple[str, str]:
+    """Extract title and plain-text content with BeautifulSoup (fallback path)."""
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Extract title
+    title_tag = soup.find('title')
+    title = title_tag.get_text(strip=True) if title_tag else "Untitled"
+    
+    # Remove unwanted elements
+    for element in soup(NON_CONTENT_TAGS):
+        element.decompose()
+    
+    # Try to find main content area
+    main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile('content|main|article', re.I))
+    
+    if main_content:
+        # Extract text from main content
+        content = main_content.get_text(separator='\n', strip=True)
+    else:
+        # Fallback: extract from body
+        body = soup.find('body')
+        if body:
+            content = body.get_text(separator='\n', strip=True)
+        else:
+            content = soup.get_text(separator='\n', strip=True)
+    
+    return title, content
+
+
 def extract_content(html: str, url: str) -> Dict[str, Optional[str]]:
     """
-    Extract main content from HTML using BeautifulSoup.
+    Extract main content from HTML as plain text.
+    
+    Parses with lxml directly; BeautifulSoup is only used if lxml rejects the
+    document (e.g. a str with an XML encoding declaration).
     
     Args:
         html: HTML content
@@ -195,33 +345,14 @@ def extract_content(html: str, url: str) -> Dict[str, Optional[str]]:
         Dictionary with title, content, url
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Extract title
-        title_tag = soup.find('title')
-        title = title_tag.get_text(strip=True) if title_tag else "Untitled"
+        try:
+            title, content = _extract_text_lxml(html)
+        except (etree.LxmlError, ValueError) as e:
+            logger.warning("lxml_extraction_failed_using_bs4", url=url, error=str(e))
+            title, content = _extract_text_bs4(html)
         
-        # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
-            element.decompose()
-        
-        # Try to find main content area
-        main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile('content|main|article', re.I))
-        
-        if main_content:
-            # Extract text from main content
-            content = main_content.get_text(separator='\n', strip=True)
-        else:
-            # Fallback: extract from body
-            body = soup.find('body')
-            if body:
-                content = body.get_text(separator='\n', strip=True)
-            else:
-                content = soup.get_text(separator='\n', strip=True)
-        
-        # Clean up content (remove excessive whitespace)
-        lines = [line.strip() for line in content.split('\n') if line.strip()]
-        content = '\n'.join(lines)
+        # Clean up content (trim every line and drop blank ones in one pass)
+        content = _LINE_PADDING_RE.sub('\n', content).strip()
         
         return {
             "title": title,
@@ -238,65 +369,289 @@ def extract_content(html: str, url: str) -> Dict[str, Optional[str]]:
         }
 
 
+def _extract_page(body: bytes, charset: Optional[str], url: str) -> Dict[str, Optional[str]]:
+    """Decode a fetched page body and extract its content (runs in an extraction worker)."""
+    return extract_content_hierarchical(decode_body(body, charset), url)
+
+
+class _FetchCache:
+    """
+    SQLite-backed store of HTTP validators and extracted content per URL.
+    
+    Pages served with an ETag or Last-Modified header are recorded after
+    extraction; on the next scrape they are requested conditionally and a
+    304 response reuses the stored content without downloading or parsing.
+    Rows written by a different EXTRACTOR_VERSION are ignored. Content is
+    stored zlib-compressed.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetch_cache ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, title TEXT, content BLOB, version INTEGER)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(fetch_cache)")}
+            if "version" not in columns:
+                # Caches from before versioning; their rows stay unversioned and are never reused
+                conn.execute("ALTER TABLE fetch_cache ADD COLUMN version INTEGER")
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+    
+    def get_many(self, urls: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+        """Return cached pages for the given URLs, keyed by URL."""
+        unique_urls = list(dict.fromkeys(urls))
+        rows = []
+        with closing(self._connect()) as conn:
+            for i in range(0, len(unique_urls), FETCH_CACHE_QUERY_BATCH_SIZE):
+                batch = unique_urls[i:i + FETCH_CACHE_QUERY_BATCH_SIZE]
+                rows.extend(conn.execute(
+                    "SELECT url, etag, last_modified, title, content FROM fetch_cache "
+                    f"WHERE version = ? AND url IN ({', '.join('?' * len(batch))})",
+                    (EXTRACTOR_VERSION, *batch),
+                ))
+        return {
+            url: {
+                "etag": etag,
+                "last_modified": last_modified,
+                "title": title,
+                "content": zlib.decompress(content).decode("utf-8"),
+            }
+            for url, etag, last_modified, title, content in rows
+        }
+    
+    def set_many(self, pages: List[Dict[str, Optional[str]]]) -> None:
+        """Store validators and extracted content for scraped pages."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO fetch_cache (url, etag, last_modified, title, content, version) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        page["url"],
+                        page["etag"],
+                        page["last_modified"],
+                        page["title"],
+                        zlib.compress(page["content"].encode("utf-8")),
+                        EXTRACTOR_VERSION,
+                    )
+                    for page in pages
+                ]
+            )
+
+
+def _conditional_headers(cached: Dict[str, Optional[str]]) -> Dict[str, str]:
+    """Build conditional GET headers from a cached page's validators."""
+    headers = {}
+    if cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
+    if cached["last_modified"]:
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+class RateLimiter:
+    """Async limiter allowing at most `rate` acquisitions in any `period` seconds."""
+    
+    def __init__(self, rate: int, period: float):
+        """
+        Initialize limiter.
+        
+        Args:
+            rate: Maximum acquisitions per period
+            period: Window length in seconds (<= 0 disables limiting)
+        """
+        self.rate = rate
+        self.period = period
+        self._starts: deque = deque()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until another acquisition fits in the current window."""
+        if self.period <= 0:
+            return
+        # Waiters queue on the lock, so slots are granted in arrival order
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while len(self._starts) >= self.rate:
+                wait = self._starts[0] + self.period - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                else:
+                    self._starts.popleft()
+            self._starts.append(loop.time())
+
+
 async def scrape_urls(
     urls: List[str],
     max_concurrent: int = 5,
     delay_between_batches: float = 1.0,
-    timeout: int = 30
+    timeout: int = 30,
+    cache_path: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Scrape multiple URLs concurrently with rate limiting.
     
+    All URLs are scheduled up front behind one semaphore, so a slow page only
+    holds its own slot instead of stalling a whole batch. Requests are started
+    host by host so pooled keep-alive connections are reused, and request
+    starts are rate limited to max_concurrent per delay_between_batches
+    seconds for each host.
+    
+    With cache_path, pages scraped before are requested conditionally and
+    unchanged pages (304 Not Modified) reuse their stored extracted content.
+    
     Args:
         urls: List of URLs to scrape
         max_concurrent: Maximum concurrent requests
-        delay_between_batches: Delay between batches (seconds)
+        delay_between_batches: Rate limit window (seconds) for max_concurrent request starts
         timeout: Timeout per URL (seconds)
+        cache_path: SQLite file for conditional GET validators (None disables)
     
     Returns:
-        List of scraped documents with metadata
+        List of scraped documents with metadata, in the order of urls
     """
     scraped_docs = []
     retrieval_date = datetime.now().strftime("%Y-%m-%d")
     
-    # Create semaphore for rate limiting
+    # Semaphore bounds requests in flight; the limiters bound each host's request rate
     semaphore = asyncio.Semaphore(max_concurrent)
+    rate_limiters: Dict[str, RateLimiter] = {}
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    
+    fetch_cache = _FetchCache(Path(cache_path)) if cache_path else None
+    cached_pages = await asyncio.to_thread(fetch_cache.get_many, urls) if fetch_cache else {}
+    page_updates = []
+    not_modified = 0
     
     async def fetch_with_semaphore(session: aiohttp.ClientSession, url: str):
+        nonlocal not_modified
+        host = _url_host(url)
+        if host not in rate_limiters:
+            rate_limiters[host] = RateLimiter(max_concurrent, delay_between_batches)
+        cached = cached_pages.get(url)
+        headers = _conditional_headers(cached) if cached else None
         async with semaphore:
-            result = await fetch_url(session, url, timeout)
-            if result and result.get("content"):
-                extracted = extract_content_hierarchical(result["content"], url)
-                if extracted.get("content"):
-                    return {
+            await rate_limiters[host].acquire()
+            result = await fetch_url(session, url, timeout, headers=headers, decode=False)
+        if result and result["status"] == 304 and cached:
+            not_modified += 1
+            return {
+                "title": cached["title"],
+                "url": url,
+                "content": cached["content"],
+                "retrieval_date": retrieval_date
+            }
+        if result and result.get("content"):
+            # CPU-bound decoding and extraction run in worker processes so they
+            # neither block the event loop nor hold a fetch slot; only the raw
+            # bytes are held (and sent to the worker) in this process
+            extracted = await loop.run_in_executor(
+                extraction_pool, _extract_page, result["content"], result.get("charset"), url
+            )
+            if extracted.get("content"):
+                if fetch_cache and (result.get("etag") or result.get("last_modified")):
+                    page_updates.append({
+                        "url": url,
+                        "etag": result.get("etag"),
+                        "last_modified": result.get("last_modified"),
                         "title": extracted["title"],
-                        "url": extracted["url"],
-                        "content": extracted["content"],
-                        "retrieval_date": retrieval_date
-                    }
-            return None
-    
-    async with aiohttp.ClientSession() as session:
-        # Process URLs in batches
-        for i in range(0, len(urls), max_concurrent):
-            batch = urls[i:i + max_concurrent]
-            tasks = [fetch_with_semaphore(session, url) for url in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+                        "content": extracted["content"]
+                    })
+                return {
+                    "title": extracted["title"],
+                    "url": extracted["url"],
+                    "content": extracted["content"],
+                    "retrieval_date": retrieval_date
+                }
+        return None
+    
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrent * 4,
+        limit_per_host=max_concurrent,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    
+    with create_extraction_pool() as extraction_pool:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # The semaphore admits tasks in creation order, so create them host by
+            # host (a stable sort keeps the caller's order within each host)
+            tasks = [
+                asyncio.create_task(fetch_with_semaphore(session, url))
+                for url in sorted(urls, key=_url_host)
+            ]
             
-            for result in results:
-                if isinstance(result, dict) and result:
+            # Handle pages as they finish rather than batch by batch
+            for next_result in asyncio.as_completed(tasks):
+                try:
+                    result = await next_result
+                except Exception as e:
+                    logger.error("url_processing_error", error=str(e))
+                    continue
+                if result:
                     scraped_docs.append(result)
-                elif isinstance(result, Exception):
-                    logger.error("batch_processing_error", error=str(result))
-            
-            # Rate limiting: delay between batches
-            if i + max_concurrent < len(urls):
-                await asyncio.sleep(delay_between_batches)
     
-    logger.info("scraping_complete", total_urls=len(urls), successful=len(scraped_docs))
+    if page_updates:
+        await asyncio.to_thread(fetch_cache.set_many, page_updates)
+    
+    # Completion order is arbitrary; keep output deterministic
+    positions = {url: i for i, url in enumerate(urls)}
+    scraped_docs.sort(key=lambda doc: positions.get(doc["url"], len(positions)))
+    
+    logger.info(
+        "scraping_complete",
+        total_urls=len(urls),
+        successful=len(scraped_docs),
+        not_modified=not_modified,
+        processing_time_ms=(loop.time() - start_time) * 1000
+    )
     return scraped_docs
 
 
+def _utf8_len(text: str) -> int:
+    """UTF-8 byte length of text, without encoding it when it is pure ASCII."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def _without_dates(text: str) -> str:
+    """Formatted document text with the Retrieval Date and Scraped values blanked."""
+    return _FOOTER_DATE_RE.sub(r'\1', _HEADER_DATE_RE.sub(r'\1', text, count=1), count=1)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """
+    Write text to path unless the file already holds that text.
+    
+    Re-scrapes mostly reproduce existing files, and reading one back is
+    cheaper than rewriting it (and keeps its modification time). The
+    Retrieval Date and Scraped lines are ignored in the comparison, so a
+    page re-scraped on a later day is still recognised as unchanged.
+    
+    Args:
+        path: File to write
+        text: Full file content
+    
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if path.stat().st_size == _utf8_len(text):
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                if _without_dates(f.read()) == _without_dates(text):
+                    return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
 def save_document(doc: Dict[str, str], output_dir: str = "scraped_docs") -> Optional[str]:
     """
     Save document to .txt file.
@@ -325,11 +680,11 @@ def save_document(doc: Dict[str, str], output_dir: str = "scraped_docs") -> Opti
             content=doc["content"]
         )
         
-        # Save file (UTF-8 encoding)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(formatted_content)
-        
-        logger.info("document_saved", filename=filename, url=doc["url"])
+        # Save file (UTF-8 encoding), leaving unchanged files untouched
+        if _write_if_changed(filepath, formatted_content):
+            logger.info("document_saved", filename=filename, url=doc["url"])
+        else:
+            logger.info("document_unchanged", filename=filename, url=doc["url"])
         return str(filepath)
     
     except Exception as e:
@@ -363,9 +718,7 @@ def chunk_large_document(
         content=doc["content"]
     )
     
-    content_bytes = formatted_content.encode('utf-8')
-    
-    if len(content_bytes) <= max_chunk_size:
+    if _utf8_len(formatted_content) <= max_chunk_size:
         # No chunking needed
         filepath = save_document(doc, output_dir)
         return [filepath] if filepath else []
@@ -380,8 +733,8 @@ def chunk_large_document(
     current_size = 0
     
     for line in lines:
-        line_bytes = line.encode('utf-8')
-        if current_size + len(line_bytes) > max_chunk_size and current_chunk:
+        line_size = _utf8_len(line)
+        if current_size + line_size > max_chunk_size and current_chunk:
             # Save current chunk
             chunk_doc = {
                 **doc,
@@ -398,15 +751,14 @@ def chunk_large_document(
                 content=chunk_doc["content"]
             )
             
-            with open(chunk_path, "w", encoding="utf-8") as f:
-                f.write(formatted_chunk)
+            _write_if_changed(chunk_path, formatted_chunk)
             
             chunk_paths.append(str(chunk_path))
             current_chunk = []
             current_size = 0
         
         current_chunk.append(line)
-        current_size += len(line_bytes)
+        current_size += line_size
     
     # Save remaining chunk
     if current_chunk:
@@ -425,8 +777,7 @@ def chunk_large_document(
             content=chunk_doc["content"]
         )
         
-        with open(chunk_path, "w", encoding="utf-8") as f:
-            f.write(formatted_chunk)
+        _write_if_changed(chunk_path, formatted_chunk)
         
         chunk_paths.append(str(chunk_path))
     
@@ -434,6 +785,24 @@ def chunk_large_document(
     return chunk_paths
 
 
+def save_scraped_document(doc: Dict[str, str], output_dir: str = "scraped_docs") -> List[str]:
+    """
+    Save a scraped document, splitting it into chunks if it is too large.
+    
+    Args:
+        doc: Document dictionary with title, url, content, retrieval_date
+        output_dir: Output directory for files
+    
+    Returns:
+        List of saved file paths (empty on failure)
+    """
+    # Check if document needs chunking
+    if _utf8_len(doc["content"]) > 500000:  # ~500KB
+        return chunk_large_document(doc, output_dir=output_dir)
+    filepath = save_document(doc, output_dir)
+    return [filepath] if filepath else []
+
+
 async def scrape_and_process_urls(
     xml_path: str = "ANZ_web_scrape.xml",
     output_dir: str = "scraped_docs",
@@ -448,7 +817,7 @@ async def scrape_and_process_urls(
         xml_path: Path to ANZ_web_scrape.xml
         output_dir: Directory to save scraped files
         max_concurrent: Maximum concurrent requests
-        delay_between_batches: Delay between batches (seconds)
+        delay_between_batches: Rate limit window (seconds) for max_concurrent request starts
         timeout: Timeout per URL (defaults to Config.API_TIMEOUT)
     
     Returns:
@@ -469,22 +838,29 @@ async def scrape_and_process_urls(
         urls=urls,
         max_concurrent=max_concurrent,
         delay_between_batches=delay_between_batches,
-        timeout=timeout
+        timeout=timeout,
+        cache_path=str(Path(output_dir) / FETCH_CACHE_FILENAME)
     )
     
-    # Save documents to files
+    # Save documents to files in worker threads so disk writes overlap.
+    # Documents with the same title write the same file, so each title's
+    # documents are saved in order by one worker (the last one wins, as before).
+    title_groups: Dict[str, List[int]] = {}
+    for i, doc in enumerate(scraped_docs):
+        title_groups.setdefault(sanitize_filename(doc["title"]), []).append(i)
+    
+    def save_group(indices: List[int]) -> List[Tuple[int, List[str]]]:
+        return [(i, save_scraped_document(scraped_docs[i], output_dir)) for i in indices]
+    
+    saved_groups = await asyncio.gather(
+        *(asyncio.to_thread(save_group, indices) for indices in title_groups.values())
+    )
+    filepaths_by_doc = dict(pair for group in saved_groups for pair in group)
+    
     processed_docs = []
-    for doc in scraped_docs:
-        # Check if document needs chunking
-        content_bytes = doc["content"].encode('utf-8')
-        if len(content_bytes) > 500000:  # ~500KB
-            filepaths = chunk_large_document(doc, output_dir=output_dir)
-        else:
-            filepath = save_document(doc, output_dir)
-            filepaths = [filepath] if filepath else []
-        
+    for i, doc in enumerate(scraped_docs):
         # Add file paths to document metadata
-        for filepath in filepaths:
+        for filepath in filepaths_by_doc[i]:
             if filepath:
                 processed_docs.append({
                     **doc,
@@ -2,9 +2,12 @@
 Rule-based content cleaner for scraped knowledge base documents.
 Removes navigation elements and artifacts while preserving all factual content.
 """
+import os
 import sys
 import re
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
 # Add project root to Python path (for running as script)
@@ -12,7 +15,7 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from utils.logger import get_logger
+from utils.logger import get_logger, is_debug_enabled
 
 logger = get_logger(__name__)
 
@@ -48,6 +51,18 @@ UNICODE_TO_REMOVE = [
     chr(0x2190),  # Left arrow
 ]
 
+# Precompiled lookups built from the lists above
+_NAV_SET = frozenset(nav.strip().lower() for nav in NAVIGATION_LINES_TO_REMOVE)
+_PHRASES_RE = re.compile('|'.join(PHRASES_TO_REMOVE), re.IGNORECASE)
+_UNICODE_TABLE = str.maketrans('', '', ''.join(UNICODE_TO_REMOVE))
+
+# Metadata header as written by the ingestor, optionally already marked cleaned,
+# followed by the blank line that starts the content
+_HEADER_RE = re.compile(
+    r'Title: ([^\n]*)\nSource URL: ([^\n]*)\nRetrieval Date: ([^\n]*)\n'
+    r'(Content Type: [^\n]*)\n(?:Cleaned: Yes\n)?[^\S\n]*\n'
+)
+
 
 def remove_navigation_lines(lines: List[str]) -> List[str]:
     """
@@ -69,12 +84,7 @@ def remove_navigation_lines(lines: List[str]) -> List[str]:
             continue
         
         # Check if line is only navigation text (case-insensitive)
-        is_navigation = any(
-            nav.strip().lower() == stripped.lower()
-            for nav in NAVIGATION_LINES_TO_REMOVE
-        )
-        
-        if not is_navigation:
+        if stripped.lower() not in _NAV_SET:
             filtered.append(line)
     
     return filtered
@@ -90,13 +100,8 @@ def clean_line_phrases(line: str) -> str:
     Returns:
         Line with phrases removed
     """
-    cleaned = line
-    
     # Remove video-related phrases
-    for phrase in PHRASES_TO_REMOVE:
-        cleaned = re.sub(phrase, '', cleaned, flags=re.IGNORECASE)
-    
-    return cleaned
+    return _PHRASES_RE.sub('', line)
 
 
 def remove_unicode_artifacts(text: str) -> str:
@@ -109,11 +114,8 @@ def remove_unicode_artifacts(text: str) -> str:
     Returns:
         Text with unicode artifacts removed
     """
-    cleaned = text
-    
     # Remove specific unicode characters
-    for char in UNICODE_TO_REMOVE:
-        cleaned = cleaned.replace(char, '')
+    cleaned = text.translate(_UNICODE_TABLE)
     
     # Note: We're NOT removing single-character lines here as they might be meaningful
     # The navigation line removal handles those cases
@@ -166,6 +168,35 @@ def organize_with_headers(lines: List[str]) -> List[str]:
     return organized
 
 
+def _clean_lines(content: str) -> Iterator[str]:
+    """
+    Yield cleaned content lines in one pass over the text.
+    
+    Drops navigation lines, removes phrases and unicode artifacts, and
+    collapses runs of empty lines into a single empty line.
+    
+    Args:
+        content: Raw content to clean
+    
+    Yields:
+        Cleaned lines
+    """
+    prev_blank = False
+    for line in content.split('\n'):
+        if line.strip().lower() in _NAV_SET:
+            continue
+        
+        line = _PHRASES_RE.sub('', line).translate(_UNICODE_TABLE)
+        
+        if not line:
+            if prev_blank:
+                continue
+            prev_blank = True
+        else:
+            prev_blank = False
+        yield line
+
+
 def clean_content_rules(content: str, add_headers: bool = False) -> str:
     """
     Clean content using rule-based approach.
@@ -177,27 +208,14 @@ def clean_content_rules(content: str, add_headers: bool = False) -> str:
     Returns:
         Cleaned content
     """
-    # Split into lines
-    lines = content.split('\n')
-    
-    # Remove navigation lines
-    lines = remove_navigation_lines(lines)
-    
-    # Clean phrases from each line
-    lines = [clean_line_phrases(line) for line in lines]
-    
-    # Rejoin and remove unicode artifacts
-    cleaned = '\n'.join(lines)
-    cleaned = remove_unicode_artifacts(cleaned)
-    
-    # Clean up multiple blank lines
-    cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+    # Filter, clean and collapse blank lines in a single pass
+    lines = list(_clean_lines(content))
     
     # Optionally add headers
     if add_headers:
-        lines = cleaned.split('\n')
         lines = organize_with_headers(lines)
-        cleaned = '\n'.join(lines)
+    
+    cleaned = '\n'.join(lines)
     
     # Final cleanup: remove leading/trailing whitespace
     cleaned = cleaned.strip()
@@ -205,6 +223,100 @@ def clean_content_rules(content: str, add_headers: bool = False) -> str:
     return cleaned
 
 
+def _scan_metadata(lines: List[str]) -> Tuple[List[str], str, List[str]]:
+    """
+    Line-by-line metadata parse for headers that don't match _HEADER_RE.
+    
+    Args:
+        lines: Document lines
+    
+    Returns:
+        Tuple of (metadata lines, source URL, content text)
+    """
+    metadata_lines = []
+    content_start_idx = 0
+    url = ""
+    
+    # Build metadata and find content start
+    for i, line in enumerate(lines):
+        if line.startswith("Title: "):
+            metadata_lines.append(line)
+        elif line.startswith("Source URL: "):
+            url = line.replace("Source URL: ", "").strip()
+            metadata_lines.append(line)
+        elif line.startswith("Retrieval Date: "):
+            metadata_lines.append(line)
+        elif line.startswith("Content Type: "):
+            metadata_lines.append(line)
+            metadata_lines.append("Cleaned: Yes")  # Add cleaned flag
+        elif line.strip() == "" and i >= 4 and content_start_idx == 0:
+            # First empty line after metadata marks content start (line 4 or later)
+            # Make sure we've seen Content Type
+            if any("Content Type:" in ml or "Content Type: " in ml for ml in metadata_lines):
+                content_start_idx = i + 1
+                break  # Stop processing metadata
+    
+    # If we didn't find content start, look for it after Content Type
+    if content_start_idx == 0:
+        for i, line in enumerate(lines):
+            if i > 0 and (lines[i-1].startswith("Content Type:") or lines[i-1].startswith("Content Type: ")) and line.strip() == "":
+                content_start_idx = i + 1
+                break
+    
+    # Get all lines from content start to end
+    if content_start_idx > 0:
+        content_lines = lines[content_start_idx:]
+    else:
+        # Fallback: assume content starts after line 5
+        content_lines = lines[5:]
+    
+    return metadata_lines, url, '\n'.join(content_lines)
+
+
+def _split_footer(body: str) -> Tuple[str, str]:
+    """
+    Split content into main text and footer at the last "---" line.
+    
+    Only the last 10 lines (where the footer typically is) are searched, and
+    they are found with one rsplit instead of splitting the whole body.
+    
+    Args:
+        body: Content text after the metadata header
+    
+    Returns:
+        Tuple of (main content, footer); footer is empty if none was found
+    """
+    tail_lines = body.rsplit('\n', 10)[-10:]
+    end = len(body)
+    for line in reversed(tail_lines):
+        start = end - len(line)
+        if line.strip() == "---":
+            return (body[:start - 1] if start else ""), body[start:]
+        end = start - 1
+    return body, ""
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """
+    Replace a file's content atomically.
+    
+    Writes to a temporary file next to path and renames it over path, so a
+    crash never leaves a truncated document.
+    
+    Args:
+        path: File to replace
+        text: New file content
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def clean_document_file(
     filepath: str,
     add_headers: bool = True,
@@ -231,88 +343,57 @@ def clean_document_file(
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
         
-        # Parse metadata header
-        lines = content.split('\n')
-        metadata_lines = []
-        content_start_idx = 0
-        title = ""
-        url = ""
-        retrieval_date = ""
-        
-        # Build metadata and find content start
-        for i, line in enumerate(lines):
-            if line.startswith("Title: "):
-                title = line.replace("Title: ", "").strip()
-                metadata_lines.append(line)
-            elif line.startswith("Source URL: "):
-                url = line.replace("Source URL: ", "").strip()
-                metadata_lines.append(line)
-            elif line.startswith("Retrieval Date: "):
-                retrieval_date = line.replace("Retrieval Date: ", "").strip()
-                metadata_lines.append(line)
-            elif line.startswith("Content Type: "):
-                metadata_lines.append(line)
-                metadata_lines.append("Cleaned: Yes")  # Add cleaned flag
-            elif line.strip() == "" and i >= 4 and content_start_idx == 0:
-                # First empty line after metadata marks content start (line 4 or later)
-                # Make sure we've seen Content Type
-                if any("Content Type:" in ml or "Content Type: " in ml for ml in metadata_lines):
-                    content_start_idx = i + 1
-                    break  # Stop processing metadata
-        
-        # If we didn't find content start, look for it after Content Type
-        if content_start_idx == 0:
-            for i, line in enumerate(lines):
-                if i > 0 and (lines[i-1].startswith("Content Type:") or lines[i-1].startswith("Content Type: ")) and line.strip() == "":
-                    content_start_idx = i + 1
-                    break
-        
-        # Get all lines from content start to end
-        if content_start_idx > 0:
-            content_lines = lines[content_start_idx:]
+        # Parse metadata header: one regex match for the header written by the
+        # ingestor, a line scan for anything else
+        header = _HEADER_RE.match(content)
+        if header:
+            url = header.group(2).strip()
+            metadata_lines = [
+                "Title: " + header.group(1),
+                "Source URL: " + header.group(2),
+                "Retrieval Date: " + header.group(3),
+                header.group(4),
+                "Cleaned: Yes",  # Add cleaned flag
+            ]
+            body = content[header.end():]
         else:
-            # Fallback: assume content starts after line 5
-            content_lines = lines[5:]
+            metadata_lines, url, body = _scan_metadata(content.split('\n'))
         
-        # Find footer (after "---") - search from the end
-        footer_idx = len(content_lines)
-        # Look for "---" in the last 10 lines (where footer typically is)
-        search_start = max(0, len(content_lines) - 10)
-        for i in range(len(content_lines) - 1, search_start - 1, -1):
-            if i >= 0 and content_lines[i].strip() == "---":
-                footer_idx = i
-                break
+        # Split off the footer (after "---"); everything before it is main content
+        main_content, footer = _split_footer(body)
         
-        # Extract main content (everything before footer)
-        main_content = '\n'.join(content_lines[:footer_idx])
+        debug = is_debug_enabled(logger)
         
         # Debug: Log content length before cleaning
-        logger.debug("content_before_cleaning", length=len(main_content), lines=len(content_lines[:footer_idx]))
+        if debug:
+            logger.debug("content_before_cleaning", length=len(main_content), lines=main_content.count('\n') + 1)
         
         # Clean content
         logger.info("cleaning_started", filepath=filepath, url=url, content_length=len(main_content))
         cleaned_content = clean_content_rules(main_content, add_headers=add_headers)
         
         # Debug: Log content length after cleaning
-        logger.debug("content_after_cleaning", length=len(cleaned_content))
+        if debug:
+            logger.debug("content_after_cleaning", length=len(cleaned_content))
         
         # Backup original if requested
         if backup:
             backup_path = path.with_suffix('.original.txt')
             if not backup_path.exists():
-                with open(backup_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                # Hard link to the original; the cleaned version replaces the
+                # path with a new file, so the link keeps the original content
+                try:
+                    os.link(path, backup_path)
+                except OSError:
+                    with open(backup_path, "w", encoding="utf-8") as f:
+                        f.write(content)
                 logger.info("backup_created", backup_path=str(backup_path))
         
         # Reconstruct document with metadata
-        footer_lines = content_lines[footer_idx:] if footer_idx < len(content_lines) else []
-        footer = '\n'.join(footer_lines)
-        
         formatted = '\n'.join(metadata_lines) + '\n\n' + cleaned_content + '\n\n' + footer
         
         # Write cleaned version
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(formatted)
+        _write_atomic(path, formatted)
         
         logger.info("cleaning_complete", filepath=filepath)
         return str(path)
@@ -325,15 +406,20 @@ def clean_document_file(
 def clean_all_documents(
     directory: str = "scraped_docs",
     add_headers: bool = True,
-    backup: bool = True
+    backup: bool = True,
+    max_workers: Optional[int] = None
 ) -> dict:
     """
     Clean all documents in a directory.
     
+    Files are independent and cleaning is CPU-bound, so they are cleaned in
+    parallel worker processes.
+    
     Args:
         directory: Directory containing documents
         add_headers: Whether to add markdown headers
         backup: Whether to backup original files
+        max_workers: Number of worker processes (defaults to os.cpu_count())
     
     Returns:
         Dictionary mapping filepaths to success status
@@ -349,10 +435,16 @@ def clean_all_documents(
     
     logger.info("cleaning_batch_started", total_files=len(txt_files), directory=directory)
     
-    results = {}
-    for filepath in txt_files:
-        result = clean_document_file(str(filepath), add_headers=add_headers, backup=backup)
-        results[str(filepath)] = result is not None
+    paths = [str(filepath) for filepath in txt_files]
+    clean_file = partial(clean_document_file, add_headers=add_headers, backup=backup)
+    if len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            cleaned = list(executor.map(clean_file, paths, chunksize=4))
+    else:
+        # Not worth starting worker processes for a single file
+        cleaned = [clean_file(path) for path in paths]
+    
+    results = {path: result is not None for path, result in zip(paths, cleaned)}
     
     successful = sum(1 for v in results.values() if v)
     logger.info(
@@ -13,7 +13,7 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from config import Config
-from database.supabase_client import SupabaseClient
+from database.supabase_client import get_db_client
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,7 +24,7 @@ class VectorStoreSetup:
     
     def __init__(self):
         self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
-        self.db_client = SupabaseClient()
+        self.db_client = get_db_client()
         # #region agent log
         import json
         with open('/Users/rahulsapre/playground/anz-conversational-ai-0/.cursor/debug.log', 'a') as f:
@@ -449,6 +449,57 @@ class VectorStoreSetup:
             return None
 
 
+    def register_documents(self, documents: List[Dict[str, Any]]) -> List[str]:
+        """
+        Register many documents in the knowledge_documents table in one request.
+        
+        If the batch insert fails, each document is registered on its own so
+        one bad row does not lose the metadata of the rest; file IDs that
+        still fail are logged.
+        
+        Args:
+            documents: List of dicts with the register_document() fields
+        
+        Returns:
+            List of inserted document IDs
+        """
+        rows = [
+            {
+                "openai_file_id": doc["openai_file_id"],
+                "title": doc["title"],
+                "source_url": doc.get("source_url"),
+                "content_type": doc.get("content_type", "public"),
+                "topic_collection": doc.get("topic_collection"),
+                "metadata": doc.get("metadata") or {}
+            }
+            for doc in documents
+        ]
+        
+        doc_ids = self.db_client.bulk_insert_knowledge_documents(rows)
+        if rows and not doc_ids:
+            logger.warning("bulk_registration_failed_retrying_per_document", requested=len(rows))
+            failed_file_ids = []
+            for row in rows:
+                doc_id = self.register_document(**row)
+                if doc_id:
+                    doc_ids.append(doc_id)
+                else:
+                    failed_file_ids.append(row["openai_file_id"])
+            if failed_file_ids:
+                logger.error(
+                    "documents_registration_failed",
+                    failed=len(failed_file_ids),
+                    file_ids=failed_file_ids
+                )
+        
+        logger.info(
+            "documents_registered",
+            requested=len(rows),
+            registered=len(doc_ids)
+        )
+        return doc_ids
+
+
 def setup_vector_stores(
     customer_file_ids: List[str],
     banker_file_ids: List[str]
@@ -524,6 +575,7 @@ def upload_and_register_documents(
     """
     setup = VectorStoreSetup()
     file_ids = []
+    documents = []
     
     for file_path in file_paths:
         # Upload file
@@ -535,17 +587,19 @@ def upload_and_register_documents(
         # Parse metadata
         metadata = parse_document_metadata(file_path)
         
-        # Register in database
-        setup.register_document(
-            openai_file_id=file_id,
-            title=metadata.get("title") or Path(file_path).stem,
-            source_url=metadata.get("url"),
-            content_type="public",
-            topic_collection=topic_collection
-        )
+        documents.append({
+            "openai_file_id": file_id,
+            "title": metadata.get("title") or Path(file_path).stem,
+            "source_url": metadata.get("url"),
+            "content_type": "public",
+            "topic_collection": topic_collection
+        })
         
         file_ids.append(file_id)
     
+    # Register all uploaded documents in database with one request
+    setup.register_documents(documents)
+    
     logger.info(
         "upload_and_register_complete",
         total_files=len(file_paths),
@@ -4,6 +4,7 @@ Logging service for interaction and API call tracking.
 Implements async, non-blocking logging to Supabase with retry queue.
 """
 import asyncio
+import threading
 import time
 from typing import Optional, Dict, Any, List
 from datetime import datetime
@@ -475,10 +476,13 @@ class InteractionLogger:
 
 # Singleton instance
 _interaction_logger: Optional[InteractionLogger] = None
+_interaction_logger_lock = threading.Lock()
 
 def get_interaction_logger() -> InteractionLogger:
-    """Get singleton interaction logger instance."""
+    """Get singleton interaction logger instance (thread-safe)."""
     global _interaction_logger
     if _interaction_logger is None:
-        _interaction_logger = InteractionLogger()
+        with _interaction_logger_lock:
+            if _interaction_logger is None:
+                _interaction_logger = InteractionLogger()
     return _interaction_logger
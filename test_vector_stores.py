@@ -12,7 +12,7 @@ if str(project_root) not in sys.path:
 
 from config import Config
 from openai import OpenAI
-from database.supabase_client import SupabaseClient
+from database.supabase_client import get_db_client
 from utils.logger import setup_logging, get_logger
 
 setup_logging()
@@ -27,7 +27,7 @@ def test_vector_store_accessibility():
     print()
     
     client = OpenAI(api_key=Config.OPENAI_API_KEY)
-    db_client = SupabaseClient()
+    db_client = get_db_client()
     
     # Get vector store IDs from config
     customer_vs_id = Config.OPENAI_VECTOR_STORE_ID_CUSTOMER
@@ -0,0 +1,235 @@
+"""Unit tests for the LLM content cleaner."""
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from knowledge import cleaner
+
+
+@pytest.fixture
+def clean_cache(tmp_path):
+    """Point the cleaning cache at a temporary database."""
+    cache = cleaner._CleanCache(tmp_path / "clean_cache.sqlite")
+    with patch.object(cleaner, "_clean_cache", cache):
+        yield cache
+
+
+def test_clean_content_with_llm_caches_by_content(clean_cache):
+    """Test unchanged content is served from the cache without an API call."""
+    client = MagicMock(model="gpt-4o")
+    client.chat_completion_stream.return_value = {"content": " ## Fees\n\nNo fee. ", "usage": {"total_tokens": 42}}
+
+    with patch.object(cleaner, "get_openai_client", return_value=client):
+        first = cleaner.clean_content_with_llm("Find ANZ\nNo fee.", "Fees", "https://anz/fees")
+        second = cleaner.clean_content_with_llm("Find ANZ\nNo fee.", "Fees", "https://anz/fees")
+        changed = cleaner.clean_content_with_llm("Find ANZ\nA fee.", "Fees", "https://anz/fees")
+
+    assert first == second == "## Fees\n\nNo fee."
+    assert changed == "## Fees\n\nNo fee."
+    assert client.chat_completion_stream.call_count == 2
+
+
+def test_clean_content_with_llm_rejects_truncated_output(clean_cache):
+    """Test output cut off by max_tokens is neither returned nor cached."""
+    client = MagicMock(model="gpt-4o")
+    client.chat_completion_stream.return_value = {
+        "content": "## Fees\n\nNo", "usage": {"total_tokens": 4000}, "finish_reason": "length"
+    }
+
+    with patch.object(cleaner, "get_openai_client", return_value=client):
+        assert cleaner.clean_content_with_llm("Find ANZ\nNo fee.", "Fees", "https://anz/fees") is None
+        assert cleaner.clean_content_with_llm("Find ANZ\nNo fee.", "Fees", "https://anz/fees") is None
+
+    assert client.chat_completion_stream.call_count == 2
+
+
+def test_clean_content_with_llm_reuses_near_duplicate_pages(clean_cache):
+    """Test pages differing only in boilerplate, spacing or URL share a cached cleaning."""
+    client = MagicMock(model="gpt-4o")
+    client.chat_completion_stream.return_value = {"content": "## Fees\n\nNo fee.", "usage": {"total_tokens": 42}}
+
+    with patch.object(cleaner, "get_openai_client", return_value=client):
+        cleaner.clean_content_with_llm("Find ANZ\nNo fee.\n01:47", "Fees", "https://anz/fees")
+        cleaner.clean_content_with_llm("No   fee.\n\nQuick links\nTop", "Fees (AU)", "https://anz/au/fees")
+
+    assert client.chat_completion_stream.call_count == 1
+
+
+def test_clean_cache_key_includes_prompt_version_and_model():
+    """Test prompt version and model changes invalidate cache keys."""
+    key = cleaner._CleanCache.make_key("gpt-4o", "content")
+
+    assert cleaner._CleanCache.make_key("gpt-4o-mini", "content") != key
+    with patch.object(cleaner, "PROMPT_VERSION", cleaner.PROMPT_VERSION + 1):
+        assert cleaner._CleanCache.make_key("gpt-4o", "content") != key
+    with patch.object(cleaner, "BATCH_INSTRUCTIONS", cleaner.BATCH_INSTRUCTIONS + "\nExtra rule."):
+        assert cleaner._CleanCache.make_key("gpt-4o", "content") != key
+
+
+def test_clean_cache_stores_compressed_and_reads_legacy_rows(clean_cache):
+    """Test cleanings are stored compressed and uncompressed rows still load."""
+    import sqlite3
+    cleaned = "## Fees\n\nNo annual fee. " * 50
+    clean_cache.set("new", "gpt-4o", cleaned, 42)
+    with sqlite3.connect(clean_cache.path) as conn:
+        conn.execute("INSERT INTO clean_cache VALUES ('old', 'gpt-4o', '## Legacy', 1, 0)")
+        stored = conn.execute("SELECT cleaned FROM clean_cache WHERE key = 'new'").fetchone()[0]
+
+    assert isinstance(stored, bytes) and len(stored) < len(cleaned) // 5
+    assert clean_cache.get("new") == cleaned
+    assert clean_cache.get("old") == "## Legacy"
+    assert clean_cache.get("missing") is None
+
+
+def test_clean_all_documents_overlaps_llm_calls(tmp_path):
+    """Test documents are cleaned concurrently rather than one after another."""
+    import asyncio
+    import time
+    for i in range(4):
+        (tmp_path / f"doc_{i}.txt").write_text(
+            f"Title: Doc {i}\nSource URL: https://anz/{i}\nRetrieval Date: 2024-01-01\n"
+            "Content Type: public\n\n\nFind ANZ\nBody\n---\nfooter\n",
+            encoding="utf-8"
+        )
+
+    def slow_clean(content, title, url, model):
+        time.sleep(0.2)
+        return "## Body"
+
+    with patch.object(cleaner, "clean_content_with_llm", side_effect=slow_clean), \
+            patch.object(cleaner, "BATCH_MAX_DOCS", 1):
+        started = time.monotonic()
+        results = asyncio.run(cleaner.clean_all_documents(str(tmp_path), force=True, max_concurrent=4))
+        elapsed = time.monotonic() - started
+
+    assert all(results.values()) and len(results) == 4
+    assert elapsed < 0.6
+    assert "## Body" in (tmp_path / "doc_0.txt").read_text(encoding="utf-8")
+    assert (tmp_path / "doc_0.original.txt").exists()
+
+
+def test_clean_batch_with_llm_splits_json_response(clean_cache):
+    """Test several documents are cleaned in one request and missing ids fall back to single calls."""
+    client = MagicMock(model="gpt-4o")
+    client.chat_completion.return_value = {"content": '{"1": "## One", "2": ""}', "usage": {"total_tokens": 90}}
+    client.parse_json_response.side_effect = json.loads
+    docs = [
+        {"content": "Find ANZ\nOne", "title": "One", "url": "https://anz/1"},
+        {"content": "Find ANZ\nTwo", "title": "Two", "url": "https://anz/2"},
+    ]
+
+    with patch.object(cleaner, "get_openai_client", return_value=client), \
+            patch.object(cleaner, "clean_content_with_llm", return_value="## Two") as single:
+        cleaned = cleaner.clean_batch_with_llm(docs)
+
+    user_message = client.chat_completion.call_args[1]["messages"][1]["content"]
+    assert "<<<DOC id=1>>>" in user_message and "<<<END 2>>>" in user_message
+    assert client.chat_completion.call_args[1]["response_format"] == {"type": "json_object"}
+    assert cleaned == ["## One", "## Two"]
+    single.assert_called_once_with("Find ANZ\nTwo", "Two", "https://anz/2", "gpt-4o")
+
+
+def test_plan_batches_respects_document_and_token_limits():
+    """Test batches are capped by count and by the estimated token budget."""
+    small = [{"content": "x" * 400} for _ in range(6)]
+    large = {"content": "x" * 40000}
+
+    batches = cleaner._plan_batches(small + [large] + small[:1])
+
+    assert [len(batch) for batch in batches] == [4, 2, 1, 1]
+
+
+def test_plan_batches_budgets_expected_json_output():
+    """Test documents whose escaped output would overflow max_tokens are not batched together."""
+    docs = [{"content": "x" * 7200} for _ in range(2)]  # 1800 tokens in, ~2180 out each
+
+    assert [len(batch) for batch in cleaner._plan_batches(docs)] == [1, 1]
+
+
+def test_fast_clean_applies_prompt_deletion_rules():
+    """Test boilerplate lines, durations, phrases and arrows are removed locally."""
+    content = (
+        "Find ANZ\nSupport Centre\nReport a scam\n\n\n\n"
+        "Click to play video How to report\n01:47\n\u25ba ANZ Cards: 13 22 73\nTop\nTopics"
+    )
+
+    assert cleaner.fast_clean(content) == "Report a scam\n\n How to report\n ANZ Cards: 13 22 73\nTopics"
+
+
+def test_clean_document_file_skips_llm_when_rules_suffice(tmp_path):
+    """Test documents needing only rule-based cleaning never reach the LLM."""
+    import asyncio
+    path = tmp_path / "doc.txt"
+    path.write_text(
+        "Title: Fees\nSource URL: https://anz/fees\nRetrieval Date: 2024-01-01\n"
+        "Content Type: public\n\n\nFind ANZ\nJump to\n" + "No monthly fee applies. " * 30 + "\n---\nfooter\n",
+        encoding="utf-8"
+    )
+
+    with patch.object(cleaner, "clean_content_with_llm") as llm:
+        asyncio.run(cleaner.clean_document_file(str(path)))
+
+    llm.assert_not_called()
+    cleaned = path.read_text(encoding="utf-8")
+    assert "Find ANZ" not in cleaned and "No monthly fee applies." in cleaned
+    assert "Cleaned with rules: fast_clean" in cleaned
+
+
+def test_clean_document_file_leaves_unflagged_documents_untouched(tmp_path):
+    """Test documents the heuristics do not flag are not rewritten even if fast_clean would change them."""
+    import asyncio
+    original = (
+        "Title: Fees\nSource URL: https://anz/fees\nRetrieval Date: 2024-01-01\n"
+        "Content Type: public\n\n\nFees\n\n\n\n" + "No monthly fee applies. " * 30 + "\n---\nfooter\n"
+    )
+    path = tmp_path / "doc.txt"
+    path.write_text(original, encoding="utf-8")
+
+    with patch.object(cleaner, "clean_content_with_llm") as llm:
+        asyncio.run(cleaner.clean_document_file(str(path)))
+
+    llm.assert_not_called()
+    assert path.read_text(encoding="utf-8") == original
+    assert not (tmp_path / "doc.original.txt").exists()
+
+
+def test_clean_document_file_keeps_rule_cleaning_when_llm_fails(tmp_path):
+    """Test the rule-cleaned content is written when the LLM returns nothing."""
+    import asyncio
+    path = tmp_path / "doc.txt"
+    path.write_text(
+        "Title: Fees\nSource URL: https://anz/fees\nRetrieval Date: 2024-01-01\n"
+        "Content Type: public\n\n\nFind ANZ\nFees\nJump to the fee table\n---\nfooter\n",
+        encoding="utf-8"
+    )
+
+    with patch.object(cleaner, "clean_content_with_llm", return_value=None):
+        asyncio.run(cleaner.clean_document_file(str(path)))
+
+    cleaned = path.read_text(encoding="utf-8")
+    assert "Find ANZ" not in cleaned and "Jump to the fee table" in cleaned
+    assert "Cleaned with rules: fast_clean" in cleaned
+
+
+def test_apply_rules_skips_llm_for_structured_pages(tmp_path):
+    """Test pages that already have markdown headers are not sent to the LLM."""
+    path = tmp_path / "doc.txt"
+    path.write_text("original", encoding="utf-8")
+    structured = {"path": str(path), "title": "Fees", "url": "u", "retrieval_date": "d",
+                  "content": "## Fees\nJump to the fee table\nNo fee."}
+    flat = {**structured, "content": "Fees\nJump to the fee table\nNo fee."}
+
+    assert cleaner._apply_rules(structured, force=False) is False
+    assert cleaner._apply_rules(flat, force=False) is True
+    assert cleaner._apply_rules(dict(structured), force=True) is True
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("Find ANZ\nFees", True),
+    ("Back to Top\nFees", True),
+    ("Short page • with bullet", True),
+    ("Long page • " + "text " * 200, False),
+    ("Plain page about fees", False),
+])
+def test_needs_cleaning(content, expected):
+    """Test the navigation and artifact heuristics."""
+    assert cleaner.needs_cleaning(content) is expected
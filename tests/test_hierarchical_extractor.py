@@ -0,0 +1,72 @@
+"""Unit tests for the hierarchical HTML extractor."""
+import pytest
+from knowledge import hierarchical_extractor as extractor
+
+
+PAGE = """<html><head><title> Credit card fees </title></head><body>
+<header class="site-header"><a href="/">Home</a></header>
+<nav><ul><li>Personal</li><li>Business</li></ul></nav>
+<div class="skip-link"><a href="#main">Skip to content</a></div>
+<main id="main"><h1>Credit cards</h1>
+<p>Pay with <b>no</b> fee, see <a href="/help">help</a></p><a href="https://anz.com.au/fees">All fees</a>
+<div class="content-block"><h2>Fees</h2><ul><li>Annual <span>fee</span></li><li>Late fee</li></ul>
+<section><p>Section text</p><br/>loose text</section>
+<div class="quick-links"><p>Hidden links</p></div>
+</div><a href="#top">Jump to top</a>
+<script>var tracking = 1;</script></main>
+<footer>Footer</footer><aside role="complementary">Sidebar</aside></body></html>"""
+
+
+def test_extract_content_hierarchical_converts_main_content_to_markdown():
+    """Test main content is converted to markdown with navigation removed."""
+    result = extractor.extract_content_hierarchical(PAGE, "https://anz.com.au/cards")
+
+    assert result["title"] == "Credit card fees"
+    assert result["url"] == "https://anz.com.au/cards"
+    assert result["content"].startswith("# Credit cards\n")
+    assert "[All fees](https://anz.com.au/fees)" in result["content"]
+    assert "## Fees\n- Annual fee\n- Late fee\n" in result["content"]
+    for removed in ("Personal", "Skip to content", "Hidden links", "Jump to top", "tracking", "Footer", "Sidebar"):
+        assert removed not in result["content"]
+
+
+@pytest.mark.parametrize("html", [
+    PAGE,
+    '<html><body><div id="page-content"><p>Intro</p><div aria-label="Main Navigation">x</div><h3>T</h3>text</div></body></html>',
+    '<html><body><p>No main</p><div class="breadcrumbs">Home</div><span>Find ANZ</span> rest</body></html>',
+    '<html><body><article><header><h1>Title</h1></header><p>Body</p></article></body></html>',
+    '<html><body><header><div class="main-banner">Banner</div></header><p>Body</p></body></html>',
+    '<html><body><p>Body</p><div class="menu"><div class="menu">x</div><nav><nav>y</nav></nav></div></body></html>',
+    '<html><body><div id="main" class="nav-wrapper"><p>Hello there</p></div><p>other</p></body></html>',
+])
+def test_lxml_extraction_matches_beautifulsoup(html):
+    """Test the lxml walk produces the same markdown as the BeautifulSoup fallback."""
+    assert extractor._extract_with_lxml(html, "u") == extractor._extract_with_bs4(html, "u")
+
+
+def test_extract_content_hierarchical_falls_back_to_beautifulsoup():
+    """Test documents lxml rejects as str input are still extracted."""
+    html = '<?xml version="1.0" encoding="utf-8"?><html><body><main><p>Body</p></main></body></html>'
+
+    result = extractor.extract_content_hierarchical(html, "u")
+
+    assert result["content"] == "Body"
+
+
+def test_extract_content_hierarchical_uses_body_when_main_content_removed():
+    """Test a main content candidate inside removed navigation falls back to the body."""
+    html = '<html><body><header><div class="main-banner">Banner</div></header><p>Body</p></body></html>'
+
+    result = extractor.extract_content_hierarchical(html, "u")
+
+    assert result["content"] == "Body"
+
+
+def test_extract_corpus_returns_results_in_input_order():
+    """Test pages extracted in worker processes come back in input order."""
+    items = [(f"<html><body><main><p>Page {i}</p></main></body></html>", f"https://anz/{i}") for i in range(5)]
+
+    results = extractor.extract_corpus(items, max_workers=2)
+
+    assert [r["url"] for r in results] == [url for _, url in items]
+    assert [r["content"] for r in results] == [f"Page {i}" for i in range(5)]
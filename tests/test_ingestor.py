@@ -0,0 +1,201 @@
+"""Unit tests for the web scraping ingestor."""
+from knowledge import ingestor
+
+
+def test_extract_content_returns_main_text_without_navigation():
+    """Test plain-text extraction keeps main content lines and drops non-content elements."""
+    html = (
+        "<html><head><title> Fees </title></head><body><nav>Menu</nav>"
+        "<main><h1>Card fees</h1>No annual<script>track()</script> fee<footer>Footer</footer>\n"
+        "  <p>  Late fee applies  </p></main></body></html>"
+    )
+
+    result = ingestor.extract_content(html, "https://anz/fees")
+
+    assert result == {
+        "title": "Fees",
+        "content": "Card fees\nNo annual\nfee\nLate fee applies",
+        "url": "https://anz/fees",
+    }
+
+
+def test_extract_content_falls_back_to_beautifulsoup():
+    """Test documents lxml rejects as str input are still extracted."""
+    html = '<?xml version="1.0" encoding="utf-8"?><html><body><article>Body</article></body></html>'
+
+    assert ingestor.extract_content(html, "u")["content"] == "Body"
+
+
+def test_decode_body_uses_declared_charset_and_defaults_to_utf8():
+    """Test bodies are decoded without charset detection."""
+    assert ingestor.decode_body("Café".encode("latin-1"), "iso-8859-1") == "Café"
+    assert ingestor.decode_body("Café".encode("utf-8"), None) == "Café"
+    assert ingestor.decode_body("Café".encode("utf-8"), "not-a-charset") == "Café"
+    assert ingestor.decode_body(b"\xff ok", "utf-8") == "� ok"
+
+
+def test_scrape_urls_does_not_wait_for_slow_batch_members():
+    """Test a slow page only holds its own slot and results keep URL order."""
+    import asyncio
+    import time
+    from unittest.mock import patch
+
+    async def fake_fetch(session, url, timeout, headers=None, decode=True):
+        await asyncio.sleep(0.4 if url == "slow" else 0.05)
+        return {"url": url, "content": f"<html><body><main><p>{url}</p></main></body></html>".encode(), "status": 200}
+
+    urls = ["slow", "a", "b", "c", "d", "e", "f"]
+    with patch.object(ingestor, "fetch_url", fake_fetch):
+        started = time.monotonic()
+        docs = asyncio.run(ingestor.scrape_urls(urls, max_concurrent=2, delay_between_batches=0))
+        elapsed = time.monotonic() - started
+
+    assert [doc["content"] for doc in docs] == urls
+    # Batches of two would take 0.4 + 3 * 0.05; the free slot drains the rest meanwhile
+    assert elapsed < 0.5
+
+
+def test_scrape_urls_reuses_cached_content_when_not_modified(tmp_path):
+    """Test a re-scrape sends validators and a 304 reuses the stored content."""
+    import asyncio
+    from unittest.mock import patch
+
+    sent_headers = []
+
+    async def fake_fetch(session, url, timeout, headers=None, decode=True):
+        sent_headers.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return {"url": url, "content": None, "status": 304}
+        return {
+            "url": url,
+            "content": "<html><head><title>Fees</title></head><body><main><p>Nö fee</p></main></body></html>".encode("latin-1"),
+            "status": 200,
+            "charset": "iso-8859-1",
+            "etag": '"v1"',
+            "last_modified": None,
+        }
+
+    cache_path = str(tmp_path / "fetch_cache.sqlite")
+    with patch.object(ingestor, "fetch_url", fake_fetch):
+        first = asyncio.run(ingestor.scrape_urls(["https://anz/fees"], delay_between_batches=0, cache_path=cache_path))
+        second = asyncio.run(ingestor.scrape_urls(["https://anz/fees"], delay_between_batches=0, cache_path=cache_path))
+
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
+    assert [(doc["title"], doc["content"]) for doc in second] == [(doc["title"], doc["content"]) for doc in first]
+    assert first[0]["content"] == "Nö fee"
+
+
+def test_rate_limiter_spaces_acquisitions():
+    """Test no more than `rate` acquisitions happen within one period."""
+    import asyncio
+
+    async def run():
+        limiter = ingestor.RateLimiter(2, 0.1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        times = []
+        for _ in range(5):
+            await limiter.acquire()
+            times.append(loop.time() - start)
+        return times
+
+    times = asyncio.run(run())
+
+    assert times[1] < 0.05
+    assert 0.1 <= times[2] < 0.15
+    assert times[4] >= 0.2
+
+
+def test_scrape_and_process_urls_saves_documents_in_order(tmp_path):
+    """Test concurrent saves keep document order and the last same-title document wins."""
+    import asyncio
+    from unittest.mock import patch
+
+    docs = [
+        {"title": "Fees", "url": "u1", "content": "first", "retrieval_date": "2024-01-01"},
+        {"title": "Rates", "url": "u2", "content": "rates", "retrieval_date": "2024-01-01"},
+        {"title": "Fees", "url": "u3", "content": "second", "retrieval_date": "2024-01-01"},
+    ]
+
+    async def fake_scrape(urls, max_concurrent, delay_between_batches, timeout, cache_path):
+        return docs
+
+    with patch.object(ingestor, "load_urls_from_xml", return_value=["u1", "u2", "u3"]), \
+            patch.object(ingestor, "scrape_urls", fake_scrape):
+        processed = asyncio.run(ingestor.scrape_and_process_urls(output_dir=str(tmp_path), timeout=1))
+
+    assert [doc["url"] for doc in processed] == ["u1", "u2", "u3"]
+    assert "second" in (tmp_path / "fees.md").read_text(encoding="utf-8")
+    assert (tmp_path / "rates.md").exists()
+
+
+def test_chunk_large_document_splits_on_utf8_byte_size(tmp_path):
+    """Test chunk boundaries count UTF-8 bytes, not characters."""
+    doc = {"title": "Fees", "url": "u", "content": "ééé\nabc\nabcd", "retrieval_date": "2024-01-01"}
+
+    paths = ingestor.chunk_large_document(doc, max_chunk_size=7, output_dir=str(tmp_path))
+
+    assert len(paths) == 2
+    assert "ééé\n\n" in (tmp_path / "fees_chunk_1.md").read_text(encoding="utf-8")
+    assert "abc\nabcd" not in (tmp_path / "fees_chunk_1.md").read_text(encoding="utf-8")
+
+
+def test_load_urls_from_xml_dedupes_and_groups_by_host(tmp_path):
+    """Test URLs are deduplicated and ordered host by host."""
+    url_file = tmp_path / "urls.xml"
+    url_file.write_text(
+        "<urlset>\nhttps://www.anz.com.au/b\n  http://www.anz.com.au/a  \n"
+        "https://help.anz.com.au/x\nhttps://www.anz.com.au/b\nnot a url\n",
+        encoding="utf-8",
+    )
+
+    assert ingestor.load_urls_from_xml(str(url_file)) == [
+        "https://help.anz.com.au/x",
+        "http://www.anz.com.au/a",
+        "https://www.anz.com.au/b",
+    ]
+
+
+def test_save_document_skips_rewriting_unchanged_file(tmp_path):
+    """Test an identical re-save leaves the file untouched and a changed one rewrites it."""
+    import os
+
+    doc = {"title": "Fees", "url": "u", "content": "No fee", "retrieval_date": "2024-01-01"}
+    path = ingestor.save_document(doc, str(tmp_path))
+    os.utime(path, (0, 0))
+
+    assert ingestor.save_document(doc, str(tmp_path)) == path
+    assert os.stat(path).st_mtime == 0
+
+    ingestor.save_document({**doc, "content": "A fee"}, str(tmp_path))
+    assert os.stat(path).st_mtime != 0
+    assert "A fee" in open(path, encoding="utf-8").read()
+
+
+def test_fetch_cache_ignores_rows_from_other_extractor_versions(tmp_path):
+    """Test cached content is only reused for the current extractor version."""
+    from unittest.mock import patch
+
+    cache = ingestor._FetchCache(tmp_path / "fetch_cache.sqlite")
+    page = {"url": "https://anz/fees", "etag": '"v1"', "last_modified": None, "title": "Fees", "content": "No fee"}
+    with patch.object(ingestor, "EXTRACTOR_VERSION", ingestor.EXTRACTOR_VERSION - 1):
+        cache.set_many([page])
+    assert cache.get_many([page["url"]]) == {}
+
+    cache.set_many([page])
+    with patch.object(ingestor, "FETCH_CACHE_QUERY_BATCH_SIZE", 1):
+        cached = cache.get_many(["https://anz/other", page["url"]])
+    assert cached == {page["url"]: {"etag": '"v1"', "last_modified": None, "title": "Fees", "content": "No fee"}}
+
+
+def test_save_document_ignores_date_lines_when_unchanged(tmp_path):
+    """Test a page re-scraped on a later day leaves its file untouched, while content changes rewrite it."""
+    doc = {"title": "Fees", "url": "u", "content": "No fee", "retrieval_date": "2024-01-01"}
+    path = tmp_path / "fees.md"
+
+    ingestor.save_document(doc, str(tmp_path))
+    ingestor.save_document({**doc, "retrieval_date": "2024-01-02"}, str(tmp_path))
+    assert "Retrieval Date: 2024-01-01" in path.read_text(encoding="utf-8")
+
+    ingestor.save_document({**doc, "content": "Fee", "retrieval_date": "2024-01-02"}, str(tmp_path))
+    assert "Retrieval Date: 2024-01-02" in path.read_text(encoding="utf-8")
@@ -0,0 +1,31 @@
+"""Unit tests for the OpenAI client wrapper."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from utils.openai_client import OpenAIClient
+
+
+def _chunk(content=None, usage=None, finish_reason=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)] if usage is None else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def test_chat_completion_stream_accumulates_content_and_usage():
+    """Test streamed deltas are joined and usage is read from the final chunk."""
+    client = OpenAIClient.__new__(OpenAIClient)
+    client.model = "gpt-4o"
+    client.client = MagicMock()
+    usage = SimpleNamespace(prompt_tokens=10, completion_tokens=3, total_tokens=13)
+    client.client.chat.completions.create.return_value = iter(
+        [_chunk("## Fees"), _chunk(None), _chunk("\n\nNo fee."), _chunk(finish_reason="length"), _chunk(usage=usage)]
+    )
+
+    result = client.chat_completion_stream([{"role": "user", "content": "hi"}], max_tokens=100)
+
+    assert result["content"] == "## Fees\n\nNo fee."
+    assert result["usage"] == {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13}
+    assert result["first_token_ms"] is not None
+    assert result["finish_reason"] == "length"
+    kwargs = client.client.chat.completions.create.call_args[1]
+    assert kwargs["stream"] is True
+    assert kwargs["stream_options"] == {"include_usage": True}
+    assert kwargs["max_tokens"] == 100
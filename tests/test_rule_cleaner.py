@@ -0,0 +1,77 @@
+"""Unit tests for the rule-based content cleaner."""
+from knowledge import rule_cleaner
+
+
+def test_clean_content_rules_removes_navigation_phrases_and_artifacts():
+    """Test navigation lines, video phrases and unicode artifacts are removed."""
+    content = "Find ANZ\n  Quick Links \nCard fees•\nClick to play video 1:47 Intro\n\n\n\nNo annual fee▶\n"
+
+    cleaned = rule_cleaner.clean_content_rules(content)
+
+    assert cleaned == "Card fees\n  Intro\n\nNo annual fee"
+
+
+def test_clean_content_rules_collapses_blank_runs_created_by_cleaning():
+    """Test lines emptied by cleaning join the surrounding blank line run."""
+    content = "Rates\n\n1:47\n\nvideo transcript\n\nTerms"
+
+    assert rule_cleaner.clean_content_rules(content) == "Rates\n\nTerms"
+
+
+def test_clean_content_rules_adds_headers_to_title_lines():
+    """Test title-like lines between content become markdown headers."""
+    content = "intro text\nEligibility\n- Be 18 or over\n1. Apply online today"
+
+    cleaned = rule_cleaner.clean_content_rules(content, add_headers=True)
+
+    assert cleaned == "intro text\n\n## Eligibility\n\n- Be 18 or over\n1. Apply online today"
+
+
+def test_clean_document_file_keeps_metadata_and_footer(tmp_path):
+    """Test the header gains a cleaned flag, the footer is kept and only the body is cleaned."""
+    path = tmp_path / "fees.txt"
+    path.write_text(
+        "Title: Fees\nSource URL: https://anz/fees\nRetrieval Date: 2024-01-01\nContent Type: public\n\n"
+        "Find ANZ\nNo annual fee\n\n---\nOriginal URL: https://anz/fees\nScraped: 2024-01-01\n",
+        encoding="utf-8",
+    )
+
+    assert rule_cleaner.clean_document_file(str(path), add_headers=False, backup=False) == str(path)
+
+    expected = (
+        "Title: Fees\nSource URL: https://anz/fees\nRetrieval Date: 2024-01-01\nContent Type: public\n"
+        "Cleaned: Yes\n\nNo annual fee\n\n---\nOriginal URL: https://anz/fees\nScraped: 2024-01-01\n"
+    )
+    assert path.read_text(encoding="utf-8") == expected
+
+    # Cleaning again is stable and does not repeat the cleaned flag
+    rule_cleaner.clean_document_file(str(path), add_headers=False, backup=False)
+    assert path.read_text(encoding="utf-8") == expected
+
+
+def test_clean_all_documents_cleans_each_file_in_worker_processes(tmp_path):
+    """Test every document is cleaned and reported, skipping backups."""
+    header = "Title: {0}\nSource URL: https://anz/{0}\nRetrieval Date: 2024-01-01\nContent Type: public\n\n"
+    for name in ("fees", "rates", "cards"):
+        (tmp_path / f"{name}.txt").write_text(header.format(name) + "Find ANZ\nBody\n", encoding="utf-8")
+    (tmp_path / "fees.original.txt").write_text("backup", encoding="utf-8")
+
+    results = rule_cleaner.clean_all_documents(str(tmp_path), add_headers=False, backup=False, max_workers=2)
+
+    assert sorted(results) == sorted(str(tmp_path / f"{name}.txt") for name in ("fees", "rates", "cards"))
+    assert all(results.values())
+    assert (tmp_path / "rates.txt").read_text(encoding="utf-8").endswith("Cleaned: Yes\n\nBody\n\n")
+    assert (tmp_path / "fees.original.txt").read_text(encoding="utf-8") == "backup"
+
+
+def test_clean_document_file_backup_keeps_original_content(tmp_path):
+    """Test the backup holds the original text after the cleaned file replaces it."""
+    path = tmp_path / "fees.txt"
+    original = "Title: Fees\nSource URL: u\nRetrieval Date: d\nContent Type: public\n\nFind ANZ\nBody\n"
+    path.write_text(original, encoding="utf-8")
+
+    rule_cleaner.clean_document_file(str(path), add_headers=False, backup=True)
+
+    assert (tmp_path / "fees.original.txt").read_text(encoding="utf-8") == original
+    assert "Find ANZ" not in path.read_text(encoding="utf-8")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fees.original.txt", "fees.txt"]
@@ -2,7 +2,7 @@
 import pytest
 import asyncio
 from unittest.mock import patch, Mock
-from utils.logger import get_logger, setup_logging
+from utils.logger import get_logger, setup_logging, is_debug_enabled
 from services.logger import InteractionLogger
 
 
@@ -40,6 +40,19 @@ async def test_logger_service_async(mock_supabase_client):
     mock_supabase_client.insert_interaction.assert_called_once()
 
 
+def test_is_debug_enabled_follows_log_level():
+    """Test debug gating matches the configured stdlib log level."""
+    import logging
+    setup_logging()
+    logger = get_logger("debug_gate_test")
+    
+    logging.getLogger("debug_gate_test").setLevel(logging.INFO)
+    assert is_debug_enabled(logger) is False
+    
+    logging.getLogger("debug_gate_test").setLevel(logging.DEBUG)
+    assert is_debug_enabled(logger) is True
+
+
 def test_logger_info_level():
     """Test INFO level logging."""
     setup_logging()
@@ -0,0 +1,559 @@
+"""Unit tests for Supabase client wrapper."""
+import pytest
+from unittest.mock import MagicMock, patch
+from database.supabase_client import (
+    SupabaseClient,
+    _conversation_cache,
+    _conversation_ids_by_uuid,
+    _document_metadata_cache,
+    _read_cache,
+    _recent_conversations_cache,
+)
+
+
+def make_query(data=None, count=None):
+    """Build a chainable PostgREST query builder mock returning `data`."""
+    query = MagicMock()
+    for method in ("select", "eq", "gte", "lte", "in_", "order", "or_", "limit", "range", "insert", "update"):
+        getattr(query, method).return_value = query
+    query.execute.return_value = MagicMock(data=data, count=count)
+    return query
+
+
+@pytest.fixture
+def db():
+    """SupabaseClient with the underlying supabase client mocked out."""
+    for cache in (_document_metadata_cache, _conversation_cache, _conversation_ids_by_uuid,
+                  _recent_conversations_cache, _read_cache):
+        cache.clear()
+    with patch("database.supabase_client.create_client") as mock_create:
+        mock_create.return_value = MagicMock()
+        yield SupabaseClient()
+
+
+def test_get_escalations_embeds_interaction(db):
+    """Test escalations are joined server-side and flattened."""
+    query = make_query([
+        {
+            "id": "esc-1",
+            "interaction_id": "int-1",
+            "trigger_type": "low_confidence",
+            "escalation_reason": "Low confidence",
+            "created_at": "2024-01-01T00:00:00",
+            "interactions": {"assistant_mode": "customer", "intent_name": "fee_inquiry"},
+        },
+        {
+            "id": "esc-2",
+            "interaction_id": None,
+            "trigger_type": "human_only",
+            "escalation_reason": "Human only",
+            "created_at": "2024-01-02T00:00:00",
+            "interactions": None,
+        },
+    ])
+    db.client.table.return_value = query
+
+    escalations = db.get_escalations()
+
+    db.client.table.assert_called_once_with("escalations")
+    assert "interactions(assistant_mode, intent_name)" in query.select.call_args[0][0]
+    assert escalations[0]["assistant_mode"] == "customer"
+    assert escalations[0]["intent_name"] == "fee_inquiry"
+    assert escalations[1]["assistant_mode"] is None
+
+
+def test_get_escalations_mode_filter_uses_inner_join(db):
+    """Test mode filter is pushed into the query via an inner join."""
+    query = make_query([])
+    db.client.table.return_value = query
+
+    db.get_escalations({"mode": "banker"})
+
+    assert "interactions!inner(" in query.select.call_args[0][0]
+    query.eq.assert_called_once_with("interactions.assistant_mode", "banker")
+
+
+def test_get_distinct_intents_uses_rpc(db):
+    """Test distinct intents are computed by the database function."""
+    db.client.rpc.return_value = make_query([{"intent_name": "card_lost"}, {"intent_name": "fee_inquiry"}])
+
+    intents = db.get_distinct_intents()
+
+    db.client.rpc.assert_called_once_with("distinct_intents")
+    assert intents == ["card_lost", "fee_inquiry"]
+
+
+def test_get_intent_risk_value_matrix_uses_rpc(db):
+    """Test matrix aggregation is delegated to the database with mapped filters."""
+    rows = [{"intent_name": "fee_inquiry", "containment_rate": 50.0, "escalation_rate": 50.0, "volume": 2}]
+    db.client.rpc.return_value = make_query(rows)
+
+    matrix = db.get_intent_risk_value_matrix({"mode": "customer", "start_date": "2024-01-01"})
+
+    db.client.rpc.assert_called_once_with(
+        "intent_risk_value_matrix", {"p_mode": "customer", "p_start_date": "2024-01-01"}
+    )
+    assert matrix == rows
+
+
+def test_aggregates_use_direct_postgres_pool_when_configured(db):
+    """Test aggregates are queried over the direct pool with positional parameters."""
+    rows = [{"intent_name": "fee_inquiry", "containment_rate": 50.0, "escalation_rate": 50.0, "volume": 2}]
+    db.pg_pool = MagicMock()
+    db.pg_pool.fetch.return_value = rows
+    db.pg_pool.fetchval.return_value = '{"citation_coverage_rate": 80.0, "failed_retrieval_rate": 0.0, "top_sources": []}'
+
+    matrix = db.get_intent_risk_value_matrix({"mode": "customer"})
+    coverage = db.get_citation_coverage_data({"mode": "customer"})
+
+    db.client.rpc.assert_not_called()
+    assert db.pg_pool.fetch.call_args[0][1:] == ("customer", None, None, None)
+    assert matrix == rows
+    assert coverage["citation_coverage_rate"] == 80.0
+
+
+def test_aggregates_fall_back_to_rpc_when_direct_query_fails(db):
+    """Test a failing direct pool query falls back to the PostgREST RPC."""
+    rows = [{"intent_name": "fee_inquiry", "containment_rate": 50.0, "escalation_rate": 50.0, "volume": 2}]
+    db.pg_pool = MagicMock()
+    db.pg_pool.fetch.side_effect = OSError("connection refused")
+    db.client.rpc.return_value = make_query(rows)
+
+    assert db.get_intent_risk_value_matrix() == rows
+    db.client.rpc.assert_called_once_with("intent_risk_value_matrix", {})
+
+
+def test_postgres_pool_backs_off_after_failed_connect(db):
+    """Test an unreachable DSN is not retried on every aggregate call."""
+    pytest.importorskip("asyncpg")
+    from unittest.mock import AsyncMock
+    from database.postgres_pool import PostgresPool
+    rows = [{"intent_name": "fee_inquiry", "containment_rate": 50.0, "escalation_rate": 50.0, "volume": 2}]
+    db.pg_pool = PostgresPool("postgresql://unreachable", timeout=5)
+    db.client.rpc.return_value = make_query(rows)
+
+    with patch("database.postgres_pool.asyncpg.create_pool", new=AsyncMock(side_effect=OSError("refused"))) as create:
+        assert db.get_intent_risk_value_matrix() == rows
+        assert db.get_intent_risk_value_matrix({"mode": "customer"}) == rows
+
+    assert create.await_count == 1
+    assert not db.pg_pool.is_ready()
+    assert db.client.rpc.call_count == 2
+
+
+def test_aggregates_do_not_refresh_dashboard_views(db):
+    """Test aggregate reads never refresh the materialized views on the request path."""
+    rows = [{"intent_name": "fee_inquiry", "containment_rate": 50.0, "escalation_rate": 50.0, "volume": 2}]
+    db.client.rpc.return_value = make_query(rows)
+
+    db.get_intent_risk_value_matrix()
+
+    assert [c[0][0] for c in db.client.rpc.call_args_list] == ["intent_risk_value_matrix"]
+
+
+def test_refresh_dashboard_views_drops_cached_aggregates(db):
+    """Test an explicit refresh runs the RPC and invalidates cached reads."""
+    rows = [{"intent_name": "fee_inquiry", "containment_rate": 50.0, "escalation_rate": 50.0, "volume": 2}]
+    db.client.rpc.return_value = make_query(rows)
+    db.get_intent_risk_value_matrix()
+
+    assert db.refresh_dashboard_views() is True
+    db.get_intent_risk_value_matrix()
+
+    assert [c[0][0] for c in db.client.rpc.call_args_list] == [
+        "intent_risk_value_matrix", "refresh_dashboard_views", "intent_risk_value_matrix",
+    ]
+
+
+def test_get_intent_risk_value_matrix_falls_back_to_client_side(db):
+    """Test matrix is aggregated locally when the database function is missing."""
+    db.client.rpc.side_effect = Exception("function intent_risk_value_matrix does not exist")
+    db.client.table.return_value = make_query([
+        {"intent_name": "fee_inquiry", "outcome": "resolved"},
+        {"intent_name": "fee_inquiry", "outcome": "escalated"},
+        {"intent_name": "card_lost", "outcome": "escalated"},
+        {"intent_name": None, "outcome": "resolved"},
+    ])
+
+    matrix = db.get_intent_risk_value_matrix()
+
+    assert matrix[0] == {"intent_name": "fee_inquiry", "containment_rate": 50.0, "escalation_rate": 50.0, "volume": 2}
+    assert matrix[1]["intent_name"] == "card_lost"
+    assert matrix[1]["escalation_rate"] == 100.0
+
+
+def test_aggregate_intent_risk_value_matrix_sums_across_pages(db):
+    """Test per-page group counts are combined into one row per intent."""
+    pages = [
+        [{"intent_name": "fee_inquiry", "outcome": "resolved"}, {"intent_name": "card_lost", "outcome": "escalated"}],
+        [{"intent_name": "fee_inquiry", "outcome": "resolved"}, {"intent_name": "fee_inquiry", "outcome": "escalated"}],
+        [{"intent_name": None, "outcome": "resolved"}],
+    ]
+
+    matrix = db._aggregate_intent_risk_value_matrix(iter(pages))
+
+    assert matrix == [
+        {"intent_name": "fee_inquiry", "containment_rate": pytest.approx(200 / 3), "escalation_rate": pytest.approx(100 / 3), "volume": 3},
+        {"intent_name": "card_lost", "containment_rate": 0.0, "escalation_rate": 100.0, "volume": 1},
+    ]
+    assert db._aggregate_intent_risk_value_matrix(iter([])) == []
+
+
+def test_get_citation_coverage_data_falls_back_to_client_side(db):
+    """Test citation coverage is aggregated locally when the database function is missing."""
+    db.client.rpc.side_effect = Exception("function citation_coverage does not exist")
+    db.client.table.return_value = make_query([
+        {"response_text": "a", "citations": [{"source": "Fees"}, {"source": "Cards"}], "retrieved_chunks_count": 2},
+        {"response_text": "b", "citations": [{"source": "Fees"}], "retrieved_chunks_count": 1},
+        {"response_text": "c", "citations": [], "retrieved_chunks_count": 0},
+        {"response_text": None, "citations": [{"source": "Ignored"}]},
+    ])
+
+    coverage = db.get_citation_coverage_data()
+
+    assert coverage["total_responses"] == 3
+    assert coverage["citation_coverage_rate"] == pytest.approx(200 / 3)
+    assert coverage["failed_retrieval_rate"] == pytest.approx(100 / 3)
+    assert coverage["top_sources"] == [{"source": "Fees", "count": 2}, {"source": "Cards", "count": 1}]
+
+
+def test_save_message_single_round_trip(db):
+    """Test saving a message issues only the insert (count is bumped by a trigger)."""
+    query = make_query([{"id": "msg-1"}])
+    db.client.table.return_value = query
+
+    message_id = db.save_message("conv-uuid", "user", "Hello")
+
+    assert message_id == "msg-1"
+    db.client.table.assert_called_once_with("conversation_messages")
+    query.update.assert_not_called()
+
+
+def test_get_metrics_count_only(db):
+    """Test metrics use a head count request unless rows are requested."""
+    query = make_query(None, count=42)
+    db.client.table.return_value = query
+
+    metrics = db.get_metrics({"mode": "customer"})
+
+    query.select.assert_called_once_with("id", count="exact", head=True)
+    query.eq.assert_called_once_with("assistant_mode", "customer")
+    assert metrics == {"total_interactions": 42, "interactions": []}
+
+
+def test_get_db_client_singleton_is_thread_safe():
+    """Test concurrent first calls to get_db_client build a single client."""
+    import threading
+    import database.supabase_client as supabase_client
+
+    with patch.object(supabase_client, "_db_client", None), \
+         patch.object(supabase_client, "SupabaseClient", side_effect=lambda: object()) as mock_cls:
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(supabase_client.get_db_client())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_cls.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+
+def test_bulk_insert_interactions_single_request(db):
+    """Test bulk insert sends all rows in one request and returns their IDs."""
+    query = make_query([{"id": "int-1"}, {"id": "int-2"}])
+    db.client.table.return_value = query
+    rows = [{"user_query": "a"}, {"user_query": "b"}]
+
+    ids = db.bulk_insert_interactions(rows)
+
+    query.insert.assert_called_once_with(rows)
+    query.execute.assert_called_once()
+    assert ids == ["int-1", "int-2"]
+
+
+def test_bulk_insert_empty_rows_skips_request(db):
+    """Test bulk insert with no rows does not hit the database."""
+    assert db.bulk_save_messages([]) == []
+    db.client.table.assert_not_called()
+
+
+def test_get_document_metadata_served_from_cache(db):
+    """Test repeat file IDs are served from cache and only misses are queried."""
+    query = make_query([{"openai_file_id": "file-1", "title": "Fees", "source_url": "https://a", "content_type": "public"}])
+    db.client.table.return_value = query
+
+    first = db.get_document_metadata_by_file_ids(["file-1"])
+    query.execute.return_value = MagicMock(data=[
+        {"openai_file_id": "file-2", "title": "Cards", "source_url": "https://b", "content_type": "public"}
+    ])
+    second = db.get_document_metadata_by_file_ids(["file-1", "file-2"])
+    third = db.get_document_metadata_by_file_ids(["file-2", "file-1"])
+
+    assert first["file-1"]["title"] == "Fees"
+    assert query.in_.call_args_list[1][0] == ("openai_file_id", ["file-2"])
+    assert query.execute.call_count == 2
+    assert set(second) == set(third) == {"file-1", "file-2"}
+
+
+def test_get_document_metadata_caches_unknown_ids_until_inserted(db):
+    """Test unknown file IDs are not re-queried until a document with that ID is inserted."""
+    query = make_query([])
+    db.client.table.return_value = query
+
+    assert db.get_document_metadata_by_file_ids(["file-9"]) == {}
+    assert db.get_document_metadata_by_file_ids(["file-9"]) == {}
+    assert query.execute.call_count == 1
+
+    query.execute.return_value = MagicMock(data=[{"id": "doc-9"}])
+    db.insert_knowledge_document({"openai_file_id": "file-9", "title": "New"})
+    query.execute.return_value = MagicMock(data=[
+        {"openai_file_id": "file-9", "title": "New", "source_url": "", "content_type": "public"}
+    ])
+
+    assert db.get_document_metadata_by_file_ids(["file-9"])["file-9"]["title"] == "New"
+
+
+def test_get_document_metadata_batches_in_filter(db):
+    """Test large file ID lists are split into several IN-filter requests."""
+    query = make_query([])
+    db.client.table.return_value = query
+    file_ids = [f"file-{i}" for i in range(1200)]
+
+    db.get_document_metadata_by_file_ids(file_ids)
+
+    batch_sizes = [len(call[0][1]) for call in query.in_.call_args_list]
+    assert batch_sizes == [500, 500, 200]
+
+
+def test_get_interactions_paginates_with_keyset_cursor(db):
+    """Test interactions are fetched in keyset pages until a short page is returned."""
+    query = make_query()
+    query.execute.side_effect = [
+        MagicMock(data=[{"id": 1, "timestamp": "t1"}, {"id": 2, "timestamp": "t2"}]),
+        MagicMock(data=[{"id": 3, "timestamp": "t2"}, {"id": 4, "timestamp": "t3"}]),
+        MagicMock(data=[{"id": 5, "timestamp": "t4"}]),
+    ]
+    db.client.table.return_value = query
+
+    with patch("database.supabase_client.PAGE_SIZE", 2):
+        rows = db.get_interactions({"mode": "customer"})
+
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+    assert [call[0] for call in query.limit.call_args_list] == [(2,), (2,), (2,)]
+    assert [call[0][0] for call in query.or_.call_args_list] == [
+        'timestamp.gt."t2",and(timestamp.eq."t2",id.gt.2)',
+        'timestamp.gt."t3",and(timestamp.eq."t3",id.gt.4)',
+    ]
+    query.range.assert_not_called()
+
+
+def test_get_interactions_selects_cursor_columns(db):
+    """Test narrow column lists are extended with the pagination cursor columns."""
+    query = make_query([])
+    db.client.table.return_value = query
+
+    db.get_interactions(columns="intent_name, outcome")
+    db.get_interactions()
+
+    assert query.select.call_args_list[0][0][0] == "intent_name, outcome, timestamp, id"
+    assert "citations" not in query.select.call_args_list[1][0][0]
+
+
+def test_get_interactions_stream_is_lazy(db):
+    """Test streaming interactions does not query until iterated."""
+    query = make_query([{"id": 1}])
+    db.client.table.return_value = query
+
+    rows = db.get_interactions(stream=True)
+
+    query.execute.assert_not_called()
+    assert list(rows) == [{"id": 1}]
+
+
+def test_get_recent_conversations_cached_until_invalidated(db):
+    """Test recent conversations are cached and invalidated by writes."""
+    query = make_query([{"id": "conv-1"}])
+    db.client.table.return_value = query
+
+    db.get_recent_conversations(assistant_mode="customer")
+    db.get_recent_conversations(assistant_mode="customer")
+    assert query.execute.call_count == 1
+
+    db.update_conversation_title("conv-1", "New title")
+    db.get_recent_conversations(assistant_mode="customer")
+    assert query.execute.call_count == 3
+
+
+def test_get_conversation_by_id_cached(db):
+    """Test conversation lookups by ID are served from cache."""
+    query = make_query([{"id": "uuid-1", "conversation_id": "conv_abc", "is_active": True}])
+    db.client.table.return_value = query
+
+    first = db.get_conversation_by_id("conv_abc")
+    second = db.get_conversation_by_id("conv_abc")
+
+    assert first == second
+    assert query.execute.call_count == 1
+
+
+def test_get_conversation_by_id_returns_copies_and_is_invalidated_by_writes(db):
+    """Test callers cannot corrupt the cache and saved messages drop the stale entry."""
+    query = make_query([{"id": "uuid-1", "conversation_id": "conv_abc", "message_count": 0}])
+    db.client.table.return_value = query
+
+    db.get_conversation_by_id("conv_abc")["message_count"] = 99
+    assert db.get_conversation_by_id("conv_abc")["message_count"] == 0
+    assert query.execute.call_count == 1
+
+    db.save_message("uuid-1", "user", "hello")
+    db.get_conversation_by_id("conv_abc")
+    db.create_conversation("conv_abc", "customer")
+    db.get_conversation_by_id("conv_abc")
+
+    # lookup, insert, lookup, insert, lookup
+    assert query.execute.call_count == 5
+
+
+def test_apply_filters_dispatch():
+    """Test filter dispatch maps keys to operators and skips unknown/empty values."""
+    from datetime import datetime
+    from database.supabase_client import INTERACTION_FILTERS, _apply_filters, _normalize_filters
+
+    query = make_query()
+    _apply_filters(query, _normalize_filters({
+        "mode": "banker",
+        "start_date": datetime(2024, 1, 1),
+        "end_date": "2024-02-01T00:00:00",
+        "intent": None,
+        "unknown": "ignored",
+    }), INTERACTION_FILTERS)
+
+    query.eq.assert_called_once_with("assistant_mode", "banker")
+    query.gte.assert_called_once_with("timestamp", "2024-01-01T00:00:00")
+    query.lte.assert_called_once_with("timestamp", "2024-02-01T00:00:00")
+
+
+def test_aggregate_fallback_selects_only_needed_columns(db):
+    """Test the client-side fallback does not select every interaction column."""
+    db.client.rpc.side_effect = Exception("function does not exist")
+    query = make_query([])
+    db.client.table.return_value = query
+
+    db.get_intent_risk_value_matrix()
+    db.get_citation_coverage_data()
+
+    selected = [call[0][0] for call in query.select.call_args_list]
+    assert selected == [
+        "intent_name, outcome, timestamp, id",
+        "response_text, citations, retrieved_chunks_count, timestamp, id",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_dashboard_data_gathers_reads(db):
+    """Test dashboard datasets are fetched together and keyed by name."""
+    db.get_interactions = MagicMock(return_value=[{"id": 1}])
+    db.get_escalations = MagicMock(return_value=[])
+    db.get_intent_risk_value_matrix = MagicMock(return_value=[])
+    db.get_citation_coverage_data = MagicMock(return_value={"citation_coverage_rate": 0.0})
+
+    data = await db.fetch_dashboard_data({"mode": "customer"})
+
+    assert data["interactions"] == [{"id": 1}]
+    assert set(data) == {"interactions", "escalations", "intent_risk_value_matrix", "citation_coverage"}
+    db.get_escalations.assert_called_once_with({"mode": "customer"})
+
+
+def test_read_cache_serves_repeat_queries(db):
+    """Test repeated dashboard reads with equal filters hit the cache."""
+    from datetime import date
+    query = make_query([{"id": "int-1"}])
+    db.client.table.return_value = query
+
+    first = db.get_interactions({"mode": "customer", "start_date": date(2024, 1, 1)})
+    second = db.get_interactions({"start_date": "2024-01-01", "mode": "customer"})
+
+    assert first == second == [{"id": "int-1"}]
+    assert query.execute.call_count == 1
+
+
+def test_read_cache_invalidated_by_insert(db):
+    """Test inserting an interaction drops cached reads."""
+    db.client.rpc.return_value = make_query([{"intent_name": "fee_inquiry"}])
+    assert db.get_distinct_intents() == ["fee_inquiry"]
+
+    db.client.table.return_value = make_query([{"id": "int-1"}])
+    db.insert_interaction({"intent_name": "card_lost"})
+    db.client.rpc.return_value = make_query([{"intent_name": "card_lost"}, {"intent_name": "fee_inquiry"}])
+
+    assert db.get_distinct_intents() == ["card_lost", "fee_inquiry"]
+
+
+def test_insert_interaction_group_commits_queued_rows(db):
+    """Test interactions queued by other callers are written in the same request."""
+    from concurrent.futures import Future
+    query = make_query([{"id": "int-1"}, {"id": "int-2"}])
+    db.client.table.return_value = query
+    queued = Future()
+    db._pending_interactions.append(({"user_query": "first"}, queued))
+
+    interaction_id = db.insert_interaction({"user_query": "second"})
+
+    query.insert.assert_called_once_with([{"user_query": "first"}, {"user_query": "second"}])
+    assert interaction_id == "int-2"
+    assert queued.result() == "int-1"
+
+
+def test_insert_interaction_batches_are_capped(db):
+    """Test queued interactions beyond INSERT_BATCH_SIZE go in a later request."""
+    from concurrent.futures import Future
+    query = make_query()
+    query.execute.side_effect = [MagicMock(data=[{"id": "int-1"}]), MagicMock(data=[{"id": "int-2"}])]
+    db.client.table.return_value = query
+    queued = Future()
+    db._pending_interactions.append(({"user_query": "first"}, queued))
+
+    with patch("database.supabase_client.INSERT_BATCH_SIZE", 1):
+        interaction_id = db.insert_interaction({"user_query": "second"})
+
+    assert query.insert.call_count == 2
+    assert (queued.result(), interaction_id) == ("int-1", "int-2")
+
+
+def test_insert_interaction_batch_failure_retries_row_by_row(db):
+    """Test a failed group insert falls back to per-row inserts so each caller gets its own result."""
+    from concurrent.futures import Future
+    query = make_query()
+    query.execute.side_effect = [
+        Exception("invalid input value"),
+        Exception("invalid input value"),
+        MagicMock(data=[{"id": "int-2"}]),
+    ]
+    db.client.table.return_value = query
+    queued = Future()
+    db._pending_interactions.append(({"user_query": "bad"}, queued))
+
+    interaction_id = db.insert_interaction({"user_query": "good"})
+
+    assert query.insert.call_count == 3
+    assert query.insert.call_args_list[1][0][0] == {"user_query": "bad"}
+    assert (queued.result(), interaction_id) == (None, "int-2")
+
+
+def test_insert_interaction_short_batch_result_retries_row_by_row(db):
+    """Test a group insert returning fewer rows than sent is retried row by row."""
+    from concurrent.futures import Future
+    query = make_query()
+    query.execute.side_effect = [
+        MagicMock(data=[{"id": "int-x"}]),
+        MagicMock(data=[{"id": "int-1"}]),
+        MagicMock(data=[{"id": "int-2"}]),
+    ]
+    db.client.table.return_value = query
+    queued = Future()
+    db._pending_interactions.append(({"user_query": "first"}, queued))
+
+    interaction_id = db.insert_interaction({"user_query": "second"})
+
+    assert (queued.result(), interaction_id) == ("int-1", "int-2")
@@ -0,0 +1,18 @@
+"""Unit tests for the synthetic document generator."""
+from knowledge import synthetic_generator
+
+
+def test_generate_banker_synthetic_documents_saves_all_documents_in_order(tmp_path):
+    """Test every synthetic document is saved, labelled and returned in generation order."""
+    docs = synthetic_generator.generate_banker_synthetic_documents(str(tmp_path))
+
+    assert [doc["topic"] for doc in docs] == [
+        "fee_structure", "eligibility", "process", "compliance_phrasing", "policy", "product_comparison",
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        f"{synthetic_generator.sanitize_filename(doc['title'])}_synthetic.md" for doc in docs
+    )
+    for doc in docs:
+        text = open(doc["filepath"], encoding="utf-8").read()
+        assert text.startswith(f"Title: {doc['title']} - SYNTHETIC CONTENT\nLabel: SYNTHETIC\n")
+        assert doc["content"] in text
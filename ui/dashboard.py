@@ -5,6 +5,7 @@ Implements dashboard with metrics from PRD Section 5, displaying overall usage,
 resolution metrics, intent frequency, escalation analysis, confidence metrics, and performance metrics.
 Uses ANZ branding with professional blue color scheme.
 """
+import asyncio
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -174,12 +175,19 @@ def render_dashboard():
     </div>
     """, unsafe_allow_html=True)
 
+    # Dashboard filters (no filters - show all data)
+    filters = {}
+
+    # Fetch every dataset the sections below need in one concurrent batch
+    with st.spinner("Loading dashboard data..."):
+        prefetch_dashboard_data(filters)
+
     # Quick Stats Summary - Key Metrics at a Glance
     render_section_heading("Quick Stats Summary", "quick-stats")
 
     # Get key stats data
     try:
-        df = get_interactions_data({})
+        df = get_interactions_data(filters)
         if not df.empty:
             # Calculate key metrics
             total_interactions = len(df)
@@ -192,8 +200,7 @@ def render_dashboard():
             avg_confidence = df["confidence_score"].mean() if "confidence_score" in df.columns and df["confidence_score"].notna().any() else None
 
             # Citation data
-            db_client = get_db_client()
-            citation_data = db_client.get_citation_coverage_data({})
+            citation_data = get_citation_coverage_data(filters)
             citation_coverage = citation_data.get("citation_coverage_rate", 0) if citation_data else 0
 
             # Display in grid
@@ -296,9 +303,7 @@ def render_dashboard():
         </div>
         """, unsafe_allow_html=True)
 
-    # Display metric sections organized by story (no filters - show all data)
-    filters = {}
-
+    # Display metric sections organized by story
     # System Performance & Usage
     render_section_heading("System Performance & Usage", "system-performance")
     display_overall_metrics(filters)
@@ -332,6 +337,7 @@ def render_dashboard():
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
         if st.button("Refresh Data", type="primary", width='stretch', help="Refresh all dashboard data and charts"):
+            get_db_client().refresh_dashboard_views()
             st.rerun()
 
 
@@ -499,11 +505,31 @@ def apply_anz_styling():
 
 
 
+def prefetch_dashboard_data(filters: Dict[str, Any]):
+    """Fetch all dashboard datasets concurrently and keep them for this render."""
+    try:
+        db_client = get_db_client()
+        data = asyncio.run(db_client.fetch_dashboard_data(filters))
+        st.session_state.dashboard_data = {"filters": dict(filters), **data}
+    except Exception as e:
+        logger.error("error_prefetching_dashboard_data", error=str(e), exc_info=True)
+        st.session_state.pop("dashboard_data", None)
+
+
+def get_prefetched_data(key: str, filters: Dict[str, Any]) -> Optional[Any]:
+    """Return a prefetched dataset if it was fetched with the same filters."""
+    data = st.session_state.get("dashboard_data")
+    if data and data["filters"] == filters:
+        return data[key]
+    return None
+
+
 def get_interactions_data(filters: Dict[str, Any]) -> pd.DataFrame:
     """Get interactions data from Supabase with filters."""
     try:
-        db_client = get_db_client()
-        interactions = db_client.get_interactions(filters)
+        interactions = get_prefetched_data("interactions", filters)
+        if interactions is None:
+            interactions = get_db_client().get_interactions(filters)
         
         if not interactions:
             return pd.DataFrame()
@@ -527,8 +553,9 @@ def get_interactions_data(filters: Dict[str, Any]) -> pd.DataFrame:
 def get_escalations_data(filters: Dict[str, Any]) -> pd.DataFrame:
     """Get escalations data from Supabase with filters."""
     try:
-        db_client = get_db_client()
-        escalations = db_client.get_escalations(filters)
+        escalations = get_prefetched_data("escalations", filters)
+        if escalations is None:
+            escalations = get_db_client().get_escalations(filters)
         
         if not escalations:
             return pd.DataFrame()
@@ -547,6 +574,14 @@ def get_escalations_data(filters: Dict[str, Any]) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def get_citation_coverage_data(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Get citation coverage data, preferring the prefetched result."""
+    citation_data = get_prefetched_data("citation_coverage", filters)
+    if citation_data is None:
+        citation_data = get_db_client().get_citation_coverage_data(filters)
+    return citation_data
+
+
 def display_time_based_trends(filters: Dict[str, Any]):
     """Display time-based trends (usage, escalations, containment) as required by PRD."""
     render_section_heading("Time-Based Trends", "time-trends")
@@ -1022,7 +1057,7 @@ def display_confidence_metrics(filters: Dict[str, Any]):
         # Confidence by intent
         if "intent_name" in confidence_df.columns:
             st.subheader("Average Confidence by Intent")
-            intent_confidence = confidence_df.groupby("intent_name")["confidence_score"].mean().sort_values(ascending=False).head(10)
+            intent_confidence = confidence_df.groupby("intent_name")["confidence_score"].mean().nlargest(10)
             
             if not intent_confidence.empty:
                 fig = px.bar(
@@ -1107,7 +1142,7 @@ def display_performance_metrics(filters: Dict[str, Any]):
                     "outcome": lambda x: (x == "resolved").sum() / len(x) * 100 if len(x) > 0 else 0
                 }).rename(columns={"outcome": "resolution_rate"})
 
-                lowest_resolution = intent_resolution.sort_values("resolution_rate").head(10)
+                lowest_resolution = intent_resolution.nsmallest(10, "resolution_rate")
 
                 if not lowest_resolution.empty:
                     fig = px.bar(
@@ -1301,8 +1336,9 @@ def display_intent_risk_value_matrix(filters: Dict[str, Any]):
 
     try:
         with st.spinner("Loading risk-value matrix..."):
-            db_client = get_db_client()
-            matrix_data = db_client.get_intent_risk_value_matrix(filters)
+            matrix_data = get_prefetched_data("intent_risk_value_matrix", filters)
+            if matrix_data is None:
+                matrix_data = get_db_client().get_intent_risk_value_matrix(filters)
 
         if not matrix_data:
             st.info("**No intent risk-value data found**\n\nThis analysis requires both intent classification data and risk/value assessments. Data will appear once more conversations are processed.")
@@ -1467,8 +1503,7 @@ def display_citation_coverage(filters: Dict[str, Any]):
 
     try:
         with st.spinner("Loading citation data..."):
-            db_client = get_db_client()
-            citation_data = db_client.get_citation_coverage_data(filters)
+            citation_data = get_citation_coverage_data(filters)
 
         if not citation_data:
             st.info("📚 **No citation data found**\n\nCitation metrics will be available once the AI assistant starts providing sources and references in its responses.")
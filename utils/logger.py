@@ -1,9 +1,24 @@
 # utils/logger.py
 import structlog
+import json
 import logging
 import sys
 from config import Config
 
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+def _orjson_dumps(obj, default=None, **kwargs) -> str:
+    """Serialize a log event with orjson, falling back to json for values it rejects."""
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(obj, default=default, **kwargs)
+
+
 def setup_logging():
     """Configure structured logging with log levels."""
     # Configure structlog
@@ -17,7 +32,7 @@ def setup_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps if orjson else json.dumps)
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -36,3 +51,14 @@ def setup_logging():
 def get_logger(name: str = __name__):
     """Get a structured logger instance."""
     return structlog.get_logger(name)
+
+
+def is_debug_enabled(logger) -> bool:
+    """
+    Whether debug records from logger would be emitted.
+    
+    Lets per-document code skip building debug event dicts when debug is off.
+    Works before and after setup_logging (stdlib and default structlog loggers).
+    """
+    check = getattr(logger, "isEnabledFor", None) or getattr(logger, "is_enabled_for", None)
+    return check(logging.DEBUG) if check else True
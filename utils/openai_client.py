@@ -1,8 +1,10 @@
 from openai import OpenAI
 from typing import Optional, Dict, Any, List
 from config import Config
+import io
 import logging
 import json
+import threading
 import time
 
 logger = logging.getLogger(__name__)
@@ -111,6 +113,87 @@ class OpenAIClient:
         
         return None
     
+    def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        max_retries: int = 3
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make a streamed chat completion request with retry logic.
+        
+        Tokens are accumulated as they arrive instead of waiting for the full
+        response, so the first token is observed within a few hundred ms and
+        long generations never leave the connection idle. Usage is taken from
+        the final chunk (stream_options include_usage). finish_reason is
+        "length" when the output was cut off by max_tokens.
+        
+        Args:
+            messages: List of message dictionaries
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            max_retries: Maximum number of retry attempts
+        
+        Returns:
+            Response dictionary with content, usage, first_token_ms and
+            finish_reason, or None on failure
+        """
+        for attempt in range(max_retries):
+            try:
+                kwargs = {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "stream": True,
+                    "stream_options": {"include_usage": True},
+                }
+                
+                if max_tokens:
+                    kwargs["max_tokens"] = max_tokens
+                
+                start_time = time.monotonic()
+                first_token_ms = None
+                buffer = io.StringIO()
+                usage = None
+                finish_reason = None
+                
+                for chunk in self.client.chat.completions.create(**kwargs):
+                    if chunk.usage:
+                        usage = chunk.usage
+                    # The usage chunk has no choices
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+                    delta = choice.delta.content
+                    if delta:
+                        if first_token_ms is None:
+                            first_token_ms = (time.monotonic() - start_time) * 1000
+                        buffer.write(delta)
+                
+                return {
+                    "content": buffer.getvalue(),
+                    "usage": {
+                        "prompt_tokens": usage.prompt_tokens if usage else 0,
+                        "completion_tokens": usage.completion_tokens if usage else 0,
+                        "total_tokens": usage.total_tokens if usage else 0,
+                    },
+                    "first_token_ms": first_token_ms,
+                    "finish_reason": finish_reason
+                }
+            except Exception as e:
+                wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
+                logger.warning(f"OpenAI streaming call failed (attempt {attempt + 1}/{max_retries}): {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(wait_time)
+                else:
+                    logger.error(f"OpenAI streaming call failed after {max_retries} attempts")
+                    return None
+        
+        return None
+    
     def parse_json_response(self, content: str) -> Optional[Dict[str, Any]]:
         """
         Parse JSON response from OpenAI.
@@ -135,15 +218,18 @@ class OpenAIClient:
             return json.loads(content)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Response content: {content}")
+            logger.debug("Response content: %s", content)
             return None
 
 # Singleton instance
 _openai_client: Optional[OpenAIClient] = None
+_openai_client_lock = threading.Lock()
 
 def get_openai_client() -> OpenAIClient:
-    """Get singleton OpenAI client instance."""
+    """Get singleton OpenAI client instance (thread-safe)."""
     global _openai_client
     if _openai_client is None:
-        _openai_client = OpenAIClient()
+        with _openai_client_lock:
+            if _openai_client is None:
+                _openai_client = OpenAIClient()
     return _openai_client